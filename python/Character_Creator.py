@@ -1,11 +1,14 @@
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterator
 import math
 import random
 import csv
+import io
 import os
 import json
 import datetime
+from collections import Counter
 from dataclasses import dataclass
+from functools import cached_property
 from game_data import races, DEFAULT_TIER_THRESHOLDS
 from tier_utils import (
     get_tier_for_level, get_next_tier_threshold, get_tier_range,
@@ -16,13 +19,19 @@ from tier_utils import (
 # Constants
 STATS = ["vitality", "endurance", "strength", "dexterity", "toughness", 
          "intelligence", "willpower", "wisdom", "perception"]
+STATS_CAPITALIZED = tuple(stat.capitalize() for stat in STATS)  # Display names, parallel to STATS
+STAT_LABELS = dict(zip(STATS, STATS_CAPITALIZED))  # Stat key -> display name
+STATS_SET = frozenset(STATS)  # Membership checks; STATS keeps the display/iteration order
 META_INFO = ["Class", "Class level", "Race", "Profession", "Profession level", "Character Type"]  # NEW: Added Character Type
+META_INFO_SET = frozenset(META_INFO)
 DERIVED_META = ["Race level", "Race rank"]  # Meta attributes that are derived/calculated automatically
 TIER_HISTORY_META = ["tier_threshold", "class_history", "profession_history"]  # Tier change tracking
 
 # NEW: Character types
 CHARACTER_TYPES = ["character", "familiar", "monster"]
-RACE_LEVELING_TYPES = ["familiar", "monster"]  # Types that level through race instead of class/profession
+RACE_LEVELING_TYPES = frozenset({"familiar", "monster"})  # Types that level through race instead of class/profession
+CLASS_OR_PROFESSION = frozenset({"class", "profession"})  # Lowercased level types with tiers and history
+LEVELING_TYPES = CLASS_OR_PROFESSION | {"race"}  # Every lowercased level type level_up accepts
 
 # Configuration (could be moved to a JSON config file)
 STAT_MODIFIER_FORMULA = {
@@ -58,7 +67,7 @@ class CharacterDataManager:
         self._base_stats = {stat: 5 for stat in STATS}
         if stats:
             for stat, value in stats.items():
-                if stat in STATS:
+                if stat in STATS_SET:
                     self._base_stats[stat] = value
         
         # Keep track of where stats came from for proper recalculation
@@ -68,17 +77,21 @@ class CharacterDataManager:
         
         # Initialize meta data with defaults
         self._meta = {info: "" for info in META_INFO}
+        # Parsed integer meta values; entries are dropped whenever set_meta writes the key
+        self._meta_ints: Dict[str, int] = {}
+        # Bumped on every set_meta so callers can cache values derived from meta
+        self.meta_version = 0
         if meta:
             for key, value in meta.items():
-                if key in META_INFO:
+                if key in META_INFO_SET:
                     self._meta[key] = value
         
         # NEW: Set default character type if not specified
         if not self._meta.get("Character Type"):
             self._meta["Character Type"] = "character"
         
-        # Initialize tier change tracking with character-specific thresholds
-        self.tier_thresholds = tier_thresholds or DEFAULT_TIER_THRESHOLDS.copy()
+        # Initialize tier change tracking with character-specific thresholds (kept sorted, like set_tier_thresholds)
+        self.tier_thresholds = sorted(tier_thresholds or DEFAULT_TIER_THRESHOLDS)
         self.class_history = class_history or []
         self.profession_history = profession_history or []
         self.race_history = race_history or []
@@ -157,19 +170,19 @@ class CharacterDataManager:
     
     def get_stat(self, stat: str) -> int:
         """Get a stat value"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             raise ValueError(f"Invalid stat: {stat}")
         return self._current_stats[stat]
     
     def get_stat_modifier(self, stat: str) -> float:
         """Get a stat modifier"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             raise ValueError(f"Invalid stat: {stat}")
         return self._modifiers[stat]
     
     def set_base_stat(self, stat: str, value: int) -> None:
         """Set a base stat value"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             raise ValueError(f"Invalid stat: {stat}")
         
         # Update base value
@@ -182,7 +195,7 @@ class CharacterDataManager:
     
     def add_stat(self, stat: str, value: int, source: str) -> None:
         """Add to a stat from a specific source"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             raise ValueError(f"Invalid stat: {stat}")
         
         if source not in self._stat_sources[stat]:
@@ -198,13 +211,22 @@ class CharacterDataManager:
         """Get a meta attribute"""
         return self._meta.get(key, default)
     
+    def get_meta_int(self, key: str, default: int = 0) -> int:
+        """Get a meta attribute parsed as an int (e.g. levels), reusing the parse until the key is set again"""
+        value = self._meta_ints.get(key)
+        if value is None:
+            if key not in self._meta:
+                return default
+            value = self._meta_ints[key] = int(self._meta[key])
+        return value
+    
     def set_meta(self, key: str, value: Any, force: bool = False) -> bool:
         """
         Set a meta attribute with validation
         Returns True if value was changed
         """
         # Validate key
-        if key not in META_INFO and key not in DERIVED_META:
+        if key not in META_INFO_SET and key not in DERIVED_META:
             raise ValueError(f"Invalid meta attribute: {key}")
         
         # Prevent direct modification of derived attributes unless forced
@@ -220,6 +242,8 @@ class CharacterDataManager:
         
         # Set new value
         self._meta[key] = value
+        self._meta_ints.pop(key, None)
+        self.meta_version += 1
         
         # Handle cascading updates if value changed
         changed = old_value != value
@@ -237,15 +261,23 @@ class CharacterDataManager:
         """Get all meta attributes"""
         return self._meta.copy()
     
+    def iter_meta(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate (key, value) meta pairs without copying; don't set meta while iterating"""
+        return iter(self._meta.items())
+    
     def get_stat_sources(self, stat: str) -> Dict[str, int]:
         """Get the breakdown of where a stat's points came from"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             raise ValueError(f"Invalid stat: {stat}")
         return self._stat_sources[stat].copy()
     
+    def get_source_points(self, source: str) -> Dict[str, int]:
+        """Get each stat's points from one source, 0 where the source never contributed"""
+        return {stat: sources.get(source, 0) for stat, sources in self._stat_sources.items()}
+    
     def reset_stat_source(self, stat: str, source: str) -> None:
         """Reset a specific stat source to 0"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             raise ValueError(f"Invalid stat: {stat}")
         
         if source in self._stat_sources[stat]:
@@ -258,13 +290,13 @@ class CharacterDataManager:
     def apply_item_stats(self, item_stats: Dict[str, int]) -> None:
         """Apply item bonuses to stats"""
         for stat, value in item_stats.items():
-            if stat in STATS:
+            if stat in STATS_SET:
                 self.add_stat(stat, value, StatSource.ITEM)
     
     def remove_item_stats(self, item_stats: Dict[str, int]) -> None:
         """Remove item bonuses from stats"""
         for stat, value in item_stats.items():
-            if stat in STATS:
+            if stat in STATS_SET:
                 self.add_stat(stat, -value, StatSource.ITEM)
     
     def get_class_at_level(self, level: int) -> Optional[str]:
@@ -291,6 +323,20 @@ class CharacterDataManager:
                     return entry["race"]
         return None
     
+    def get_races_by_race_level(self, max_race_level: int) -> List[Optional[str]]:
+        """
+        Races active at each race level 0..max_race_level (index = level), from one pass over race_history.
+        Matches get_race_at_race_level: the first history entry covering a level wins.
+        """
+        races_by_level: List[Optional[str]] = [None] * (max_race_level + 1)
+        for entry in self.race_history:
+            start = max(entry["from_race_level"], 0)
+            end = max_race_level if entry["to_race_level"] is None else min(entry["to_race_level"], max_race_level)
+            for level in range(start, end + 1):
+                if races_by_level[level] is None:
+                    races_by_level[level] = entry["race"]
+        return races_by_level
+    
     def add_class_change(self, new_class: str, at_level: int):
         """Record a class change at a specific level"""
         # Close the current class entry
@@ -380,7 +426,7 @@ class CharacterDataManager:
                         for stat, gain in range_data.get("stats", {}).items():
                             if stat == "free_points":
                                 result["free_points"] += gain
-                            elif stat in STATS:
+                            elif stat in STATS_SET:
                                 result["stats"][stat] += gain
                         break
         
@@ -490,8 +536,8 @@ class CharacterDataManager:
             return False, "All thresholds must be positive"
         
         # Check if any new thresholds conflict with character's current progression
-        class_level = int(self.get_meta("Class level", "0"))
-        profession_level = int(self.get_meta("Profession level", "0"))
+        class_level = self.get_meta_int("Class level")
+        profession_level = self.get_meta_int("Profession level")
         max_level = max(class_level, profession_level)
         
         sorted_thresholds = sorted(thresholds)
@@ -535,8 +581,8 @@ class CharacterDataManager:
             return False, f"Threshold {threshold} not found"
         
         # Check if character has already passed this threshold
-        class_level = int(self.get_meta("Class level", "0"))
-        profession_level = int(self.get_meta("Profession level", "0"))
+        class_level = self.get_meta_int("Class level")
+        profession_level = self.get_meta_int("Profession level")
         max_level = max(class_level, profession_level)
         
         if max_level >= threshold:
@@ -550,8 +596,8 @@ class CharacterDataManager:
         Validate tier thresholds against character's current progression.
         Returns detailed analysis of potential issues.
         """
-        class_level = int(self.get_meta("Class level", "0"))
-        profession_level = int(self.get_meta("Profession level", "0"))
+        class_level = self.get_meta_int("Class level")
+        profession_level = self.get_meta_int("Profession level")
         
         result = {
             "valid": True,
@@ -600,13 +646,13 @@ class CharacterDataManager:
     def apply_blessing(self, blessing_stats: Dict[str, int]) -> None:
         """Apply blessing bonuses to stats"""
         for stat, value in blessing_stats.items():
-            if stat in STATS:
+            if stat in STATS_SET:
                 self.add_stat(stat, value, StatSource.BLESSING)
     
     def remove_blessing(self, blessing_stats: Dict[str, int]) -> None:
         """Remove blessing bonuses from stats"""
         for stat, value in blessing_stats.items():
-            if stat in STATS:
+            if stat in STATS_SET:
                 self.add_stat(stat, -value, StatSource.BLESSING)
 
 class HealthManager:
@@ -662,9 +708,14 @@ class Item:
         """Check if item can be equipped"""
         return bool(self.stats)
     
+    @cached_property
+    def display_name(self) -> str:
+        """Title-cased name for listings (built once per item)"""
+        return self.name.title()
+    
     def __str__(self) -> str:
         equipped_str = " [Equipped]" if self.equipped else ""
-        return f"{self.name.title()}{equipped_str}: {self.description}"
+        return f"{self.display_name}{equipped_str}: {self.description}"
 
 class Inventory:
     """Manages character inventory and equipment"""
@@ -672,6 +723,7 @@ class Inventory:
     def __init__(self, item_repository):
         self.items: List[Item] = []
         self.item_repository = item_repository
+        self._by_name: Dict[str, Item] = {}  # Lowercased name -> first item with that name; kept by add/remove
     
     def add_item(self, item_name: str) -> bool:
         """Add an item to inventory"""
@@ -686,6 +738,7 @@ class Inventory:
                 stats=item_data["stats"].copy()
             )
             self.items.append(item)
+            self._by_name.setdefault(item_name.lower(), item)
             return True
         except Exception as e:
             print(f"Error adding item: {e}")
@@ -698,15 +751,19 @@ class Inventory:
             if item.equipped:
                 return False  # Can't remove equipped items
             self.items.remove(item)
+            # Point the name at the next copy of the item, if any
+            key = item.name.lower()
+            duplicate = next((other for other in self.items if other.name.lower() == key), None)
+            if duplicate:
+                self._by_name[key] = duplicate
+            else:
+                del self._by_name[key]
             return True
         return False
     
     def get_item(self, name: str) -> Optional[Item]:
-        """Get an item by name"""
-        for item in self.items:
-            if item.name.lower() == name.lower():
-                return item
-        return None
+        """Get an item by name (case-insensitive)"""
+        return self._by_name.get(name.lower())
     
     def equip_item(self, item_name: str) -> Tuple[bool, Optional[Item]]:
         """Equip an item"""
@@ -728,6 +785,10 @@ class Inventory:
         """Get all equipped items"""
         return [item for item in self.items if item.equipped]
     
+    def get_unequipped_items(self) -> List[Item]:
+        """Get all items that aren't equipped"""
+        return [item for item in self.items if not item.equipped]
+    
     def __str__(self) -> str:
         if not self.items:
             return "Empty"
@@ -829,7 +890,7 @@ class LevelSystem:
         if level_type.lower() == "race":
             return self.race_level_up(target_level)
         
-        if level_type.lower() not in ["class", "profession"]:
+        if level_type.lower() not in CLASS_OR_PROFESSION:
             raise ValueError("Invalid level type. Must be 'Class', 'Profession', or 'Race'.")
             
         # NEW: Prevent class/profession leveling for familiars and monsters
@@ -839,7 +900,7 @@ class LevelSystem:
             return False
             
         try:
-            current_level = int(self.data_manager.get_meta(f"{level_type} level", "0"))
+            current_level = self.data_manager.get_meta_int(f"{level_type} level")
         except ValueError:
             print(f"Warning: Invalid {level_type} level value.")
             return False
@@ -872,7 +933,7 @@ class LevelSystem:
         NEW: Level up race level directly for familiars and monsters
         """
         try:
-            current_race_level = int(self.data_manager.get_meta("Race level", "0"))
+            current_race_level = self.data_manager.get_meta_int("Race level")
         except ValueError:
             print("Warning: Invalid race level value.")
             return False
@@ -917,7 +978,7 @@ class LevelSystem:
         for stat, gain in gains.items():
             if stat == "free_points":
                 self.free_points += gain
-            elif stat in STATS:
+            elif stat in STATS_SET:
                 self.data_manager.add_stat(stat, gain, StatSource.CLASS)
     
     def _apply_profession_level_up(self, level: int) -> None:
@@ -943,7 +1004,7 @@ class LevelSystem:
         for stat, gain in gains.items():
             if stat == "free_points":
                 self.free_points += gain
-            elif stat in STATS:
+            elif stat in STATS_SET:
                 self.data_manager.add_stat(stat, gain, StatSource.PROFESSION)
     
     def _update_race_level(self, skip_free_points: bool = False, apply_bonuses: bool = True) -> None:
@@ -956,13 +1017,13 @@ class LevelSystem:
             return
         
         try:
-            class_level = int(self.data_manager.get_meta("Class level", "0"))
-            profession_level = int(self.data_manager.get_meta("Profession level", "0"))
+            class_level = self.data_manager.get_meta_int("Class level")
+            profession_level = self.data_manager.get_meta_int("Profession level")
             total_level = class_level + profession_level
             new_race_level = total_level // 2
             
             # Get current race level for comparison
-            current_race_level = int(self.data_manager.get_meta("Race level", "0"))
+            current_race_level = self.data_manager.get_meta_int("Race level")
             
             # Update race level
             self.data_manager.set_meta("Race level", str(new_race_level), force=True)
@@ -1022,7 +1083,7 @@ class LevelSystem:
             if stat == "free_points":
                 if not skip_free_points:
                     self.free_points += gain
-            elif stat in STATS:
+            elif stat in STATS_SET:
                 self.data_manager.add_stat(stat, gain, StatSource.RACE)
                 
     
@@ -1130,7 +1191,7 @@ class LevelSystem:
         
         # Determine the race level for the change
         if at_race_level is None:
-            current_race_level = int(self.data_manager.get_meta("Race level", "0"))
+            current_race_level = self.data_manager.get_meta_int("Race level")
             at_race_level = current_race_level + 1
         
         # Validate that the new race exists
@@ -1146,7 +1207,7 @@ class LevelSystem:
         self.data_manager.add_race_change(new_race, at_race_level)
         
         # Recalculate and apply race bonuses using the new history
-        current_race_level = int(self.data_manager.get_meta("Race level", "0"))
+        current_race_level = self.data_manager.get_meta_int("Race level")
         if current_race_level > 0:
             self._apply_race_level_up(0, current_race_level)
         
@@ -1179,14 +1240,14 @@ class LevelSystem:
             self._update_race_level(skip_free_points=skip_free_points)
         else:
             # For familiars/monsters, keep current race level but reapply bonuses
-            current_race_level = int(self.data_manager.get_meta("Race level", "0"))
+            current_race_level = self.data_manager.get_meta_int("Race level")
             if current_race_level > 0:
                 self._apply_race_level_up(0, current_race_level, skip_free_points)
                 self._update_race_rank(current_race_level)
     
     def allocate_free_points(self, stat: str, amount: int) -> bool:
         """Allocate free points to a specific stat"""
-        if stat not in STATS:
+        if stat not in STATS_SET:
             print(f"Invalid stat: {stat}")
             return False
             
@@ -1215,7 +1276,7 @@ class LevelSystem:
         Returns:
             True if successful, False otherwise
         """
-        if stat not in STATS:
+        if stat not in STATS_SET:
             print(f"Invalid stat: {stat}")
             return False
             
@@ -1237,48 +1298,108 @@ class LevelSystem:
         
         return True
     
-    def allocate_random(self) -> None:
-        """Randomly allocate all free points"""
-        while self.free_points > 0:
-            stat = random.choice(STATS)
-            self.allocate_free_points(stat, 1)
+    def allocate_random(self) -> Dict[str, int]:
+        """Randomly allocate all free points; returns the points each stat received"""
+        # One draw per point in a single call, then one allocation per stat
+        gains = Counter(random.choices(STATS, k=max(self.free_points, 0)))
+        for stat in STATS:
+            if gains[stat]:
+                self.allocate_free_points(stat, gains[stat])
+        return dict(gains)
 
 class CharacterSerializer:
     """Handles saving and loading characters with factory method support."""
     
+    # Stat source columns saved per stat, in file order
+    _SOURCE_COLUMNS = (StatSource.BASE, StatSource.CLASS, StatSource.PROFESSION,
+                       StatSource.RACE, StatSource.ITEM, StatSource.BLESSING,
+                       StatSource.FREE_POINTS)
+    
+    @staticmethod
+    def _csv_fieldnames() -> List[str]:
+        """Column names of the character CSV, in file order."""
+        # Define fields for the CSV
+        fieldnames = ["Name"]
+        
+        # Add meta fields
+        fieldnames += META_INFO + DERIVED_META
+        
+        # Add tier history fields
+        fieldnames += ["tier_thresholds", "class_history", "profession_history", "race_history"]
+        
+        # Add manual character tracking
+        fieldnames += ["is_manual_character", "manual_base_stats", "manual_current_stats"]
+        
+        # Add validation and conversion tracking
+        fieldnames += ["validation_status", "creation_history"]
+        
+        # Add stat fields
+        fieldnames += STATS
+        
+        # Add modifier fields
+        fieldnames += [f"{stat}_modifier" for stat in STATS]
+        
+        # Add stat source fields
+        for source in CharacterSerializer._SOURCE_COLUMNS:
+            fieldnames += [f"{stat}_{source}" for stat in STATS]
+        
+        # Add free points
+        fieldnames += ["free_points"]
+        return fieldnames
+    
+    @staticmethod
+    def _character_row(character) -> Dict[str, Any]:
+        """Build the CSV row dictionary for a character."""
+        # Get data for current character
+        stats = character.data_manager.get_all_stats()
+        meta = character.data_manager.get_all_meta()
+        modifiers = character.data_manager.get_all_modifiers()
+        
+        # Create row dictionary
+        row = {"Name": character.name}
+        
+        # Add meta data
+        for key, value in meta.items():
+            row[key] = value
+        
+        # Add tier history data
+        row["tier_thresholds"] = json.dumps(character.data_manager.tier_thresholds)
+        row["class_history"] = json.dumps(character.data_manager.class_history)
+        row["profession_history"] = json.dumps(character.data_manager.profession_history)
+        row["race_history"] = json.dumps(character.data_manager.race_history)
+        
+        # Add manual character data
+        row["is_manual_character"] = character.is_manual_character
+        row["manual_base_stats"] = json.dumps(character.manual_base_stats or {})
+        row["manual_current_stats"] = json.dumps(character.manual_current_stats or {})
+        
+        # Add validation and creation data
+        row["validation_status"] = character.validation_status
+        row["creation_history"] = json.dumps(character.creation_history or {})
+        
+        # Add current stats
+        for stat, value in stats.items():
+            row[stat] = value
+        
+        # Add modifiers
+        for stat, value in modifiers.items():
+            row[f"{stat}_modifier"] = value
+        
+        # Add stat sources
+        for stat in STATS:
+            sources = character.data_manager.get_stat_sources(stat)
+            for source in CharacterSerializer._SOURCE_COLUMNS:
+                row[f"{stat}_{source}"] = sources.get(source, 0)
+        
+        # Add free points
+        row["free_points"] = character.level_system.free_points
+        return row
+    
     @staticmethod
     def save_to_csv(character, filename: str, mode: str = "a") -> bool:
         """Save character with validation status and creation history."""
         try:
-            # Define fields for the CSV
-            fieldnames = ["Name"]
-            
-            # Add meta fields
-            fieldnames += META_INFO + DERIVED_META
-            
-            # Add tier history fields
-            fieldnames += ["tier_thresholds", "class_history", "profession_history", "race_history"]
-            
-            # Add manual character tracking
-            fieldnames += ["is_manual_character", "manual_base_stats", "manual_current_stats"]
-            
-            # Add validation and conversion tracking
-            fieldnames += ["validation_status", "creation_history"]
-            
-            # Add stat fields
-            fieldnames += STATS
-            
-            # Add modifier fields
-            fieldnames += [f"{stat}_modifier" for stat in STATS]
-            
-            # Add stat source fields
-            for source in [StatSource.BASE, StatSource.CLASS, StatSource.PROFESSION, 
-                           StatSource.RACE, StatSource.ITEM, StatSource.BLESSING, 
-                           StatSource.FREE_POINTS]:
-                fieldnames += [f"{stat}_{source}" for stat in STATS]
-            
-            # Add free points
-            fieldnames += ["free_points"]
+            fieldnames = CharacterSerializer._csv_fieldnames()
             
             # Check if file exists and handle existing data
             existing_data = []
@@ -1303,53 +1424,7 @@ class CharacterSerializer:
                     for row in existing_data:
                         writer.writerow(row)
                 
-                # Get data for current character
-                stats = character.data_manager.get_all_stats()
-                meta = character.data_manager.get_all_meta()
-                modifiers = character.data_manager.get_all_modifiers()
-                
-                # Create row dictionary
-                row = {"Name": character.name}
-                
-                # Add meta data
-                for key, value in meta.items():
-                    row[key] = value
-                
-                # Add tier history data
-                row["tier_thresholds"] = json.dumps(character.data_manager.tier_thresholds)
-                row["class_history"] = json.dumps(character.data_manager.class_history)
-                row["profession_history"] = json.dumps(character.data_manager.profession_history)
-                row["race_history"] = json.dumps(character.data_manager.race_history)
-                
-                # Add manual character data
-                row["is_manual_character"] = character.is_manual_character
-                row["manual_base_stats"] = json.dumps(character.manual_base_stats or {})
-                row["manual_current_stats"] = json.dumps(character.manual_current_stats or {})
-                
-                # Add validation and creation data
-                row["validation_status"] = character.validation_status
-                row["creation_history"] = json.dumps(character.creation_history or {})
-                
-                # Add current stats
-                for stat, value in stats.items():
-                    row[stat] = value
-                
-                # Add modifiers
-                for stat, value in modifiers.items():
-                    row[f"{stat}_modifier"] = value
-                
-                # Add stat sources
-                for stat in STATS:
-                    sources = character.data_manager.get_stat_sources(stat)
-                    for source in [StatSource.BASE, StatSource.CLASS, StatSource.PROFESSION, 
-                                    StatSource.RACE, StatSource.ITEM, StatSource.BLESSING, 
-                                    StatSource.FREE_POINTS]:
-                        row[f"{stat}_{source}"] = sources.get(source, 0)
-                
-                # Add free points
-                row["free_points"] = character.level_system.free_points
-                
-                writer.writerow(row)
+                writer.writerow(CharacterSerializer._character_row(character))
             
             print(f"Character '{character.name}' {'updated' if character_exists else 'saved'} to {filename}")
             return True
@@ -1357,6 +1432,66 @@ class CharacterSerializer:
             print(f"Error saving character: {e}")
             return False
     
+    @staticmethod
+    def save_many_to_csv(characters: List[Any], filename: str, mode: str = "a") -> List[bool]:
+        """
+        Save several characters with one read and one write of the file.
+        The result matches calling save_to_csv for each character in turn (the first with mode,
+        the rest with "a"): a later save of the same name replaces the earlier row.
+        Returns a success flag per character.
+        """
+        try:
+            fieldnames = CharacterSerializer._csv_fieldnames()
+            file_exists = os.path.exists(filename)
+            existing_data = []
+            if file_exists:
+                with open(filename, "r", newline="") as file:
+                    existing_data = list(csv.DictReader(file))
+        except Exception as e:
+            print(f"Error saving character: {e}")
+            return [False] * len(characters)
+        
+        existing_names = {row["Name"] for row in existing_data if "Name" in row}
+        new_rows = {}  # name -> row, ordered by each name's last save
+        saved = []  # (name, existed before this save) for the success messages
+        results = []
+        for character in characters:
+            try:
+                row = CharacterSerializer._character_row(character)
+            except Exception as e:
+                print(f"Error saving character: {e}")
+                results.append(False)
+                continue
+            character_exists = character.name in existing_names or character.name in new_rows
+            new_rows.pop(character.name, None)
+            new_rows[character.name] = row
+            saved.append((character.name, character_exists))
+            results.append(True)
+        
+        if not new_rows:
+            return results
+        
+        # Rewrite the file whenever any single save would have; otherwise append like save_to_csv
+        rewrite = (mode == "w" or not file_exists or any(exists for _, exists in saved))
+        try:
+            # Build the text in memory so the file gets a single write call
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+            if rewrite:
+                writer.writeheader()
+                writer.writerows(row for row in existing_data
+                                 if not ("Name" in row and row["Name"] in new_rows))
+            writer.writerows(new_rows.values())
+            with open(filename, "w" if rewrite else "a", newline="") as file:
+                file.write(buffer.getvalue())
+        except Exception as e:
+            print(f"Error saving character: {e}")
+            return [False] * len(characters)
+        
+        for name, character_exists in saved:
+            print(f"Character '{name}' {'updated' if character_exists else 'saved'} to {filename}")
+        return results
+    
     @staticmethod
     def load_from_csv(filename: str, character_name: str, item_repository=None):
         """Load character from CSV file using appropriate factory method."""
@@ -1370,180 +1505,207 @@ class CharacterSerializer:
                 
                 for row in reader:
                     if "Name" in row and row["Name"].lower() == character_name.lower():
-                        # Found the character
-                        
-                        # Extract meta info (including derived meta)
-                        meta = {}
-                        for key in META_INFO + DERIVED_META:
-                            if key in row:
-                                meta[key] = row[key]
-                        
-                        # Ensure Character Type is set
-                        if "Character Type" not in meta or not meta["Character Type"]:
-                            meta["Character Type"] = "character"  # Default for legacy characters
-                        
-                        # Extract tier history
-                        tier_thresholds = [25]  # Default
-                        if "tier_thresholds" in row and row["tier_thresholds"]:
-                            try:
-                                tier_thresholds = json.loads(row["tier_thresholds"])
-                            except json.JSONDecodeError:
-                                print("Warning: Invalid tier thresholds data, using default ([25]).")
-                        
-                        class_history = []
-                        if "class_history" in row and row["class_history"]:
-                            try:
-                                class_history = json.loads(row["class_history"])
-                            except json.JSONDecodeError:
-                                print("Warning: Invalid class history data.")
-                        
-                        profession_history = []
-                        if "profession_history" in row and row["profession_history"]:
-                            try:
-                                profession_history = json.loads(row["profession_history"])
-                            except json.JSONDecodeError:
-                                print("Warning: Invalid profession history data.")
-                                
-                        race_history = []
-                        if "race_history" in row and row["race_history"]:
-                            try:
-                                race_history = json.loads(row["race_history"])
-                            except json.JSONDecodeError:
-                                print("Warning: Invalid race history data.")
-                                
-                        creation_history = None
-                        if "creation_history" in row and row["creation_history"]:
-                            try:
-                                creation_history = json.loads(row["creation_history"])
-                            except json.JSONDecodeError:
-                                print("Warning: Invalid creation history data.")
-                                
-                        validation_status = row.get("validation_status", "unvalidated")
-                        
-                        # Check if this is a manual character
-                        is_manual = False
-                        manual_base_stats = None
-                        manual_current_stats = None
-                        
-                        if "is_manual_character" in row:
-                            is_manual = row["is_manual_character"].lower() in ["true", "1", "yes"]
-                        
-                        if is_manual:
-                            # Load manual character data
-                            if "manual_base_stats" in row and row["manual_base_stats"]:
-                                try:
-                                    manual_base_stats = json.loads(row["manual_base_stats"])
-                                except json.JSONDecodeError:
-                                    print("Warning: Invalid manual base stats data.")
-                            
-                            if "manual_current_stats" in row and row["manual_current_stats"]:
-                                try:
-                                    manual_current_stats = json.loads(row["manual_current_stats"])
-                                except json.JSONDecodeError:
-                                    print("Warning: Invalid manual current stats data.")
-                        
-                        # Extract free points
-                        free_points = 0
-                        if "free_points" in row:
-                            try:
-                                free_points = int(row["free_points"])
-                            except ValueError:
-                                print("Warning: Invalid free points value.")
-                        
-                        # Extract stat sources
-                        stat_sources = {}
-                        for stat in STATS:
-                            stat_sources[stat] = {}
-                            for source in [StatSource.BASE, StatSource.CLASS, StatSource.PROFESSION, 
-                                           StatSource.RACE, StatSource.ITEM, StatSource.BLESSING, 
-                                           StatSource.FREE_POINTS]:
-                                source_key = f"{stat}_{source}"
-                                if source_key in row:
-                                    try:
-                                        stat_sources[stat][source] = int(row[source_key])
-                                    except ValueError:
-                                        print(f"Warning: Invalid source value for {source_key}: {row[source_key]}")
-                                        stat_sources[stat][source] = 0
-                        
-                        # Extract base stats from stat_sources
-                        base_stats = {}
-                        for stat in STATS:
-                            if stat in stat_sources and StatSource.BASE in stat_sources[stat]:
-                                base_stats[stat] = stat_sources[stat][StatSource.BASE]
-                            else:
-                                base_stats[stat] = 5  # Default base value
-                        
-                        # Create character using appropriate factory method
-                        if is_manual and manual_base_stats and manual_current_stats:
-                            # Reverse-engineered manual character
-                            character = Character.create_reverse_engineered(
-                                name=row["Name"],
-                                base_stats=manual_base_stats,
-                                current_stats=manual_current_stats,
-                                meta=meta,
-                                free_points=free_points,
-                                tier_thresholds=tier_thresholds,
-                                class_history=class_history,
-                                profession_history=profession_history,
-                                race_history=race_history,
-                                item_repository=item_repository
-                            )
-                        elif is_manual:
-                            # Custom manual character
-                            # Use current stats as final stats
-                            current_stats = {}
-                            for stat in STATS:
-                                if stat in row:
-                                    try:
-                                        current_stats[stat] = int(row[stat])
-                                    except ValueError:
-                                        current_stats[stat] = 5
-                                else:
-                                    current_stats[stat] = 5
-                            
-                            character = Character.create_manual(
-                                name=row["Name"],
-                                stats=current_stats,
-                                meta=meta,
-                                free_points=free_points,
-                                tier_thresholds=tier_thresholds,
-                                class_history=class_history,
-                                profession_history=profession_history,
-                                item_repository=item_repository
-                            )
-                        else:
-                            # Regular calculated character - need to reconstruct with stat sources
-                            character = Character.create_calculated(
-                                name=row["Name"],
-                                stats=base_stats,
-                                meta=meta,
-                                tier_thresholds=tier_thresholds,
-                                class_history=class_history,
-                                profession_history=profession_history,
-                                race_history=race_history,
-                                item_repository=item_repository
-                            )
-                            
-                            # Apply loaded stat sources (excluding race which gets recalculated)
-                            character._apply_stat_sources_for_loading(stat_sources)
-                        
-                        # Set loaded validation status and creation history
-                        character.validation_status = validation_status
-                        character.creation_history = creation_history
-                        
-                        print(f"Character '{character_name}' loaded from {filename}")
-                        print(f"Character Type: {meta.get('Character Type', 'character')}")
-                        print(f"Validation status: {validation_status}")
-                        if creation_history:
-                            print(f"Originally created as: {creation_history.get('original_creation_method', 'unknown')}")
-                        
-                        return character
+                        return CharacterSerializer._character_from_row(row, filename, character_name, item_repository)
                 
                 print(f"Character '{character_name}' not found in {filename}")
                 return None
         except Exception as e:
             print(f"Error loading character: {e}")
             return None
+    
+    @staticmethod
+    def read_rows_by_name(filename: str) -> Dict[str, Dict[str, str]]:
+        """Read a character CSV in one pass, mapping each lowercased name to its first row."""
+        rows = {}
+        with open(filename, "r", newline="") as file:
+            for row in csv.DictReader(file):
+                name = row.get("Name")
+                if name is not None:
+                    rows.setdefault(name.lower(), row)
+        return rows
+    
+    @staticmethod
+    def load_from_rows(rows: Dict[str, Dict[str, str]], filename: str, character_name: str, item_repository=None):
+        """Load a character from rows read by read_rows_by_name (same messages as load_from_csv)."""
+        try:
+            row = rows.get(character_name.lower())
+            if row is None:
+                print(f"Character '{character_name}' not found in {filename}")
+                return None
+            return CharacterSerializer._character_from_row(row, filename, character_name, item_repository)
+        except Exception as e:
+            print(f"Error loading character: {e}")
+            return None
+    
+    @staticmethod
+    def _character_from_row(row: Dict[str, str], filename: str, character_name: str, item_repository=None):
+        """Build a character from one CSV row using the appropriate factory method."""
+        # Extract meta info (including derived meta)
+        meta = {}
+        for key in META_INFO + DERIVED_META:
+            if key in row:
+                meta[key] = row[key]
+        
+        # Ensure Character Type is set
+        if "Character Type" not in meta or not meta["Character Type"]:
+            meta["Character Type"] = "character"  # Default for legacy characters
+        
+        # Extract tier history
+        tier_thresholds = [25]  # Default
+        if "tier_thresholds" in row and row["tier_thresholds"]:
+            try:
+                tier_thresholds = json.loads(row["tier_thresholds"])
+            except json.JSONDecodeError:
+                print("Warning: Invalid tier thresholds data, using default ([25]).")
+        
+        class_history = []
+        if "class_history" in row and row["class_history"]:
+            try:
+                class_history = json.loads(row["class_history"])
+            except json.JSONDecodeError:
+                print("Warning: Invalid class history data.")
+        
+        profession_history = []
+        if "profession_history" in row and row["profession_history"]:
+            try:
+                profession_history = json.loads(row["profession_history"])
+            except json.JSONDecodeError:
+                print("Warning: Invalid profession history data.")
+                
+        race_history = []
+        if "race_history" in row and row["race_history"]:
+            try:
+                race_history = json.loads(row["race_history"])
+            except json.JSONDecodeError:
+                print("Warning: Invalid race history data.")
+                
+        creation_history = None
+        if "creation_history" in row and row["creation_history"]:
+            try:
+                creation_history = json.loads(row["creation_history"])
+            except json.JSONDecodeError:
+                print("Warning: Invalid creation history data.")
+                
+        validation_status = row.get("validation_status", "unvalidated")
+        
+        # Check if this is a manual character
+        is_manual = False
+        manual_base_stats = None
+        manual_current_stats = None
+        
+        if "is_manual_character" in row:
+            is_manual = row["is_manual_character"].lower() in ["true", "1", "yes"]
+        
+        if is_manual:
+            # Load manual character data
+            if "manual_base_stats" in row and row["manual_base_stats"]:
+                try:
+                    manual_base_stats = json.loads(row["manual_base_stats"])
+                except json.JSONDecodeError:
+                    print("Warning: Invalid manual base stats data.")
+            
+            if "manual_current_stats" in row and row["manual_current_stats"]:
+                try:
+                    manual_current_stats = json.loads(row["manual_current_stats"])
+                except json.JSONDecodeError:
+                    print("Warning: Invalid manual current stats data.")
+        
+        # Extract free points
+        free_points = 0
+        if "free_points" in row:
+            try:
+                free_points = int(row["free_points"])
+            except ValueError:
+                print("Warning: Invalid free points value.")
+        
+        # Extract stat sources
+        stat_sources = {}
+        for stat in STATS:
+            stat_sources[stat] = {}
+            for source in [StatSource.BASE, StatSource.CLASS, StatSource.PROFESSION, 
+                           StatSource.RACE, StatSource.ITEM, StatSource.BLESSING, 
+                           StatSource.FREE_POINTS]:
+                source_key = f"{stat}_{source}"
+                if source_key in row:
+                    try:
+                        stat_sources[stat][source] = int(row[source_key])
+                    except ValueError:
+                        print(f"Warning: Invalid source value for {source_key}: {row[source_key]}")
+                        stat_sources[stat][source] = 0
+        
+        # Extract base stats from stat_sources
+        base_stats = {}
+        for stat in STATS:
+            if stat in stat_sources and StatSource.BASE in stat_sources[stat]:
+                base_stats[stat] = stat_sources[stat][StatSource.BASE]
+            else:
+                base_stats[stat] = 5  # Default base value
+        
+        # Create character using appropriate factory method
+        if is_manual and manual_base_stats and manual_current_stats:
+            # Reverse-engineered manual character
+            character = Character.create_reverse_engineered(
+                name=row["Name"],
+                base_stats=manual_base_stats,
+                current_stats=manual_current_stats,
+                meta=meta,
+                free_points=free_points,
+                tier_thresholds=tier_thresholds,
+                class_history=class_history,
+                profession_history=profession_history,
+                race_history=race_history,
+                item_repository=item_repository
+            )
+        elif is_manual:
+            # Custom manual character
+            # Use current stats as final stats
+            current_stats = {}
+            for stat in STATS:
+                if stat in row:
+                    try:
+                        current_stats[stat] = int(row[stat])
+                    except ValueError:
+                        current_stats[stat] = 5
+                else:
+                    current_stats[stat] = 5
+            
+            character = Character.create_manual(
+                name=row["Name"],
+                stats=current_stats,
+                meta=meta,
+                free_points=free_points,
+                tier_thresholds=tier_thresholds,
+                class_history=class_history,
+                profession_history=profession_history,
+                item_repository=item_repository
+            )
+        else:
+            # Regular calculated character - need to reconstruct with stat sources
+            character = Character.create_calculated(
+                name=row["Name"],
+                stats=base_stats,
+                meta=meta,
+                tier_thresholds=tier_thresholds,
+                class_history=class_history,
+                profession_history=profession_history,
+                race_history=race_history,
+                item_repository=item_repository
+            )
+            
+            # Apply loaded stat sources (excluding race which gets recalculated)
+            character._apply_stat_sources_for_loading(stat_sources)
+        
+        # Set loaded validation status and creation history
+        character.validation_status = validation_status
+        character.creation_history = creation_history
+        
+        print(f"Character '{character_name}' loaded from {filename}")
+        print(f"Character Type: {meta.get('Character Type', 'character')}")
+        print(f"Validation status: {validation_status}")
+        if creation_history:
+            print(f"Originally created as: {creation_history.get('original_creation_method', 'unknown')}")
+        
+        return character
 
 class StatValidator:
     """
@@ -1661,7 +1823,7 @@ class StatValidator:
     
     def _calculate_expected_race_free_points(self) -> int:
         """Calculate expected free points from race bonuses only (for familiars/monsters) - CENTRALIZED"""
-        race_level = int(self.character.data_manager.get_meta("Race level", "0"))
+        race_level = self.character.data_manager.get_meta_int("Race level")
         
         # Use centralized race calculation
         total_race_free_points = self.character.data_manager.calculate_race_free_points_only(race_level)
@@ -1697,8 +1859,14 @@ class StatValidator:
         character_type = self.character.data_manager.get_meta("Character Type")
         
         # 1. Validate that they don't have class/profession levels
-        class_level = int(self.character.data_manager.get_meta("Class level", "0"))
-        profession_level = int(self.character.data_manager.get_meta("Profession level", "0"))
+        class_level = self.character.data_manager.get_meta_int("Class level")
+        profession_level = self.character.data_manager.get_meta_int("Profession level")
+        
+        # Offending levels by meta key, so displays can report them without re-reading meta
+        result["invalid_levels"] = {
+            key: level for key, level in (("Class level", class_level), ("Profession level", profession_level))
+            if level > 0
+        }
         
         if class_level > 0:
             result["valid"] = False
@@ -1709,13 +1877,13 @@ class StatValidator:
             result["stat_discrepancies"]["profession_level"] = f"{character_type.capitalize()}s should not have profession levels"
         
         # 2. Validate race level and race bonuses
-        race_level = int(self.character.data_manager.get_meta("Race level", "0"))
+        race_level = self.character.data_manager.get_meta_int("Race level")
         if race_level <= 0:
             result["stat_discrepancies"]["race_level"] = f"{character_type.capitalize()} must have a race level"
             result["valid"] = False
         
         # 3. ENHANCED: Calculate detailed expected stats from race bonuses (like regular characters) - CENTRALIZED
-        race_level = int(self.character.data_manager.get_meta("Race level", "0"))
+        race_level = self.character.data_manager.get_meta_int("Race level")
         race_bonuses = self.character.data_manager.calculate_race_bonuses_only(race_level)
         
         expected_race_stats = race_bonuses["stats"]
@@ -1877,10 +2045,10 @@ class StatValidator:
         
         # 1. Check race level calculation (only thing that should be calculated for regular characters)
         if not self.character.data_manager.is_race_leveling_type():
-            class_level = int(self.character.data_manager.get_meta("Class level", "0"))
-            profession_level = int(self.character.data_manager.get_meta("Profession level", "0"))
+            class_level = self.character.data_manager.get_meta_int("Class level")
+            profession_level = self.character.data_manager.get_meta_int("Profession level")
             expected_race_level = (class_level + profession_level) // 2
-            actual_race_level = int(self.character.data_manager.get_meta("Race level", "0"))
+            actual_race_level = self.character.data_manager.get_meta_int("Race level")
             
             if expected_race_level != actual_race_level:
                 errors.append(f"Race level calculation error: expected {expected_race_level}, actual {actual_race_level}")
@@ -2105,7 +2273,7 @@ class StatValidator:
         
         # For familiars/monsters, only calculate race bonuses - CENTRALIZED
         if self.character.data_manager.is_race_leveling_type():
-            race_level = int(self.character.data_manager.get_meta("Race level", "0"))
+            race_level = self.character.data_manager.get_meta_int("Race level")
             race_bonuses = self.character.data_manager.calculate_race_bonuses_only(race_level)
             
             # Apply race bonuses to result structure
@@ -2115,7 +2283,7 @@ class StatValidator:
             return bonuses
         
         # Calculate class bonuses (unchanged)
-        class_level = int(self.character.data_manager.get_meta("Class level", "0"))
+        class_level = self.character.data_manager.get_meta_int("Class level")
         if class_level > 0:
             for level in range(1, class_level + 1):
                 class_name = self.character.data_manager.get_class_at_level(level)
@@ -2125,11 +2293,11 @@ class StatValidator:
                     for stat, gain in gains.items():
                         if stat == "free_points":
                             bonuses["class_free_points"] += gain
-                        elif stat in STATS:
+                        elif stat in STATS_SET:
                             bonuses["class"][stat] += gain
         
         # Calculate profession bonuses (unchanged)
-        profession_level = int(self.character.data_manager.get_meta("Profession level", "0"))
+        profession_level = self.character.data_manager.get_meta_int("Profession level")
         if profession_level > 0:
             for level in range(1, profession_level + 1):
                 profession_name = self.character.data_manager.get_profession_at_level(level)
@@ -2139,11 +2307,11 @@ class StatValidator:
                     for stat, gain in gains.items():
                         if stat == "free_points":
                             bonuses["profession_free_points"] += gain
-                        elif stat in STATS:
+                        elif stat in STATS_SET:
                             bonuses["profession"][stat] += gain
         
         # Calculate race bonuses using race history - CENTRALIZED
-        race_level = int(self.character.data_manager.get_meta("Race level", "0"))
+        race_level = self.character.data_manager.get_meta_int("Race level")
         race_bonuses = self.character.data_manager.calculate_race_bonuses_only(race_level)
         
         # Apply race bonuses to result structure
@@ -2276,7 +2444,7 @@ class StatValidator:
         stats = {stat: 0 for stat in STATS}
         stats["free_points"] = 0
         
-        class_level = int(self.character.data_manager.get_meta("Class level", "0"))
+        class_level = self.character.data_manager.get_meta_int("Class level")
         if class_level <= 0:
             return stats
         
@@ -2304,7 +2472,7 @@ class StatValidator:
         stats = {stat: 0 for stat in STATS}
         stats["free_points"] = 0
         
-        profession_level = int(self.character.data_manager.get_meta("Profession level", "0"))
+        profession_level = self.character.data_manager.get_meta_int("Profession level")
         if profession_level <= 0:
             return stats
         
@@ -2334,7 +2502,7 @@ class StatValidator:
         
         for item in self.character.inventory.get_equipped_items():
             for stat, value in item.stats.items():
-                if stat in STATS:
+                if stat in STATS_SET:
                     stats[stat] += value
         
         return stats
@@ -2345,7 +2513,7 @@ class StatValidator:
         
         if hasattr(self.character, 'blessing') and self.character.blessing:
             for stat, value in self.character.blessing.items():
-                if stat in STATS:
+                if stat in STATS_SET:
                     stats[stat] += value
         
         return stats
@@ -2380,6 +2548,11 @@ class Character:
         # Initialize creation history for converted characters
         self.creation_history = None
         
+        # get_creation_info() result, the inputs it was built from, and the creation_history it read
+        self._creation_info_cache = None
+        self._creation_info_key = None
+        self._creation_info_history = None
+        
         # Initialize all systems (UPDATED: added race_history)
         self.data_manager = CharacterDataManager(
             stats, meta, tier_thresholds, class_history, profession_history, race_history
@@ -2591,6 +2764,16 @@ class Character:
         """Load character from CSV file."""
         return CharacterSerializer.load_from_csv(filename, character_name, item_repository)
     
+    @staticmethod
+    def read_file_rows(filename: str) -> Dict[str, Dict[str, str]]:
+        """Read a character CSV once into rows keyed by lowercased name, for repeated load_from_rows calls."""
+        return CharacterSerializer.read_rows_by_name(filename)
+    
+    @classmethod
+    def load_from_rows(cls, rows: Dict[str, Dict[str, str]], filename: str, character_name: str, item_repository=None):
+        """Load character from rows returned by read_file_rows (filename is only used in messages)."""
+        return CharacterSerializer.load_from_rows(rows, filename, character_name, item_repository)
+    
     def _setup_reverse_engineering(self, base_stats: Dict[str, int], 
                                  current_stats: Dict[str, int], provided_free_points: int):
         """Set up character using reverse engineering analysis."""
@@ -2642,20 +2825,20 @@ class Character:
         """
         if self.data_manager.is_race_leveling_type():
             # For familiars/monsters, only apply race level gains
-            race_level = int(self.data_manager.get_meta("Race level", "0"))
+            race_level = self.data_manager.get_meta_int("Race level")
             if race_level > 0:
                 self.level_system._apply_race_level_up(0, race_level)
                 self.level_system._update_race_rank(race_level)
         else:
             # For regular characters, apply class/profession/race gains
             # Apply class level gains
-            class_level = int(self.data_manager.get_meta("Class level", "0"))
+            class_level = self.data_manager.get_meta_int("Class level")
             if class_level > 0:
                 for level in range(1, class_level + 1):
                     self.level_system._apply_class_level_up(level)
             
             # Apply profession level gains
-            profession_level = int(self.data_manager.get_meta("Profession level", "0"))
+            profession_level = self.data_manager.get_meta_int("Profession level")
             if profession_level > 0:
                 for level in range(1, profession_level + 1):
                     self.level_system._apply_profession_level_up(level)
@@ -2705,7 +2888,7 @@ class Character:
     # All the existing methods remain the same
     def update_meta(self, key: str, value: Any) -> bool:
         """Update meta information with validation and cascading updates."""
-        if key not in META_INFO:
+        if key not in META_INFO_SET:
             print(f"Invalid meta info: {key}")
             return False
         
@@ -2721,12 +2904,12 @@ class Character:
             if changed:
                 if key == "Class":
                     self._update_finesse()
-                    class_level = int(self.data_manager.get_meta("Class level", "0"))
+                    class_level = self.data_manager.get_meta_int("Class level")
                     if class_level > 0:
                         self.level_system.change_class(value, 1)
                 
                 elif key == "Profession":
-                    profession_level = int(self.data_manager.get_meta("Profession level", "0"))
+                    profession_level = self.data_manager.get_meta_int("Profession level")
                     if profession_level > 0:
                         self.level_system.change_profession(value, 1)
                 
@@ -2834,10 +3017,11 @@ class Character:
             self.health_manager.update_max_health()
         return success
     
-    def allocate_random(self) -> None:
-        """Randomly allocate all free points."""
-        self.level_system.allocate_random()
+    def allocate_random(self) -> Dict[str, int]:
+        """Randomly allocate all free points; returns the points each stat received."""
+        gains = self.level_system.allocate_random()
         self.health_manager.update_max_health()
+        return gains
     
     def recalculate_race_levels(self) -> None:
         """Recalculate race levels from scratch."""
@@ -2848,6 +3032,11 @@ class Character:
         """Save character to file."""
         return CharacterSerializer.save_to_csv(self, filename, mode)
     
+    @staticmethod
+    def save_many(filename: str, characters: List["Character"], mode: str = "a") -> List[bool]:
+        """Save several characters to file in one pass; returns a success flag per character."""
+        return CharacterSerializer.save_many_to_csv(characters, filename, mode)
+    
     def validate_stats(self) -> Dict[str, Any]:
         """
         Validate character stats and automatically convert manual characters if valid.
@@ -2906,7 +3095,24 @@ class Character:
         return True
     
     def get_creation_info(self) -> Dict[str, Any]:
-        """Get information about how this character was created."""
+        """
+        Get information about how this character was created.
+        The dict is cached until meta, creation history, manual data or validation status change;
+        callers must not modify it.
+        """
+        key = (self.data_manager.meta_version, self.is_manual_character,
+               bool(self.manual_base_stats and self.manual_current_stats), self.validation_status)
+        if (self._creation_info_cache is not None and key == self._creation_info_key
+                and self.creation_history is self._creation_info_history):
+            return self._creation_info_cache
+        
+        self._creation_info_cache = self._build_creation_info()
+        self._creation_info_key = key
+        self._creation_info_history = self.creation_history
+        return self._creation_info_cache
+    
+    def _build_creation_info(self) -> Dict[str, Any]:
+        """Build the get_creation_info() dict from the character's current state."""
         character_type = self.data_manager.get_meta("Character Type", "character")
         
         if self.creation_history:
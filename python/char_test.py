@@ -3,61 +3,180 @@ Friendly Character Creator CLI
 A user-friendly command-line interface for the Character Creator system.
 UPDATED: Added support for familiars and monsters that level through race
 """
+import io
 import os
 import sys
 import time
-import random
 import csv
 import datetime
-from typing import Optional, Dict, Any, Tuple
+import threading
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager, redirect_stdout
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain, zip_longest
+from operator import itemgetter
+from typing import Optional, Dict, Any, Iterable, List, Sequence, Tuple
 from Character_Creator import (
-    Character, ItemRepository, STATS, META_INFO, StatValidator, CHARACTER_TYPES, RACE_LEVELING_TYPES
+    Character, ItemRepository, STATS, STATS_CAPITALIZED, STAT_LABELS, STATS_SET, META_INFO, META_INFO_SET, StatValidator,
+    CHARACTER_TYPES, RACE_LEVELING_TYPES, CLASS_OR_PROFESSION, LEVELING_TYPES, StatSource
 )
 from tier_utils import (
     get_available_classes_for_tier, get_available_professions_for_tier,
     validate_class_tier_combination, validate_profession_tier_combination,
     get_tier_for_level, get_tier_summary
 )
-from game_data import DEFAULT_TIER_THRESHOLDS, races
+from game_data import DEFAULT_TIER_THRESHOLDS, RACE_BY_LOWER, races
 from Item_Repo import items
 
+class CharacterType(IntEnum):
+    """Character types as small ints; the lowercase name is the stored "Character Type" value."""
+    CHARACTER = 0
+    FAMILIAR = 1
+    MONSTER = 2
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+# Prompt metadata derived once from the constant META_INFO / STATS lists
+_META_INFO_SPEC = tuple((info, "level" in info.lower()) for info in META_INFO)
+_STAT_PROMPTS = tuple(f"{stat_name}: " for stat, stat_name in zip(STATS, STATS_CAPITALIZED))
+
+# Stats shown side by side in the combat simulator
+COMBAT_STATS = ("strength", "dexterity", "toughness", "vitality")
+
+# Meta key holding the level for each normalized level type
+LEVEL_KEY = {"Class": "Class level", "Profession": "Profession level", "Race": "Race level"}
+
+# Flat per-stat view of a reverse_engineer_stat_allocation() result, in STATS order
+StatAllocation = namedtuple(
+    "StatAllocation",
+    "stat base class_bonus profession_bonus race_bonus free_points_allocated current discrepancy"
+)
+_ALLOCATION_FIELDS = itemgetter(*StatAllocation._fields[1:])
+
+# Race menu order: numbered choices index RACE_NAMES, typed names go through RACE_BY_LOWER
+RACE_NAMES = tuple(races)
+
+# Bitmask form of RACE_LEVELING_TYPES: test with (1 << character_type) & RACE_LEVELING_MASK
+RACE_LEVELING_MASK = sum(1 << CharacterType[t.upper()] for t in RACE_LEVELING_TYPES)
+
 # ============================================================================
 # UI Utilities
 # ============================================================================
 
+# Characters in a character name that can't appear in a default report filename
+_FNAME_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# False when driven by a script or pipe: pauses and screen clears are skipped
+INTERACTIVE = sys.stdin.isatty() and sys.stdout.isatty()
+
+# Answer for confirm_action in non-interactive runs ("y"/"n"); unset means read it from stdin
+_confirm_env = os.environ.get("ASPECTS_DEFAULT_CONFIRM", "").strip().lower()
+DEFAULT_CONFIRM = _confirm_env in ('y', 'yes', '1', 'true') if _confirm_env else None
+
+# Answers CSV for bulk leveling (see load_bulk_answers); set it so scripted runs skip the tier/free point prompts
+BULK_ANSWERS_FILE = os.environ.get("ASPECTS_BULK_ANSWERS", "").strip()
+
+# ASPECTS_REPORT_VERBOSE=n leaves the detailed validation section out of reports for valid characters
+REPORT_VERBOSE = os.environ.get("ASPECTS_REPORT_VERBOSE", "y").strip().lower() not in ('n', 'no', '0', 'false')
+
+def enable_output_buffering():
+    """
+    Stop stdout from flushing on every newline.
+    Output is batched and written when input() flushes before a prompt (or on an explicit flush),
+    instead of issuing one write per printed line.
+    """
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
 def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen (no-op in non-interactive runs)."""
+    if not INTERACTIVE:
+        return
+    if os.name == 'nt':
+        # Flush pending output first so it isn't written after the screen is cleared
+        sys.stdout.flush()
+        os.system('cls')
+        return
+    # Home the cursor, clear the screen and scrollback (what `clear` emits) without spawning a process
+    sys.stdout.write("\033[H\033[2J\033[3J")
+    sys.stdout.flush()
+
+@contextmanager
+def buffered_output():
+    """
+    Collect everything printed inside the block (print_* helpers included) and
+    write it to stdout in one call when the block exits.
+    Yields the buffer, so the finished text can also be saved (buffer.getvalue()).
+    Don't prompt for input inside the block - the prompt would land in the buffer.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield buffer
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+@contextmanager
+def redraw_frame():
+    """
+    Like clear_screen() followed by buffered_output(), for screens redrawn in a loop.
+    On POSIX terminals the new frame is written over the old one from the top
+    (erasing each line's tail and everything below) instead of blanking the screen first,
+    so the redraw doesn't flicker. Don't prompt for input inside the block.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield buffer
+    finally:
+        text = buffer.getvalue()
+        if INTERACTIVE and os.name != 'nt':
+            sys.stdout.write("\033[H" + text.replace("\n", "\033[K\n") + "\033[J")
+        else:
+            clear_screen()
+            sys.stdout.write(text)
+
+# ANSI color codes used by print_colored
+ANSI_COLORS = {
+    'black': '30', 'red': '31', 'green': '32', 'yellow': '33',
+    'blue': '34', 'magenta': '35', 'cyan': '36', 'white': '37'
+}
 
 def print_colored(text: str, color: str = 'white', bold: bool = False):
     """Print colored text using ANSI escape codes."""
-    colors = {
-        'black': '30', 'red': '31', 'green': '32', 'yellow': '33',
-        'blue': '34', 'magenta': '35', 'cyan': '36', 'white': '37'
-    }
-    
+    print(colorize(text, color, bold))
+
+@lru_cache(maxsize=None)
+def _ansi_prefix(color: str, bold: bool) -> str:
+    """Opening ANSI escape for a color/bold pair (only a handful exist, so each is built once)."""
     bold_code = '1;' if bold else ''
-    color_code = colors.get(color.lower(), '37')  # Default to white if color not found
-    
-    print(f"\033[{bold_code}{color_code}m{text}\033[0m")
+    color_code = ANSI_COLORS.get(color.lower(), '37')  # Default to white if color not found
+    return f"\033[{bold_code}{color_code}m"
+
+@lru_cache(maxsize=None)
+def key_label(key: str) -> str:
+    """Display label for a snake_case result key, e.g. 'actual_remaining' -> 'Actual Remaining' (built once per key)."""
+    return key.replace('_', ' ').title()
+
+def colorize(text: str, color: str = 'white', bold: bool = False) -> str:
+    """Wrap text in ANSI escape codes for the given color."""
+    return f"{_ansi_prefix(color, bold)}{text}\033[0m"
 
 def print_header(text: str):
     """Print a formatted header."""
     width = min(get_terminal_width(), 80)
-    print()
-    print_colored("=" * width, 'cyan', True)
-    print_colored(text.center(width), 'cyan', True)
-    print_colored("=" * width, 'cyan', True)
-    print()
+    rule = colorize("=" * width, 'cyan', True)
+    print(f"\n{rule}\n{colorize(text.center(width), 'cyan', True)}\n{rule}\n")
 
 def print_subheader(text: str):
     """Print a formatted subheader."""
     width = min(get_terminal_width(), 80)
-    print()
-    print_colored("-" * width, 'green')
-    print_colored(text.center(width), 'green', True)
-    print_colored("-" * width, 'green')
-    print()
+    rule = colorize("-" * width, 'green')
+    print(f"\n{rule}\n{colorize(text.center(width), 'green', True)}\n{rule}\n")
 
 def print_success(text: str):
     """Print a success message."""
@@ -76,13 +195,51 @@ def print_info(text: str):
     print_colored(f"ℹ {text}", 'blue')
 
 def print_loading(text: str = "Loading", iterations: int = 3, delay: float = 0.2):
-    """Print a loading animation."""
+    """Print a loading animation (a single plain line when stdout is not a terminal)."""
+    if not sys.stdout.isatty():
+        print(f"{text}...")
+        return
     for _ in range(iterations):
         for dots in range(4):
             clear_screen()
-            print(f"{text}{'.' * dots}")
+            print(f"{text}{'.' * dots}", flush=True)
             time.sleep(delay)
 
+class Spinner:
+    """
+    Context manager that animates a loading message in a background thread while the
+    wrapped work runs, instead of blocking before it like print_loading().
+    Does nothing when stdout is not a terminal.
+    """
+    def __init__(self, text: str = "Loading", delay: float = 0.2):
+        self.text = text
+        self.delay = delay
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _run(self):
+        dots = 0
+        while not self._stop.is_set():
+            sys.stdout.write(f"\r{self.text}{'.' * dots}   ")
+            sys.stdout.flush()
+            dots = (dots + 1) % 4
+            self._stop.wait(self.delay)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    
+    def __enter__(self):
+        if sys.stdout.isatty():
+            sys.stdout.flush()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+        return False
+
 def get_terminal_width() -> int:
     """Get the terminal width."""
     try:
@@ -91,14 +248,160 @@ def get_terminal_width() -> int:
         return 80
 
 def pause_screen():
-    """Pause the screen until the user presses Enter."""
+    """Pause the screen until the user presses Enter (skipped in non-interactive runs)."""
+    if not INTERACTIVE:
+        return
     input("\nPress Enter to continue...")
 
 def confirm_action(prompt: str = "Are you sure?") -> bool:
-    """Prompt the user to confirm an action."""
+    """
+    Prompt the user to confirm an action.
+    Non-interactive runs use ASPECTS_DEFAULT_CONFIRM when it is set, and treat end of input as "no".
+    """
+    if not INTERACTIVE:
+        if DEFAULT_CONFIRM is not None:
+            print(f"{prompt} (y/n): {'y' if DEFAULT_CONFIRM else 'n'}")
+            return DEFAULT_CONFIRM
+        try:
+            response = input(f"{prompt} (y/n): ")
+        except EOFError:
+            return False
+        return response.strip().lower() in ('y', 'yes')
+    
     response = input(f"{prompt} (y/n): ").strip().lower()
     return response in ('y', 'yes')
 
+def prompt_nonempty(prompt: str, error: str = "Name cannot be empty.") -> str:
+    """Prompt until the user enters a non-blank value and return it stripped."""
+    while True:
+        value = input(prompt).strip()
+        if value:
+            return value
+        print_error(error)
+
+def prompt_tier_selection(prompt: str, options: Sequence[str], kind: str, tier: int) -> str:
+    """
+    Prompt until the user picks a tier class/profession, either by its number in options or by name.
+    kind is "class" or "profession"; names are validated against that tier and returned lowercased.
+    """
+    validate = validate_class_tier_combination if kind == "class" else validate_profession_tier_combination
+    while True:
+        selection = input(prompt).strip()
+        
+        # Digits pick from the numbered list; anything else is matched by name (no ValueError round trip)
+        if selection.isdecimal():
+            choice_num = int(selection)
+            if 1 <= choice_num <= len(options):
+                return options[choice_num - 1]
+            print_error(f"Please enter a number between 1 and {len(options)}")
+        elif validate(selection.lower(), tier):
+            return selection.lower()
+        else:
+            print_error(f"Invalid tier {tier} {kind}: {selection}")
+
+def parse_small_int(text: str, default: int) -> int:
+    """
+    Parse a prompt answer as an optionally signed decimal integer.
+    Blank input returns default; anything else that isn't digits raises ValueError.
+    """
+    text = text.strip()
+    if not text:
+        return default
+    digits = text[1:] if text[0] in '+-' else text
+    if not digits.isdigit() or not digits.isascii():
+        raise ValueError(f"invalid integer: {text!r}")
+    return int(text)
+
+def parse_int_list(text: str) -> List[int]:
+    """
+    Parse comma-separated integers such as '25, 50,75' in one map over the tokens
+    (int() already ignores the spaces around each one); any other token raises ValueError.
+    """
+    return list(map(int, text.split(',')))
+
+def read_stats_block(prompt_labels: Sequence[str], defaults: Sequence[int]) -> List[int]:
+    """
+    Read one integer per prompt label; blank entries take the matching default.
+    Interactive sessions prompt field by field and re-ask on bad input. Piped stdin
+    is consumed as one block of len(prompt_labels) lines without per-field prompts,
+    and an unparsable line raises ValueError naming its field (there is no one to re-ask).
+    """
+    if sys.stdin.isatty():
+        values = []
+        for label, default in zip(prompt_labels, defaults):
+            while True:
+                try:
+                    values.append(parse_small_int(input(label), default))
+                    break
+                except ValueError:
+                    print_error("Please enter a valid integer.")
+        return values
+    
+    # Only take as many lines as there are fields so later prompts still get their input
+    readline = sys.stdin.readline
+    lines = [readline() for _ in prompt_labels]
+    values = []
+    for label, default, line in zip(prompt_labels, defaults, lines):
+        try:
+            values.append(parse_small_int(line, default))
+        except ValueError:
+            raise ValueError(f"{label.strip()} '{line.strip()}' is not a valid integer") from None
+    return values
+
+def format_stat_breakdown(base: int, bonuses: Sequence[Tuple[str, int]]) -> str:
+    """Format 'Base: b + Label: +n + ...', listing only the positive (label, value) bonuses."""
+    return f"Base: {base}" + "".join(f" + {label}: +{value}" for label, value in bonuses if value > 0)
+
+def stat_allocation_rows(stat_allocations: Dict[str, Dict[str, int]]) -> List[StatAllocation]:
+    """Unpack the per-stat allocation dicts into StatAllocation rows, one itemgetter call per stat."""
+    return [StatAllocation(stat, *_ALLOCATION_FIELDS(stat_allocations[stat])) for stat in STATS]
+
+def format_meta_block(meta: Iterable[Tuple[str, Any]]) -> str:
+    """Format (key, value) meta pairs, e.g. from iter_meta(), as 'key: value' lines joined into one block."""
+    return "\n".join(f"{key}: {value}" for key, value in meta)
+
+def format_stat_block(stats: Dict[str, int]) -> str:
+    """Format current stats as 'Name: value' lines in STATS order, joined into one block."""
+    return "\n".join(f"{stat_name}: {stats[stat]}" for stat, stat_name in zip(STATS, STATS_CAPITALIZED))
+
+def format_history_block(history: List[Dict[str, Any]], key: str, thresholds: Sequence[int]) -> str:
+    """Format class/profession history as '  name (Level a-b) [Tier t]' lines joined into one block."""
+    thresholds = tuple(thresholds)  # Hashable once, so each cached tier lookup skips the copy
+    lines = []
+    for entry in history:
+        to_level = entry['to_level']
+        level_range = f"Level {entry['from_level']}" + ("+" if to_level is None else f"-{to_level}")
+        tier = get_tier_for_level(entry['from_level'], thresholds)
+        lines.append(f"  {entry[key]} ({level_range}) [Tier {tier}]")
+    return "\n".join(lines)
+
+def _positives(values: Dict[str, int]) -> List[Tuple[str, int]]:
+    """(key, value) pairs with a positive value, in dict order."""
+    return [(key, value) for key, value in values.items() if value > 0]
+
+def has_multi_source(sources: Dict[str, int]) -> bool:
+    """Return True if more than one stat source contributes a positive value; stops at the second."""
+    seen = 0
+    for value in sources.values():
+        if value > 0:
+            seen += 1
+            if seen > 1:
+                return True
+    return False
+
+def parse_threshold_list(text: str, default: Sequence[int]) -> Sequence[int]:
+    """
+    Parse comma-separated tier thresholds into a sorted list without duplicates.
+    Returns default for blank input; empty entries (e.g. a trailing comma) are ignored.
+    Raises ValueError if any entry is not an integer.
+    """
+    if not text.strip():
+        return default
+    thresholds = sorted({int(x) for x in text.split(',') if x.strip()})
+    if not thresholds:
+        raise ValueError("No tier thresholds given")
+    return thresholds
+
 # ============================================================================
 # Menu System
 # ============================================================================
@@ -131,7 +434,7 @@ def print_inventory_menu(character: Character):
 # Character Type Selection
 # ============================================================================
 
-def select_character_type() -> str:
+def select_character_type() -> Optional[CharacterType]:
     """
     NEW: Allow user to select character type
     """
@@ -150,43 +453,49 @@ def select_character_type() -> str:
         if choice == '0':
             return None
         elif choice == '1':
-            return "character"
+            return CharacterType.CHARACTER
         elif choice == '2':
-            return "familiar"
+            return CharacterType.FAMILIAR
         elif choice == '3':
-            return "monster"
+            return CharacterType.MONSTER
         else:
             print_error("Invalid choice. Please enter 1, 2, 3, or 0.")
 
+@lru_cache(maxsize=None)
+def format_race_menu(indent: str = "", titled: bool = False) -> str:
+    """Numbered list of RACE_NAMES, built once per layout."""
+    return "\n".join(f"{indent}{i}. {race.title() if titled else race}"
+                     for i, race in enumerate(RACE_NAMES, 1))
+
+def match_race(choice: str) -> Optional[str]:
+    """
+    Resolve a race menu answer (number or name, any case) to its race name.
+    Prints an error and returns None if the answer doesn't match a race.
+    """
+    choice = choice.strip()
+    if not choice.isdecimal():
+        race = RACE_BY_LOWER.get(choice.lower())
+        if race is None:
+            print_error(f"Invalid race: {choice}")
+        return race
+    
+    race_num = int(choice)
+    if 1 <= race_num <= len(RACE_NAMES):
+        return RACE_NAMES[race_num - 1]
+    print_error(f"Please enter a number between 1 and {len(RACE_NAMES)}")
+    return None
+
 def select_race() -> str:
     """
     NEW: Race selection helper
     """
-    available_races = list(races.keys())
-    
     print_subheader("Available Races")
-    for i, race in enumerate(available_races, 1):
-        print(f"{i}. {race.title()}")
+    print(format_race_menu(titled=True))
     
     while True:
-        choice = input("\nEnter race (number or name): ").strip()
-        
-        # Try to parse as number first
-        try:
-            race_num = int(choice)
-            if 1 <= race_num <= len(available_races):
-                return available_races[race_num - 1]
-            else:
-                print_error(f"Please enter a number between 1 and {len(available_races)}")
-                continue
-        except ValueError:
-            # Try to match by name
-            race_choice = choice.lower()
-            if race_choice in available_races:
-                return race_choice
-            else:
-                print_error(f"Invalid race: {choice}")
-                continue
+        race = match_race(input("\nEnter race (number or name): "))
+        if race is not None:
+            return race
 
 # ============================================================================
 # Character Management Functions
@@ -195,10 +504,10 @@ def select_race() -> str:
 def create_character(item_repository) -> Character:
     """Create a new character with calculated progression bonuses."""
     character_type = select_character_type()
-    if not character_type:
+    if character_type is None:
         return None
     
-    if character_type in RACE_LEVELING_TYPES:
+    if (1 << character_type) & RACE_LEVELING_MASK:
         return create_familiar_or_monster(character_type, item_repository)
     else:
         return create_regular_character(item_repository)
@@ -209,28 +518,20 @@ def create_regular_character(item_repository) -> Character:
     print_header("Create a New Character")
     
     # Get character name
-    while True:
-        name = input("Enter character name: ").strip()
-        if name:
-            break
-        print_error("Name cannot be empty.")
+    name = prompt_nonempty("Enter character name: ")
     
     # Collect meta information
     meta = {"Character Type": "character"}
     print_subheader(f"Enter information for {name}")
     
-    for info in META_INFO:
+    for info, is_level in _META_INFO_SPEC:
         if info == "Character Type":
             continue  # Already set
         
-        if "level" in info.lower():
+        if is_level:
             while True:
                 try:
-                    value = input(f"{info}: ").strip()
-                    if not value:
-                        value = "0"
-                    int(value)  # Check if it's a valid integer
-                    meta[info] = value
+                    meta[info] = str(parse_small_int(input(f"{info}: "), 0))
                     break
                 except ValueError:
                     print_error("Please enter a valid integer.")
@@ -243,13 +544,10 @@ def create_regular_character(item_repository) -> Character:
     print_info("Default value is 5 if left empty.")
     
     stats = {}
-    for stat in STATS:
+    for stat, prompt in zip(STATS, _STAT_PROMPTS):
         while True:
             try:
-                value = input(f"{stat.capitalize()}: ").strip()
-                if not value:
-                    value = "5"  # Default value
-                stats[stat] = int(value)
+                stats[stat] = parse_small_int(input(prompt), 5)
                 break
             except ValueError:
                 print_error("Please enter a valid integer.")
@@ -266,19 +564,16 @@ def create_regular_character(item_repository) -> Character:
     pause_screen()
     return character
 
-def create_familiar_or_monster(character_type: str, item_repository) -> Character:
+def create_familiar_or_monster(character_type: CharacterType, item_repository) -> Character:
     """
     NEW: Create a familiar or monster
     """
     clear_screen()
-    print_header(f"Create a New {character_type.capitalize()}")
+    type_label = character_type.label
+    print_header(f"Create a New {type_label.capitalize()}")
     
     # Get name
-    while True:
-        name = input(f"Enter {character_type} name: ").strip()
-        if name:
-            break
-        print_error("Name cannot be empty.")
+    name = prompt_nonempty(f"Enter {type_label} name: ")
     
     # Get race
     race = select_race()
@@ -286,11 +581,7 @@ def create_familiar_or_monster(character_type: str, item_repository) -> Characte
     # Get race level
     while True:
         try:
-            race_level = input(f"Enter starting race level (default: 1): ").strip()
-            if not race_level:
-                race_level = 1
-            else:
-                race_level = int(race_level)
+            race_level = parse_small_int(input("Enter starting race level (default: 1): "), 1)
             
             if race_level < 1:
                 print_error("Race level must be at least 1.")
@@ -305,19 +596,16 @@ def create_familiar_or_monster(character_type: str, item_repository) -> Characte
     print_info("Default value is 5 if left empty.")
     
     stats = {}
-    for stat in STATS:
+    for stat, prompt in zip(STATS, _STAT_PROMPTS):
         while True:
             try:
-                value = input(f"{stat.capitalize()}: ").strip()
-                if not value:
-                    value = "5"  # Default value
-                stats[stat] = int(value)
+                stats[stat] = parse_small_int(input(prompt), 5)
                 break
             except ValueError:
                 print_error("Please enter a valid integer.")
     
     # Create character using appropriate factory method
-    if character_type == "familiar":
+    if character_type is CharacterType.FAMILIAR:
         character = Character.create_familiar(
             name=name,
             race=race,
@@ -334,29 +622,132 @@ def create_familiar_or_monster(character_type: str, item_repository) -> Characte
             item_repository=item_repository
         )
     
-    print_success(f"{character_type.capitalize()} {name} created successfully!")
+    print_success(f"{type_label.capitalize()} {name} created successfully!")
     pause_screen()
     return character
 
+@lru_cache(maxsize=None)
+def format_tier_options(kind: str, tier: int, indent: str = "  ") -> str:
+    """Numbered list of the classes ("class") or professions available in a tier, built once per tier."""
+    if kind == "class":
+        options = get_available_classes_for_tier(tier)
+    else:
+        options = get_available_professions_for_tier(tier)
+    return "\n".join(f"{indent}{i}. {option}" for i, option in enumerate(options, 1))
+
+# Number of times build_tier_history re-asks for tier entries that failed validation
+MAX_TIER_PROMPT_RETRIES = 3
+
+def build_tier_history(kind: str, current_name: str, level: int, tier_thresholds: List[int],
+                       validate_current: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """
+    Prompt for the class or profession held in each tier up to level and build its history.
+    
+    All tiers are asked for first and validated together; only the invalid entries are
+    asked for again (up to MAX_TIER_PROMPT_RETRIES times), so valid answers are never lost.
+    
+    Args:
+        kind: "class" or "profession"
+        current_name: Current class/profession, used for the final tier when set
+        level: Current class/profession level
+        tier_thresholds: Character's tier thresholds
+        validate_current: Abort if current_name isn't valid for the final tier
+    
+    Returns:
+        History entries ({kind, from_level, to_level}), or None if creation should be aborted
+    """
+    if kind == "class":
+        plural = "classes"
+        get_available, validate = get_available_classes_for_tier, validate_class_tier_combination
+    else:
+        plural = "professions"
+        get_available, validate = get_available_professions_for_tier, validate_profession_tier_combination
+    
+    print_subheader(f"{kind.capitalize()} History Setup")
+    
+    # Determine how many tiers the character has progressed through
+    max_tier = get_tier_for_level(level, tier_thresholds)
+    
+    if max_tier <= 1:
+        # Single tier character
+        return [{kind: current_name, "from_level": 1, "to_level": None}]
+    
+    print(f"Character {kind} level {level} spans {max_tier} tier(s)")
+    print(f"You need to specify the {kind} for each tier:")
+    
+    # Calculate level ranges and check every tier has options before asking for anything
+    ranges = []
+    level_start = 1
+    for tier in range(1, max_tier + 1):
+        if tier - 1 < len(tier_thresholds):
+            level_end = min(tier_thresholds[tier - 1] - 1, level)
+        else:
+            level_end = level
+        ranges.append((tier, level_start, level_end))
+        level_start = level_end + 1
+        
+        if not get_available(tier):
+            print_error(f"No {plural} available for tier {tier}!")
+            pause_screen()
+            return None
+    
+    # Check the current class/profession up front, so an invalid one aborts before any typing
+    if current_name and validate_current and not validate(current_name, max_tier):
+        print_error(f"Invalid {kind} '{current_name}' for tier {max_tier}")
+        pause_screen()
+        return None
+    
+    # Collect a name for every tier
+    names = {}
+    prompted = []
+    for tier, level_start, level_end in ranges:
+        print(f"\nTier {tier} (levels {level_start}-{level_end}):")
+        print(f"Available {plural}:")
+        print(format_tier_options(kind, tier))
+        
+        if tier == max_tier and current_name:
+            names[tier] = current_name
+            print(f"Using current {kind}: {current_name}")
+        else:
+            names[tier] = input(f"Enter tier {tier} {kind}: ").strip()
+            prompted.append(tier)
+    
+    # Validate as a batch, then re-ask only for the invalid tiers
+    invalid = [tier for tier in prompted if not validate(names[tier], tier)]
+    for _ in range(MAX_TIER_PROMPT_RETRIES):
+        if not invalid:
+            break
+        for tier in invalid:
+            print_error(f"Invalid {kind} '{names[tier]}' for tier {tier}")
+            names[tier] = input(f"Enter tier {tier} {kind}: ").strip()
+        invalid = [tier for tier in invalid if not validate(names[tier], tier)]
+    
+    if invalid:
+        for tier in invalid:
+            print_error(f"Invalid {kind} '{names[tier]}' for tier {tier}")
+        pause_screen()
+        return None
+    
+    return [
+        {kind: names[tier], "from_level": start, "to_level": end if tier < max_tier else None}
+        for tier, start, end in ranges
+    ]
+
 def create_advanced_character(item_repository) -> Character:
     """Create a character with full tier history input."""
     character_type = select_character_type()
-    if not character_type:
+    if character_type is None:
         return None
     
-    if character_type in RACE_LEVELING_TYPES:
-        print_info(f"{character_type.capitalize()}s use the standard creation method.")
+    if (1 << character_type) & RACE_LEVELING_MASK:
+        print_info(f"{character_type.label.capitalize()}s use the standard creation method.")
         return create_familiar_or_monster(character_type, item_repository)
     
     clear_screen()
     print_header("Create Advanced Character")
     
     # Get character name
-    while True:
-        name = input("Enter character name: ").strip()
-        if name:
-            break
-        print_error("Name cannot be empty.")
+    name = prompt_nonempty("Enter character name: ")
     
     # Get tier thresholds
     print_subheader(f"Tier Thresholds for {name}")
@@ -366,14 +757,8 @@ def create_advanced_character(item_repository) -> Character:
     while True:
         try:
             threshold_input = input("Enter tier thresholds (comma-separated): ").strip()
-            if not threshold_input:
-                tier_thresholds = DEFAULT_TIER_THRESHOLDS.copy()
-                break
-            else:
-                # Parse comma-separated values
-                tier_thresholds = [int(x.strip()) for x in threshold_input.split(',')]
-                tier_thresholds = sorted(list(set(tier_thresholds)))  # Remove duplicates and sort
-                break
+            tier_thresholds = parse_threshold_list(threshold_input, DEFAULT_TIER_THRESHOLDS)
+            break
         except ValueError:
             print_error("Please enter valid integers separated by commas.")
     
@@ -390,11 +775,7 @@ def create_advanced_character(item_repository) -> Character:
         if info in ["Class level", "Profession level"]:
             while True:
                 try:
-                    value = input(f"{info}: ").strip()
-                    if not value:
-                        value = "0"
-                    int(value)  # Check if it's a valid integer
-                    meta[info] = value
+                    meta[info] = str(parse_small_int(input(f"{info}: "), 0))
                     break
                 except ValueError:
                     print_error("Please enter a valid integer.")
@@ -406,135 +787,18 @@ def create_advanced_character(item_repository) -> Character:
     class_level = int(meta.get("Class level", "0"))
     profession_level = int(meta.get("Profession level", "0"))
     
-    # Create class history dynamically
+    # Create class and profession history dynamically
     class_history = []
     if class_level > 0:
-        print_subheader("Class History Setup")
-        current_class = meta.get("Class", "")
-        
-        # Determine how many tiers the character has progressed through
-        max_tier = get_tier_for_level(class_level, tier_thresholds)
-        
-        if max_tier > 1:
-            print(f"Character level {class_level} spans {max_tier} tier(s)")
-            print("You need to specify the class for each tier:")
-            
-            level_start = 1
-            for tier in range(1, max_tier + 1):
-                # Calculate level range for this tier
-                if tier < len(tier_thresholds) + 1:
-                    if tier == 1:
-                        level_end = tier_thresholds[0] - 1
-                    elif tier - 1 < len(tier_thresholds):
-                        level_end = min(tier_thresholds[tier - 1] - 1, class_level) if tier < len(tier_thresholds) + 1 else class_level
-                    else:
-                        level_end = class_level
-                else:
-                    level_end = class_level
-                
-                # Get available classes for this tier
-                available_classes = get_available_classes_for_tier(tier)
-                if not available_classes:
-                    print_error(f"No classes available for tier {tier}!")
-                    pause_screen()
-                    return None
-                
-                print(f"\nTier {tier} (levels {level_start}-{min(level_end, class_level)}):")
-                print("Available classes:")
-                for i, class_name in enumerate(available_classes, 1):
-                    print(f"  {i}. {class_name}")
-                
-                if tier == max_tier and current_class:
-                    tier_class = current_class
-                    print(f"Using current class: {tier_class}")
-                else:
-                    tier_class = input(f"Enter tier {tier} class: ").strip()
-                
-                # Validate the class
-                if not validate_class_tier_combination(tier_class, tier):
-                    print_error(f"Invalid class '{tier_class}' for tier {tier}")
-                    pause_screen()
-                    return None
-                
-                class_history.append({
-                    "class": tier_class,
-                    "from_level": level_start,
-                    "to_level": min(level_end, class_level) if tier < max_tier else None
-                })
-                
-                level_start = level_end + 1
-        else:
-            # Single tier character
-            class_history.append({
-                "class": current_class,
-                "from_level": 1,
-                "to_level": None
-            })
+        class_history = build_tier_history("class", meta.get("Class", ""), class_level, tier_thresholds)
+        if class_history is None:
+            return None
     
-    # Create profession history dynamically
     profession_history = []
     if profession_level > 0:
-        print_subheader("Profession History Setup")
-        current_profession = meta.get("Profession", "")
-        
-        # Determine how many tiers the character has progressed through
-        max_tier = get_tier_for_level(profession_level, tier_thresholds)
-        
-        if max_tier > 1:
-            print(f"Character level {profession_level} spans {max_tier} tier(s)")
-            print("You need to specify the profession for each tier:")
-            
-            level_start = 1
-            for tier in range(1, max_tier + 1):
-                # Calculate level range for this tier
-                if tier < len(tier_thresholds) + 1:
-                    if tier == 1:
-                        level_end = tier_thresholds[0] - 1
-                    elif tier - 1 < len(tier_thresholds):
-                        level_end = min(tier_thresholds[tier - 1] - 1, profession_level) if tier < len(tier_thresholds) + 1 else profession_level
-                    else:
-                        level_end = profession_level
-                else:
-                    level_end = profession_level
-                
-                # Get available professions for this tier
-                available_professions = get_available_professions_for_tier(tier)
-                if not available_professions:
-                    print_error(f"No professions available for tier {tier}!")
-                    pause_screen()
-                    return None
-                
-                print(f"\nTier {tier} (levels {level_start}-{min(level_end, profession_level)}):")
-                print("Available professions:")
-                for i, profession_name in enumerate(available_professions, 1):
-                    print(f"  {i}. {profession_name}")
-                
-                if tier == max_tier and current_profession:
-                    tier_profession = current_profession
-                    print(f"Using current profession: {tier_profession}")
-                else:
-                    tier_profession = input(f"Enter tier {tier} profession: ").strip()
-                
-                # Validate the profession
-                if not validate_profession_tier_combination(tier_profession, tier):
-                    print_error(f"Invalid profession '{tier_profession}' for tier {tier}")
-                    pause_screen()
-                    return None
-                
-                profession_history.append({
-                    "profession": tier_profession,
-                    "from_level": level_start,
-                    "to_level": min(level_end, profession_level) if tier < max_tier else None
-                })
-                
-                level_start = level_end + 1
-        else:
-            # Single tier character
-            profession_history.append({
-                "profession": current_profession,
-                "from_level": 1,
-                "to_level": None
-            })
+        profession_history = build_tier_history("profession", meta.get("Profession", ""), profession_level, tier_thresholds)
+        if profession_history is None:
+            return None
     
     # Get base stats
     print_subheader(f"Enter base stats for {name}")
@@ -542,65 +806,62 @@ def create_advanced_character(item_repository) -> Character:
     print_info("Default value is 5 if left empty.")
     
     base_stats = {}
-    for stat in STATS:
+    for stat, prompt in zip(STATS, _STAT_PROMPTS):
         while True:
             try:
-                value = input(f"{stat.capitalize()}: ").strip()
-                if not value:
-                    value = "5"  # Default value
-                base_stats[stat] = int(value)
+                base_stats[stat] = parse_small_int(input(prompt), 5)
                 break
             except ValueError:
                 print_error("Please enter a valid integer.")
     
-    # Create character with history
-    print_loading("Creating advanced character")
-    
-    # Create character using factory method
-    character = Character.create_calculated(
-        name=name,
-        stats=base_stats,
-        meta=meta,
-        tier_thresholds=tier_thresholds,
-        class_history=class_history,
-        profession_history=profession_history,
-        item_repository=item_repository
-    )
+    # Create character with history using factory method
+    with Spinner("Creating advanced character"):
+        character = Character.create_calculated(
+            name=name,
+            stats=base_stats,
+            meta=meta,
+            tier_thresholds=tier_thresholds,
+            class_history=class_history,
+            profession_history=profession_history,
+            item_repository=item_repository
+        )
     
     print_success(f"Advanced character {name} created successfully!")
     
     # Display the created history
     print_subheader("Created Character History")
-    print(f"Tier thresholds: {tier_thresholds}")
+    out = [f"Tier thresholds: {tier_thresholds}"]
     
-    if class_history:
-        print("Class History:")
-        for entry in class_history:
+    for title, key, history in (("Class History:", 'class', class_history),
+                                ("Profession History:", 'profession', profession_history)):
+        if not history:
+            continue
+        out.append(title)
+        for entry in history:
             level_range = f"Level {entry['from_level']}"
             if entry['to_level'] is not None:
                 level_range += f"-{entry['to_level']}"
             else:
                 level_range += "+"
-            print(f"  {entry['class']} ({level_range})")
+            out.append(f"  {entry[key]} ({level_range})")
     
-    if profession_history:
-        print("Profession History:")
-        for entry in profession_history:
-            level_range = f"Level {entry['from_level']}"
-            if entry['to_level'] is not None:
-                level_range += f"-{entry['to_level']}"
-            else:
-                level_range += "+"
-            print(f"  {entry['profession']} ({level_range})")
+    sys.stdout.write("\n".join(out) + "\n")
     
     pause_screen()
     return character
 
-def create_manual_character(item_repository) -> Character:
-    """Create a character with manual stat and level entry (no calculations)."""
+def create_manual_character(item_repository, validate: bool = INTERACTIVE) -> Character:
+    """
+    Create a character with manual stat and level entry (no calculations).
+    
+    With validate=False (the default for non-interactive runs) each field is read once
+    without re-prompting, and all integer fields are checked in a single pass before the
+    character is built, so a bad piped line aborts instead of swallowing later lines as retries.
+    """
     character_type = select_character_type()
-    if not character_type:
+    if character_type is None:
         return None
+    is_race_leveling = bool((1 << character_type) & RACE_LEVELING_MASK)
     
     clear_screen()
     print_header("Create Custom Character")
@@ -608,15 +869,11 @@ def create_manual_character(item_repository) -> Character:
     print_warning("This character will not follow class/profession/race progression rules!")
     
     # Get character name
-    while True:
-        name = input("Enter character name: ").strip()
-        if name:
-            break
-        print_error("Name cannot be empty.")
+    name = prompt_nonempty("Enter character name: ")
     
     # Get tier thresholds (only for regular characters)
-    tier_thresholds = DEFAULT_TIER_THRESHOLDS.copy()
-    if character_type == "character":
+    tier_thresholds = DEFAULT_TIER_THRESHOLDS
+    if character_type is CharacterType.CHARACTER:
         print_subheader(f"Tier Thresholds for {name}")
         print_info("Enter the levels where tier changes occur (e.g., 25, 50, 75)")
         print_info("Default: [25] - press Enter to use default")
@@ -624,20 +881,15 @@ def create_manual_character(item_repository) -> Character:
         while True:
             try:
                 threshold_input = input("Enter tier thresholds (comma-separated): ").strip()
-                if not threshold_input:
-                    tier_thresholds = DEFAULT_TIER_THRESHOLDS.copy()
-                    break
-                else:
-                    tier_thresholds = [int(x.strip()) for x in threshold_input.split(',')]
-                    tier_thresholds = sorted(list(set(tier_thresholds)))
-                    break
+                tier_thresholds = parse_threshold_list(threshold_input, DEFAULT_TIER_THRESHOLDS)
+                break
             except ValueError:
                 print_error("Please enter valid integers separated by commas.")
         
         print_success(f"Tier thresholds set to: {tier_thresholds}")
     
     # Collect meta information
-    meta = {"Character Type": character_type}
+    meta = {"Character Type": character_type.label}
     print_subheader(f"Enter information for {name}")
     
     for info in META_INFO:
@@ -645,7 +897,7 @@ def create_manual_character(item_repository) -> Character:
             continue  # Already set
         
         # Skip class/profession for familiars/monsters
-        if character_type in RACE_LEVELING_TYPES and ("Class" in info or "Profession" in info):
+        if is_race_leveling and ("Class" in info or "Profession" in info):
             if "level" in info:
                 meta[info] = "0"
             else:
@@ -653,13 +905,12 @@ def create_manual_character(item_repository) -> Character:
             continue
         
         if info in ["Class level", "Profession level", "Race level"]:
+            if not validate:
+                meta[info] = input(f"{info}: ").strip() or "0"
+                continue
             while True:
                 try:
-                    value = input(f"{info}: ").strip()
-                    if not value:
-                        value = "0"
-                    int(value)  # Validate it's an integer
-                    meta[info] = value
+                    meta[info] = str(parse_small_int(input(f"{info}: "), 0))
                     break
                 except ValueError:
                     print_error("Please enter a valid integer.")
@@ -672,33 +923,59 @@ def create_manual_character(item_repository) -> Character:
     print_info("Enter the final stat values you want (no calculations will be applied)")
     
     stats = {}
-    for stat in STATS:
+    if validate:
+        try:
+            stats = dict(zip(STATS, read_stats_block(_STAT_PROMPTS, (5,) * len(STATS))))
+        except ValueError as e:
+            print_error(f"Cannot create character - {e}")
+            pause_screen()
+            return None
+    else:
+        raw_stats = {stat: input(prompt).strip() or "5" for stat, prompt in zip(STATS, _STAT_PROMPTS)}
+    
+    # Get free points
+    if validate:
         while True:
             try:
-                value = input(f"{stat.capitalize()}: ").strip()
-                if not value:
-                    value = "5"  # Default value
-                stats[stat] = int(value)
+                free_points = input("Enter available free points: ").strip()
+                if not free_points:
+                    free_points = "0"
+                free_points = int(free_points)
                 break
             except ValueError:
                 print_error("Please enter a valid integer.")
-    
-    # Get free points
-    while True:
+    else:
+        free_points = input("Enter available free points: ").strip() or "0"
+        
+        # Single validation pass over every integer field that create_manual consumes
+        errors = []
+        for info in ("Class level", "Profession level"):
+            try:
+                meta[info] = str(parse_small_int(meta.get(info, ""), 0))
+            except ValueError:
+                errors.append(f"{info}: '{meta[info]}' is not a valid integer")
+        for stat, value in raw_stats.items():
+            try:
+                stats[stat] = parse_small_int(value, 5)
+            except ValueError:
+                errors.append(f"{STAT_LABELS[stat]}: '{value}' is not a valid integer")
         try:
-            free_points = input("Enter available free points: ").strip()
-            if not free_points:
-                free_points = "0"
-            free_points = int(free_points)
-            break
+            free_points = parse_small_int(free_points, 0)
         except ValueError:
-            print_error("Please enter a valid integer.")
+            errors.append(f"Free points: '{free_points}' is not a valid integer")
+        
+        if errors:
+            print_error("Cannot create character - invalid input:")
+            for error in errors:
+                print_error(f"  {error}")
+            pause_screen()
+            return None
     
     # Create class and profession history if levels > 0 (only for regular characters)
     class_history = []
     profession_history = []
     
-    if character_type == "character":
+    if character_type is CharacterType.CHARACTER:
         class_level = int(meta.get("Class level", "0"))
         if class_level > 0 and meta.get("Class"):
             class_history = [{
@@ -715,41 +992,124 @@ def create_manual_character(item_repository) -> Character:
                 "to_level": None
             }]
     
-    # Create character with manual creation flag
-    print_loading("Creating manual character")
-    
-    # Create character using factory method
-    character = Character.create_manual(
-        name=name,
-        stats=stats,
-        meta=meta,
-        free_points=free_points,
-        tier_thresholds=tier_thresholds,
-        item_repository=item_repository
-    )
+    # Create character with manual creation flag using factory method
+    with Spinner("Creating manual character"):
+        character = Character.create_manual(
+            name=name,
+            stats=stats,
+            meta=meta,
+            free_points=free_points,
+            tier_thresholds=tier_thresholds,
+            item_repository=item_repository
+        )
     
-    print_success(f"Manual {character_type} {name} created successfully!")
+    print_success(f"Manual {character_type.label} {name} created successfully!")
     
     # For regular characters, show calculated race level
-    if character_type == "character":
+    if character_type is CharacterType.CHARACTER:
         print_info(f"Race level automatically calculated as: {character.data_manager.get_meta('Race level')}")
     
     # Show final character summary
     print_subheader("Character Summary")
-    print(f"Name: {character.name}")
-    for key, value in character.data_manager.get_all_meta().items():
-        print(f"{key}: {value}")
+    out = [f"Name: {character.name}"]
+    out.extend(f"{key}: {value}" for key, value in character.data_manager.iter_meta())
+    sys.stdout.write("\n".join(out) + "\n")
     
     print_subheader("Final Stats")
-    for stat in STATS:
-        print(f"{stat.capitalize()}: {character.data_manager.get_stat(stat)}")
-    
+    out = [f"{stat_name}: {character.data_manager.get_stat(stat)}" for stat, stat_name in zip(STATS, STATS_CAPITALIZED)]
     if character.level_system.free_points > 0:
-        print(f"Free Points: {character.level_system.free_points}")
+        out.append(f"Free Points: {character.level_system.free_points}")
+    sys.stdout.write("\n".join(out) + "\n")
     
     pause_screen()
     return character
 
+def build_race_history(meta: Dict[str, str], race_level: int) -> List[Dict[str, Any]]:
+    """
+    Prompt for the race history of a reverse-engineered character up to race_level.
+    May update meta["Race"] to match the last history entry if the user agrees.
+    """
+    race_history = []
+    current_race = meta.get("Race", "")
+    if race_level <= 0 or not current_race:
+        return race_history
+    
+    print_subheader("Race History Setup")
+    print(f"Character race level: {race_level}")
+    
+    # Check if character might have multiple races
+    if race_level > 5:  # Arbitrary threshold where race changes become likely
+        print_info("Characters at higher race levels may have undergone race changes.")
+        has_race_changes = confirm_action("Has this character changed races during their progression?")
+    else:
+        has_race_changes = False
+    
+    if has_race_changes:
+        print("You need to specify the race for different periods of character development:")
+        print("Note: Race levels are calculated as (Class Level + Profession Level) ÷ 2")
+        
+        print_subheader("Available Races")
+        print(format_race_menu("  "))
+        
+        exceeds_max_error = f"End level cannot exceed {race_level}."
+        race_level_start = 1
+        while race_level_start <= race_level:
+            print(f"\nRace from level {race_level_start} to level ?")
+            
+            # Get race for this period
+            period_race = None
+            while period_race is None:
+                period_race = match_race(input("Enter race (number or name): "))
+            
+            # Get end level for this race (if not the last period)
+            if race_level_start < race_level:
+                end_prompt = f"Race level {period_race} ends at level (max {race_level}): "
+                while True:
+                    try:
+                        end_input = input(end_prompt).strip()
+                        race_level_end = int(end_input)
+                        
+                        if race_level_end < race_level_start:
+                            print_error("End level must be >= start level.")
+                            continue
+                        elif race_level_end > race_level:
+                            print_error(exceeds_max_error)
+                            continue
+                        
+                        break
+                    except ValueError:
+                        print_error("Please enter a valid integer.")
+            else:
+                race_level_end = None  # Current race
+            
+            # Add race history entry
+            race_history.append({
+                "race": period_race,
+                "from_race_level": race_level_start,
+                "to_race_level": race_level_end
+            })
+            
+            if race_level_end is None:
+                break
+            else:
+                race_level_start = race_level_end + 1
+        
+        # Validate current race matches the last entry
+        last_race = race_history[-1]["race"] if race_history else None
+        if last_race is not None and last_race != current_race.lower():
+            print_warning(f"Current race ({current_race}) doesn't match last race history entry ({last_race})")
+            if confirm_action("Update current race to match history?"):
+                meta["Race"] = last_race
+    else:
+        # Single race throughout progression
+        race_history.append({
+            "race": current_race,
+            "from_race_level": 1,
+            "to_race_level": None
+        })
+    
+    return race_history
+
 def create_reverse_engineered_character(item_repository) -> Character:
     """Create a character that follows progression rules via reverse engineering."""
     # Only allow regular characters for reverse engineering
@@ -766,11 +1126,7 @@ def create_reverse_engineered_character(item_repository) -> Character:
     print()
     
     # Get character name
-    while True:
-        name = input("Enter character name: ").strip()
-        if name:
-            break
-        print_error("Name cannot be empty.")
+    name = prompt_nonempty("Enter character name: ")
     
     # Get tier thresholds
     print_subheader(f"Tier Thresholds for {name}")
@@ -780,14 +1136,8 @@ def create_reverse_engineered_character(item_repository) -> Character:
     while True:
         try:
             threshold_input = input("Enter tier thresholds (comma-separated): ").strip()
-            if not threshold_input:
-                tier_thresholds = DEFAULT_TIER_THRESHOLDS.copy()
-                break
-            else:
-                # Parse comma-separated values
-                tier_thresholds = [int(x.strip()) for x in threshold_input.split(',')]
-                tier_thresholds = sorted(list(set(tier_thresholds)))  # Remove duplicates and sort
-                break
+            tier_thresholds = parse_threshold_list(threshold_input, DEFAULT_TIER_THRESHOLDS)
+            break
         except ValueError:
             print_error("Please enter valid integers separated by commas.")
     
@@ -804,11 +1154,7 @@ def create_reverse_engineered_character(item_repository) -> Character:
         if info in ["Class level", "Profession level"]:
             while True:
                 try:
-                    value = input(f"{info}: ").strip()
-                    if not value:
-                        value = "0"
-                    int(value)  # Check if it's a valid integer
-                    meta[info] = value
+                    meta[info] = str(parse_small_int(input(f"{info}: "), 0))
                     break
                 except ValueError:
                     print_error("Please enter a valid integer.")
@@ -821,225 +1167,29 @@ def create_reverse_engineered_character(item_repository) -> Character:
     profession_level = int(meta.get("Profession level", "0"))
     calculated_race_level = (class_level + profession_level) // 2
     
-    print_info(f"Calculated race level: {calculated_race_level}")
-    
-    # Create class history if needed (existing logic)
     class_history = []
-    if class_level > 0:
-        current_class = meta.get("Class", "")
-        if current_class:
-            print_subheader("Class History Setup")
-            
-            # Determine how many tiers the character has progressed through
-            max_tier = get_tier_for_level(class_level, tier_thresholds)
-            
-            if max_tier > 1:
-                print(f"Character class level {class_level} spans {max_tier} tier(s)")
-                print("You need to specify the class for each tier:")
-                
-                level_start = 1
-                for tier in range(1, max_tier + 1):
-                    # Calculate level range for this tier
-                    if tier == 1:
-                        level_end = tier_thresholds[0] - 1 if tier_thresholds else class_level
-                    elif tier - 1 < len(tier_thresholds):
-                        level_end = min(tier_thresholds[tier - 1] - 1, class_level) if tier < len(tier_thresholds) + 1 else class_level
-                    else:
-                        level_end = class_level
-                    
-                    # Get available classes for this tier
-                    available_classes = get_available_classes_for_tier(tier)
-                    if not available_classes:
-                        print_error(f"No classes available for tier {tier}!")
-                        pause_screen()
-                        return None
-                    
-                    print(f"\nTier {tier} (levels {level_start}-{min(level_end, class_level)}):")
-                    print("Available classes:")
-                    for i, class_name in enumerate(available_classes, 1):
-                        print(f"  {i}. {class_name}")
-                    
-                    if tier == max_tier and current_class:
-                        tier_class = current_class
-                        print(f"Using current class: {tier_class}")
-                    else:
-                        while True:
-                            tier_class = input(f"Enter tier {tier} class: ").strip()
-                            if validate_class_tier_combination(tier_class, tier):
-                                break
-                            print_error(f"Invalid class '{tier_class}' for tier {tier}")
-                    
-                    class_history.append({
-                        "class": tier_class,
-                        "from_level": level_start,
-                        "to_level": min(level_end, class_level) if tier < max_tier else None
-                    })
-                    
-                    level_start = level_end + 1
-            else:
-                # Single tier character
-                class_history.append({
-                    "class": current_class,
-                    "from_level": 1,
-                    "to_level": None
-                })
-    
-    # Create profession history if needed (existing logic)
     profession_history = []
-    if profession_level > 0:
-        current_profession = meta.get("Profession", "")
-        if current_profession:
-            print_subheader("Profession History Setup")
-            
-            # Determine how many tiers the character has progressed through
-            max_tier = get_tier_for_level(profession_level, tier_thresholds)
-            
-            if max_tier > 1:
-                print(f"Character profession level {profession_level} spans {max_tier} tier(s)")
-                print("You need to specify the profession for each tier:")
-                
-                level_start = 1
-                for tier in range(1, max_tier + 1):
-                    # Calculate level range for this tier
-                    if tier == 1:
-                        level_end = tier_thresholds[0] - 1 if tier_thresholds else profession_level
-                    elif tier - 1 < len(tier_thresholds):
-                        level_end = min(tier_thresholds[tier - 1] - 1, profession_level) if tier < len(tier_thresholds) + 1 else profession_level
-                    else:
-                        level_end = profession_level
-                    
-                    # Get available professions for this tier
-                    available_professions = get_available_professions_for_tier(tier)
-                    if not available_professions:
-                        print_error(f"No professions available for tier {tier}!")
-                        pause_screen()
-                        return None
-                    
-                    print(f"\nTier {tier} (levels {level_start}-{min(level_end, profession_level)}):")
-                    print("Available professions:")
-                    for i, profession_name in enumerate(available_professions, 1):
-                        print(f"  {i}. {profession_name}")
-                    
-                    if tier == max_tier and current_profession:
-                        tier_profession = current_profession
-                        print(f"Using current profession: {tier_profession}")
-                    else:
-                        while True:
-                            tier_profession = input(f"Enter tier {tier} profession: ").strip()
-                            if validate_profession_tier_combination(tier_profession, tier):
-                                break
-                            print_error(f"Invalid profession '{tier_profession}' for tier {tier}")
-                    
-                    profession_history.append({
-                        "profession": tier_profession,
-                        "from_level": level_start,
-                        "to_level": min(level_end, profession_level) if tier < max_tier else None
-                    })
-                    
-                    level_start = level_end + 1
-            else:
-                # Single tier character
-                profession_history.append({
-                    "profession": current_profession,
-                    "from_level": 1,
-                    "to_level": None
-                })
-    
-    # Create race history if needed (following same pattern)
     race_history = []
-    if calculated_race_level > 0:
-        current_race = meta.get("Race", "")
-        if current_race:
-            print_subheader("Race History Setup")
-            print(f"Character race level: {calculated_race_level}")
-            
-            # Check if character might have multiple races
-            if calculated_race_level > 5:  # Arbitrary threshold where race changes become likely
-                print_info("Characters at higher race levels may have undergone race changes.")
-                has_race_changes = confirm_action("Has this character changed races during their progression?")
-            else:
-                has_race_changes = False
-            
-            if has_race_changes:
-                print("You need to specify the race for different periods of character development:")
-                print("Note: Race levels are calculated as (Class Level + Profession Level) ÷ 2")
-                
-                # Get available races
-                available_races = list(races.keys())
-                print_subheader("Available Races")
-                for i, race in enumerate(available_races, 1):
-                    print(f"  {i}. {race}")
-                
-                race_level_start = 1
-                while race_level_start <= calculated_race_level:
-                    print(f"\nRace from level {race_level_start} to level ?")
-                    
-                    # Get race for this period
-                    while True:
-                        race_choice = input("Enter race (number or name): ").strip()
-                        
-                        # Try to parse as number first
-                        try:
-                            race_num = int(race_choice)
-                            if 1 <= race_num <= len(available_races):
-                                period_race = available_races[race_num - 1]
-                                break
-                            else:
-                                print_error(f"Please enter a number between 1 and {len(available_races)}")
-                                continue
-                        except ValueError:
-                            # Try to match by name
-                            period_race = race_choice.lower()
-                            if period_race in available_races:
-                                break
-                            else:
-                                print_error(f"Invalid race: {race_choice}")
-                                continue
-                    
-                    # Get end level for this race (if not the last period)
-                    if race_level_start < calculated_race_level:
-                        while True:
-                            try:
-                                end_input = input(f"Race level {period_race} ends at level (max {calculated_race_level}): ").strip()
-                                race_level_end = int(end_input)
-                                
-                                if race_level_end < race_level_start:
-                                    print_error("End level must be >= start level.")
-                                    continue
-                                elif race_level_end > calculated_race_level:
-                                    print_error(f"End level cannot exceed {calculated_race_level}.")
-                                    continue
-                                
-                                break
-                            except ValueError:
-                                print_error("Please enter a valid integer.")
-                    else:
-                        race_level_end = None  # Current race
-                    
-                    # Add race history entry
-                    race_history.append({
-                        "race": period_race,
-                        "from_race_level": race_level_start,
-                        "to_race_level": race_level_end
-                    })
-                    
-                    if race_level_end is None:
-                        break
-                    else:
-                        race_level_start = race_level_end + 1
-                
-                # Validate current race matches the last entry
-                if race_history and race_history[-1]["race"] != current_race.lower():
-                    print_warning(f"Current race ({current_race}) doesn't match last race history entry ({race_history[-1]['race']})")
-                    if confirm_action("Update current race to match history?"):
-                        meta["Race"] = race_history[-1]["race"]
-            else:
-                # Single race throughout progression
-                race_history.append({
-                    "race": current_race,
-                    "from_race_level": 1,
-                    "to_race_level": None
-                })
+    
+    # No class or profession levels means no tiers crossed and race level 0: nothing to set up
+    if class_level > 0 or profession_level > 0:
+        print_info(f"Calculated race level: {calculated_race_level}")
+        
+        # Create class and profession history if needed
+        if class_level > 0 and meta.get("Class", ""):
+            class_history = build_tier_history("class", meta["Class"], class_level, tier_thresholds,
+                                               validate_current=False)
+            if class_history is None:
+                return None
+        
+        if profession_level > 0 and meta.get("Profession", ""):
+            profession_history = build_tier_history("profession", meta["Profession"], profession_level, tier_thresholds,
+                                                    validate_current=False)
+            if profession_history is None:
+                return None
+        
+        # Create race history if needed (following same pattern)
+        race_history = build_race_history(meta, calculated_race_level)
     
     # Get base stats (existing logic)
     print_subheader(f"Enter BASE stats for {name}")
@@ -1047,17 +1197,13 @@ def create_reverse_engineered_character(item_repository) -> Character:
     print_info("(e.g., what they rolled for stats, or their starting values)")
     print_warning("Do NOT include class, profession, race, or free point bonuses!")
     
-    base_stats = {}
-    for stat in STATS:
-        while True:
-            try:
-                value = input(f"Base {stat.capitalize()}: ").strip()
-                if not value:
-                    value = "5"  # Default value
-                base_stats[stat] = int(value)
-                break
-            except ValueError:
-                print_error("Please enter a valid integer.")
+    try:
+        base_stats = dict(zip(STATS, read_stats_block([f"Base {prompt}" for prompt in _STAT_PROMPTS],
+                                                      (5,) * len(STATS))))
+    except ValueError as e:
+        print_error(f"Cannot create character - {e}")
+        pause_screen()
+        return None
     
     # Show base stats summary
     print_subheader("Base Stats Summary")
@@ -1072,25 +1218,43 @@ def create_reverse_engineered_character(item_repository) -> Character:
     print_warning("These should be the stats the character actually has right now!")
     
     current_stats = {}
-    for stat in STATS:
-        while True:
-            try:
-                # Show base stat as reference
-                base_value = base_stats[stat]
-                value = input(f"Current {stat.capitalize()} (base: {base_value}): ").strip()
-                if not value:
-                    value = str(base_value)  # Default to base stat if empty
-                current_value = int(value)
-                
-                # Sanity check - current should generally be >= base
-                if current_value < base_value:
-                    if not confirm_action(f"Current {stat} ({current_value}) is less than base ({base_value}). Continue?"):
-                        continue
-                
-                current_stats[stat] = current_value
-                break
-            except ValueError:
-                print_error("Please enter a valid integer.")
+    if not sys.stdin.isatty():
+        # Piped input: read the whole block at once; with no one to confirm, bad values stop creation
+        labels = [f"Current {stat_name} (base: {base_stats[stat]}): " for stat, stat_name in zip(STATS, STATS_CAPITALIZED)]
+        try:
+            current_stats = dict(zip(STATS, read_stats_block(labels, [base_stats[stat] for stat in STATS])))
+        except ValueError as e:
+            print_error(f"Cannot create character - {e}")
+            pause_screen()
+            return None
+        below_base = [f"Current {stat} ({current_stats[stat]}) is less than base ({base_stats[stat]})."
+                      for stat in STATS if current_stats[stat] < base_stats[stat]]
+        if below_base:
+            print_error("Cannot create character - invalid input:")
+            for error in below_base:
+                print_error(f"  {error}")
+            pause_screen()
+            return None
+    else:
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+            while True:
+                try:
+                    # Show base stat as reference
+                    base_value = base_stats[stat]
+                    value = input(f"Current {stat_name} (base: {base_value}): ").strip()
+                    if not value:
+                        value = str(base_value)  # Default to base stat if empty
+                    current_value = int(value)
+                    
+                    # Sanity check - current should generally be >= base
+                    if current_value < base_value:
+                        if not confirm_action(f"Current {stat} ({current_value}) is less than base ({base_value}). Continue?"):
+                            continue
+                    
+                    current_stats[stat] = current_value
+                    break
+                except ValueError:
+                    print_error("Please enter a valid integer.")
     
     # Show current stats summary and differences
     print_subheader("Current Stats Summary")
@@ -1098,12 +1262,10 @@ def create_reverse_engineered_character(item_repository) -> Character:
     total_difference = total_current - total_base
     
     print("Current stats vs Base stats:")
-    for stat in STATS:
+    for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
         base = base_stats[stat]
         current = current_stats[stat]
-        diff = current - base
-        diff_str = f"+{diff}" if diff >= 0 else str(diff)
-        print(f"  {stat.capitalize()}: {current} (base: {base}, difference: {diff_str})")
+        print(f"  {stat_name}: {current} (base: {base}, difference: {current - base:+d})")
     
     print(f"\nTotal current stat points: {total_current}")
     print(f"Total difference from base: +{total_difference}")
@@ -1113,19 +1275,31 @@ def create_reverse_engineered_character(item_repository) -> Character:
     print_info("Enter any free points that are currently unallocated")
     print_info("(These are free points the character has but hasn't spent yet)")
     
-    while True:
+    if not sys.stdin.isatty():
         try:
-            free_points_input = input("Enter remaining unallocated free points (default: 0): ").strip()
-            if not free_points_input:
-                free_points = 0
-            else:
-                free_points = int(free_points_input)
-                if free_points < 0:
-                    print_error("Free points cannot be negative.")
-                    continue
-            break
-        except ValueError:
-            print_error("Please enter a valid integer.")
+            free_points, = read_stats_block(["Remaining free points:"], (0,))
+        except ValueError as e:
+            print_error(f"Cannot create character - {e}")
+            pause_screen()
+            return None
+        if free_points < 0:
+            print_error("Cannot create character - free points cannot be negative.")
+            pause_screen()
+            return None
+    else:
+        while True:
+            try:
+                free_points_input = input("Enter remaining unallocated free points (default: 0): ").strip()
+                if not free_points_input:
+                    free_points = 0
+                else:
+                    free_points = int(free_points_input)
+                    if free_points < 0:
+                        print_error("Free points cannot be negative.")
+                        continue
+                break
+            except ValueError:
+                print_error("Please enter a valid integer.")
     
     # Preview what will happen (updated to include race history and auto-correction)
     print_subheader("Preview")
@@ -1143,203 +1317,171 @@ def create_reverse_engineered_character(item_repository) -> Character:
         return None
     
     # Create character using factory method (updated to include race_history)
-    print_loading("Creating character and reverse-engineering stat allocation")
-    
     try:
-        character = Character.create_reverse_engineered(
-            name=name,
-            base_stats=base_stats,
-            current_stats=current_stats,
-            meta=meta,
-            free_points=free_points,
-            tier_thresholds=tier_thresholds,
-            class_history=class_history,
-            profession_history=profession_history,
-            race_history=race_history,  # Include race history
-            item_repository=item_repository
-        )
+        with Spinner("Creating character and reverse-engineering stat allocation"):
+            character = Character.create_reverse_engineered(
+                name=name,
+                base_stats=base_stats,
+                current_stats=current_stats,
+                meta=meta,
+                free_points=free_points,
+                tier_thresholds=tier_thresholds,
+                class_history=class_history,
+                profession_history=profession_history,
+                race_history=race_history,  # Include race history
+                item_repository=item_repository
+            )
         
         print_success(f"Reverse-engineered character {name} created successfully!")
         
-        # Show reverse engineering results (updated to show race history)
-        print_subheader("Reverse Engineering Results")
-        
-        # Use StatValidator to get the analysis
-        validator = StatValidator(character)
-        analysis = validator.reverse_engineer_stat_allocation(base_stats, current_stats)
-        
-        # Display expected bonuses
-        expected_bonuses = analysis["expected_bonuses"]
-        print_colored("Expected Progression Bonuses:", 'cyan', True)
-        
-        if expected_bonuses["class_free_points"] > 0 or any(expected_bonuses["class"].values()):
-            print("Class bonuses:")
-            for stat, bonus in expected_bonuses["class"].items():
-                if bonus > 0:
-                    print(f"  {stat.capitalize()}: +{bonus}")
-            if expected_bonuses["class_free_points"] > 0:
-                print(f"  Free Points: +{expected_bonuses['class_free_points']}")
-        
-        if expected_bonuses["profession_free_points"] > 0 or any(expected_bonuses["profession"].values()):
-            print("Profession bonuses:")
-            for stat, bonus in expected_bonuses["profession"].items():
-                if bonus > 0:
-                    print(f"  {stat.capitalize()}: +{bonus}")
-            if expected_bonuses["profession_free_points"] > 0:
-                print(f"  Free Points: +{expected_bonuses['profession_free_points']}")
-        
-        if expected_bonuses["race_free_points"] > 0 or any(expected_bonuses["race"].values()):
-            print("Race bonuses (using race history):")
-            for stat, bonus in expected_bonuses["race"].items():
-                if bonus > 0:
-                    print(f"  {stat.capitalize()}: +{bonus}")
-            if expected_bonuses["race_free_points"] > 0:
-                print(f"  Free Points: +{expected_bonuses['race_free_points']}")
-        
-        # Display race history used
-        if character.data_manager.race_history:
-            print_colored("\nRace History Applied:", 'cyan', True)
-            for entry in character.data_manager.race_history:
-                level_range = f"Race Level {entry['from_race_level']}"
-                if entry['to_race_level'] is not None:
-                    level_range += f"-{entry['to_race_level']}"
-                else:
-                    level_range += "+"
-                print(f"  {entry['race']}: {level_range}")
-        
-        # Display free points analysis (updated to show auto-correction)
-        print_colored("\nFree Points Analysis:", 'cyan', True)
-        print(f"Total free points from progression: {analysis['total_expected_free_points']}")
-        print(f"Free points used in stat allocation: {analysis['total_free_points_used']}")
-        
-        # Check if free points were auto-corrected
-        expected_remaining = analysis['remaining_free_points']
-        actual_remaining = character.level_system.free_points
-        
-        if actual_remaining != free_points:
-            print(f"Provided remaining free points: {free_points}")
-            print(f"Auto-corrected remaining free points: {actual_remaining}")
-            print_success(f"✓ Added {actual_remaining - free_points} missing free points")
-        else:
-            print(f"Remaining free points: {actual_remaining}")
-        
-        # Show the math
-        total_accounted = analysis['total_free_points_used'] + actual_remaining
-        if total_accounted == analysis['total_expected_free_points']:
-            print_success(f"✓ Free points balance correctly: {analysis['total_free_points_used']} + {actual_remaining} = {analysis['total_expected_free_points']}")
-        else:
-            discrepancy = analysis['total_expected_free_points'] - total_accounted
-            if discrepancy > 0:
-                print_warning(f"⚠ Still missing {discrepancy} free points after correction")
+        with buffered_output():
+            # Show reverse engineering results (updated to show race history)
+            print_subheader("Reverse Engineering Results")
+            
+            # Use StatValidator to get the analysis
+            validator = StatValidator(character)
+            analysis = validator.reverse_engineer_stat_allocation(base_stats, current_stats)
+            
+            # Display expected bonuses
+            expected_bonuses = analysis["expected_bonuses"]
+            print_colored("Expected Progression Bonuses:", 'cyan', True)
+            
+            for source, title in (("class", "Class bonuses:"),
+                                  ("profession", "Profession bonuses:"),
+                                  ("race", "Race bonuses (using race history):")):
+                positive = _positives(expected_bonuses[source])
+                source_free_points = expected_bonuses[f"{source}_free_points"]
+                if positive or source_free_points > 0:
+                    print(title)
+                    for stat, bonus in positive:
+                        print(f"  {STAT_LABELS[stat]}: +{bonus}")
+                    if source_free_points > 0:
+                        print(f"  Free Points: +{source_free_points}")
+            
+            # Display race history used
+            if character.data_manager.race_history:
+                print_colored("\nRace History Applied:", 'cyan', True)
+                for entry in character.data_manager.race_history:
+                    level_range = f"Race Level {entry['from_race_level']}"
+                    if entry['to_race_level'] is not None:
+                        level_range += f"-{entry['to_race_level']}"
+                    else:
+                        level_range += "+"
+                    print(f"  {entry['race']}: {level_range}")
+            
+            # Display free points analysis (updated to show auto-correction)
+            print_colored("\nFree Points Analysis:", 'cyan', True)
+            print(f"Total free points from progression: {analysis['total_expected_free_points']}")
+            print(f"Free points used in stat allocation: {analysis['total_free_points_used']}")
+            
+            # Check if free points were auto-corrected
+            expected_remaining = analysis['remaining_free_points']
+            actual_remaining = character.level_system.free_points
+            
+            if actual_remaining != free_points:
+                print(f"Provided remaining free points: {free_points}")
+                print(f"Auto-corrected remaining free points: {actual_remaining}")
+                print_success(f"✓ Added {actual_remaining - free_points} missing free points")
+            else:
+                print(f"Remaining free points: {actual_remaining}")
+            
+            # Show the math
+            total_accounted = analysis['total_free_points_used'] + actual_remaining
+            if total_accounted == analysis['total_expected_free_points']:
+                print_success(f"✓ Free points balance correctly: {analysis['total_free_points_used']} + {actual_remaining} = {analysis['total_expected_free_points']}")
             else:
-                print_warning(f"⚠ Character has {abs(discrepancy)} excess free points")
-        
-        # Display detailed stat allocation
-        print_colored("\nDetailed Stat Allocation:", 'cyan', True)
-        for stat in STATS:
-            stat_analysis = analysis["stat_allocations"][stat]
-            base = stat_analysis["base"]
-            class_bonus = stat_analysis["class_bonus"]
-            profession_bonus = stat_analysis["profession_bonus"]
-            race_bonus = stat_analysis["race_bonus"]
-            free_points_used = stat_analysis["free_points_allocated"]
-            current = stat_analysis["current"]
+                discrepancy = analysis['total_expected_free_points'] - total_accounted
+                if discrepancy > 0:
+                    print_warning(f"⚠ Still missing {discrepancy} free points after correction")
+                else:
+                    print_warning(f"⚠ Character has {abs(discrepancy)} excess free points")
             
-            # Build breakdown string
-            parts = [f"Base: {base}"]
-            if class_bonus > 0:
-                parts.append(f"Class: +{class_bonus}")
-            if profession_bonus > 0:
-                parts.append(f"Profession: +{profession_bonus}")
-            if race_bonus > 0:
-                parts.append(f"Race: +{race_bonus}")
-            if free_points_used > 0:
-                parts.append(f"Free Points: +{free_points_used}")
+            # Display detailed stat allocation
+            print_colored("\nDetailed Stat Allocation:", 'cyan', True)
+            error = print_error
+            impossible_allocations = []  # reported after the validation results
+            for row, stat_name in zip(stat_allocation_rows(analysis["stat_allocations"]), STATS_CAPITALIZED):
+                # Build breakdown string
+                breakdown = format_stat_breakdown(row.base, (
+                    ("Class", row.class_bonus),
+                    ("Profession", row.profession_bonus),
+                    ("Race", row.race_bonus),
+                    ("Free Points", row.free_points_allocated)
+                ))
+                print(f"{stat_name}: {breakdown} = {row.current}")
+                
+                # Check for discrepancies
+                if row.discrepancy < 0:
+                    error(f"  ⚠ ISSUE: {row.stat} requires {abs(row.discrepancy)} more points than available!")
+                    impossible_allocations.append(f"{row.stat}: needs {abs(row.discrepancy)} more points")
             
-            breakdown = " + ".join(parts)
-            print(f"{stat.capitalize()}: {breakdown} = {current}")
+            # Validate the character (updated to account for auto-correction)
+            print_subheader("Validation Results")
+            validation_result = character.validate_stats()
             
-            # Check for discrepancies
-            if stat_analysis["discrepancy"] < 0:
-                print_error(f"  ⚠ ISSUE: {stat} requires {abs(stat_analysis['discrepancy'])} more points than available!")
-        
-        # Validate the character (updated to account for auto-correction)
-        print_subheader("Validation Results")
-        validation_result = character.validate_stats()
-        
-        if validation_result["valid"]:
-            print_success("✓ Character validation passed!")
-            print_info("All stat allocations follow progression rules correctly.")
-        else:
-            print_error("✗ Character validation failed!")
-            print_warning("There are issues with the stat allocation:")
+            if validation_result["valid"]:
+                print_success("✓ Character validation passed!")
+                print_info("All stat allocations follow progression rules correctly.")
+            else:
+                print_error("✗ Character validation failed!")
+                print_warning("There are issues with the stat allocation:")
+                
+                if validation_result.get("stat_discrepancies"):
+                    for stat, issue in validation_result["stat_discrepancies"].items():
+                        print_error(f"  {stat}: {issue}")
+                
+                # Check if free points are still mismatched after auto-correction
+                fp_info = validation_result.get("free_points", {})
+                if not fp_info.get("free_points_match", True):
+                    expected = fp_info.get('calculated_remaining', 0)
+                    actual = fp_info.get('actual_remaining', 0)
+                    if expected != actual:
+                        print_error(f"  Free points still mismatched after auto-correction: expected {expected}, got {actual}")
+                        print_info("    This suggests an error in the progression rules or input data")
             
-            if validation_result.get("stat_discrepancies"):
-                for stat, issue in validation_result["stat_discrepancies"].items():
-                    print_error(f"  {stat}: {issue}")
+            # Additional check for impossible stat allocations (collected in the allocation loop)
+            if impossible_allocations:
+                print_error("✗ Impossible stat allocations detected:")
+                for allocation in impossible_allocations:
+                    print_error(f"  {allocation}")
+                print_info("These stats require more points than available from progression rules")
             
-            # Check if free points are still mismatched after auto-correction
-            fp_info = validation_result.get("free_points", {})
-            if not fp_info.get("free_points_match", True):
-                expected = fp_info.get('calculated_remaining', 0)
-                actual = fp_info.get('actual_remaining', 0)
-                if expected != actual:
-                    print_error(f"  Free points still mismatched after auto-correction: expected {expected}, got {actual}")
-                    print_info("    This suggests an error in the progression rules or input data")
-        
-        # Additional check for impossible stat allocations
-        impossible_allocations = []
-        for stat in STATS:
-            stat_analysis = analysis["stat_allocations"][stat]
-            if stat_analysis["discrepancy"] < 0:
-                impossible_allocations.append(f"{stat}: needs {abs(stat_analysis['discrepancy'])} more points")
-        
-        if impossible_allocations:
-            print_error("✗ Impossible stat allocations detected:")
-            for allocation in impossible_allocations:
-                print_error(f"  {allocation}")
-            print_info("These stats require more points than available from progression rules")
-        
-        # Show final character summary (existing logic)
-        print_subheader("Character Summary")
-        print(f"Name: {character.name}")
-        
-        for key, value in character.data_manager.get_all_meta().items():
-            print(f"{key}: {value}")
-        
-        print("\nFinal Stats:")
-        for stat in STATS:
-            sources = character.data_manager.get_stat_sources(stat)
-            current = character.data_manager.get_stat(stat)
-            modifier = character.data_manager.get_stat_modifier(stat)
+            # Show final character summary (existing logic)
+            print_subheader("Character Summary")
+            print(f"Name: {character.name}")
+            
+            print(format_meta_block(character.data_manager.iter_meta()))
+            
+            print("\nFinal Stats:")
+            for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+                sources = character.data_manager.get_stat_sources(stat)
+                current = character.data_manager.get_stat(stat)
+                modifier = character.data_manager.get_stat_modifier(stat)
+                
+                # Show sources if more than just base
+                if has_multi_source(sources):
+                    source_parts = [f"{source}: {value}" for source, value in sources.items() if value > 0]
+                    source_str = " (" + " + ".join(source_parts) + ")"
+                    print(f"  {stat_name}: {current}{source_str} (modifier: {modifier})")
+                else:
+                    print(f"  {stat_name}: {current} (modifier: {modifier})")
+            
+            if character.level_system.free_points > 0:
+                print(f"\nUnallocated Free Points: {character.level_system.free_points}")
             
-            # Show sources if more than just base
-            if len([s for s, v in sources.items() if v > 0]) > 1:
-                source_parts = []
-                for source, value in sources.items():
-                    if value > 0:
-                        source_parts.append(f"{source}: {value}")
-                source_str = " (" + " + ".join(source_parts) + ")"
-                print(f"  {stat.capitalize()}: {current}{source_str} (modifier: {modifier})")
+            # Final success message (updated to account for auto-correction)
+            print()
+            if validation_result["valid"]:
+                print_success("🎉 Reverse-engineered character created and validated successfully!")
+                if character.level_system.free_points > free_points:
+                    print_info(f"💡 Auto-corrected free points from {free_points} to {character.level_system.free_points}")
+                print_info("This character can now be used normally in the system.")
+            elif impossible_allocations:
+                print_error("❌ Character creation failed due to impossible stat allocations.")
+                print_info("Please review your input data - the current stats require more points than the progression rules provide.")
             else:
-                print(f"  {stat.capitalize()}: {current} (modifier: {modifier})")
-        
-        if character.level_system.free_points > 0:
-            print(f"\nUnallocated Free Points: {character.level_system.free_points}")
-        
-        # Final success message (updated to account for auto-correction)
-        print()
-        if validation_result["valid"]:
-            print_success("🎉 Reverse-engineered character created and validated successfully!")
-            if character.level_system.free_points > free_points:
-                print_info(f"💡 Auto-corrected free points from {free_points} to {character.level_system.free_points}")
-            print_info("This character can now be used normally in the system.")
-        elif impossible_allocations:
-            print_error("❌ Character creation failed due to impossible stat allocations.")
-            print_info("Please review your input data - the current stats require more points than the progression rules provide.")
-        else:
-            print_warning("⚠ Character created but has validation issues.")
-            print_info("You may want to review the input data and try again.")
+                print_warning("⚠ Character created but has validation issues.")
+                print_info("You may want to review the input data and try again.")
         
         pause_screen()
         return character
@@ -1391,79 +1533,90 @@ def load_character(item_repository) -> Tuple[Optional[Character], Optional[str]]
 def view_character(character: Character):
     """Display detailed character information."""
     clear_screen()
-    character_type = character.data_manager.get_meta("Character Type", "character")
-    print_header(f"Character Details: {character.name} ({character_type.capitalize()})")
-    
-    # Meta information
-    print_subheader("Character Info")
-    for meta, value in character.data_manager.get_all_meta().items():
-        print(f"{meta}: {value}")
-    
-    # Stats
-    print_subheader("Stats")
-    for stat in STATS:
-        sources = character.data_manager.get_stat_sources(stat)
-        current = character.data_manager.get_stat(stat)
-        modifier = character.data_manager.get_stat_modifier(stat)
+    with buffered_output():
+        ctype = character.data_manager.get_meta("Character Type", "character").capitalize()
+        print_header(f"Character Details: {character.name} ({ctype})")
+        
+        # Meta information
+        print_subheader("Character Info")
+        print(format_meta_block(character.data_manager.iter_meta()))
+        
+        # Stats
+        print_subheader("Stats")
+        dm = character.data_manager
+        get_sources, get_stat, get_mod = dm.get_stat_sources, dm.get_stat, dm.get_stat_modifier
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+            sources = get_sources(stat)
+            current = get_stat(stat)
+            modifier = get_mod(stat)
+            
+            # Format source breakdown if more than just base (sources is a copy, so popping is safe)
+            has_extra_sources = len(sources) > 1
+            base = sources.pop("base", 0)
+            if has_extra_sources:
+                source_str = " (" + " + ".join(f"{source}: {value}" for source, value in sources.items() if value != 0) + ")"
+                print(f"{stat_name}: {base}{source_str} = {current} (modifier: {modifier})")
+            else:
+                print(f"{stat_name}: {current} (modifier: {modifier})")
+        
+        # Health
+        print_subheader("Health")
+        print(f"Current Health: {character.health_manager.current_health}/{character.health_manager.max_health}")
+        
+        # FIXED: Always show free points, regardless of value
+        print_subheader("Free Points")
+        free_points = character.level_system.free_points
+        if free_points > 0:
+            print_colored(f"Available: {free_points}", 'green')
+        elif free_points == 0:
+            print_colored("Available: 0", 'yellow')
+        else:
+            print_colored(f"Balance: {free_points} (overspent)", 'red')
+            print_info("Negative free points indicate more points were allocated than earned from progression.")
+        
+        # Blessing
+        if hasattr(character, 'blessing') and character.blessing:
+            print_subheader("Blessing")
+            for stat, value in character.blessing.items():
+                print(f"{STAT_LABELS[stat]}: +{value}")
         
-        # Format source breakdown if more than just base
-        if len(sources) > 1:
-            source_str = " (" + " + ".join(f"{source}: {value}" for source, value in sources.items() if source != "base" and value != 0) + ")"
-            print(f"{stat.capitalize()}: {sources.get('base', 0)}{source_str} = {current} (modifier: {modifier})")
+        # Inventory
+        print_subheader("Equipped Items")
+        equipped_items = character.inventory.get_equipped_items()
+        if equipped_items:
+            for item in equipped_items:
+                print(f"{item.name}: {item.description}")
+                if item.stats:
+                    print("  Stats: " + ", ".join(f"{s}: +{v}" for s, v in item.stats.items()))
         else:
-            print(f"{stat.capitalize()}: {current} (modifier: {modifier})")
-    
-    # Health
-    print_subheader("Health")
-    print(f"Current Health: {character.health_manager.current_health}/{character.health_manager.max_health}")
-    
-    # FIXED: Always show free points, regardless of value
-    print_subheader("Free Points")
-    free_points = character.level_system.free_points
-    if free_points > 0:
-        print_colored(f"Available: {free_points}", 'green')
-    elif free_points == 0:
-        print_colored("Available: 0", 'yellow')
-    else:
-        print_colored(f"Balance: {free_points} (overspent)", 'red')
-        print_info("Negative free points indicate more points were allocated than earned from progression.")
-    
-    # Blessing
-    if hasattr(character, 'blessing') and character.blessing:
-        print_subheader("Blessing")
-        for stat, value in character.blessing.items():
-            print(f"{stat.capitalize()}: +{value}")
-    
-    # Inventory
-    print_subheader("Equipped Items")
-    equipped_items = character.inventory.get_equipped_items()
-    if equipped_items:
-        for item in equipped_items:
-            print(f"{item.name}: {item.description}")
-            if item.stats:
-                print("  Stats: " + ", ".join(f"{s}: +{v}" for s, v in item.stats.items()))
-    else:
-        print("No items equipped.")
+            print("No items equipped.")
     
     pause_screen()
 
 def view_character_history(character: Character):
     """Display character's class, profession, and race history."""
     clear_screen()
-    character_type = character.data_manager.get_meta("Character Type", "character")
-    print_header(f"Character History: {character.name} ({character_type.capitalize()})")
+    with buffered_output():
+        print_character_history(character)
+    pause_screen()
+
+def print_character_history(character: Character):
+    """Print the history screen body for view_character_history."""
+    dm = character.data_manager
+    ctype = dm.get_meta("Character Type", "character").capitalize()
+    print_header(f"Character History: {character.name} ({ctype})")
     
     # NEW: For familiars/monsters, show different information
     if character.is_race_leveling_type():
         print_subheader("Race Progression")
-        race_level = int(character.data_manager.get_meta("Race level", "0"))
-        race = character.data_manager.get_meta("Race", "")
+        race_level = dm.get_meta_int("Race level")
+        race = dm.get_meta("Race", "")
         print(f"Race: {race}")
         print(f"Race Level: {race_level}")
         
-        if character.data_manager.race_history:
+        if dm.race_history:
             print_subheader("Race History")
-            for entry in character.data_manager.race_history:
+            for entry in dm.race_history:
                 level_range = f"Race Level {entry['from_race_level']}"
                 if entry['to_race_level'] is not None:
                     level_range += f"-{entry['to_race_level']}"
@@ -1472,16 +1625,15 @@ def view_character_history(character: Character):
                 print(f"  {entry['race']} ({level_range})")
         else:
             print_info("No race history changes.")
-        
-        pause_screen()
         return
     
     # Display tier thresholds and summary for regular characters
     print_subheader("Tier Information")
-    print(f"Tier thresholds: {character.data_manager.tier_thresholds}")
+    tier_thresholds = dm.tier_thresholds
+    print(f"Tier thresholds: {tier_thresholds}")
     
     # Show tier summary
-    tier_summary = get_tier_summary(character.data_manager.tier_thresholds)
+    tier_summary = get_tier_summary(tier_thresholds)
     for tier, info in tier_summary.items():
         level_range = info["level_range"]
         if level_range[1] == 999:
@@ -1490,38 +1642,47 @@ def view_character_history(character: Character):
             range_str = f"{level_range[0]}-{level_range[1]}"
         print(f"  Tier {tier}: Level {range_str}")
     
+    # Tier per starting level, shared by the class and profession loops
+    tier_cache = {}
+    
     # Display class history
-    if character.data_manager.class_history:
+    if dm.class_history:
         print_subheader("Class History")
-        for entry in character.data_manager.class_history:
+        for entry in dm.class_history:
             level_range = f"Level {entry['from_level']}"
             if entry['to_level'] is not None:
                 level_range += f"-{entry['to_level']}"
             else:
                 level_range += "+"
-            tier = get_tier_for_level(entry['from_level'], character.data_manager.tier_thresholds)
+            level = entry['from_level']
+            tier = tier_cache.get(level)
+            if tier is None:
+                tier = tier_cache[level] = get_tier_for_level(level, tier_thresholds)
             print(f"  {entry['class']} ({level_range}) [Tier {tier}]")
     else:
         print_info("No class history available.")
     
     # Display profession history
-    if character.data_manager.profession_history:
+    if dm.profession_history:
         print_subheader("Profession History")
-        for entry in character.data_manager.profession_history:
+        for entry in dm.profession_history:
             level_range = f"Level {entry['from_level']}"
             if entry['to_level'] is not None:
                 level_range += f"-{entry['to_level']}"
             else:
                 level_range += "+"
-            tier = get_tier_for_level(entry['from_level'], character.data_manager.tier_thresholds)
+            level = entry['from_level']
+            tier = tier_cache.get(level)
+            if tier is None:
+                tier = tier_cache[level] = get_tier_for_level(level, tier_thresholds)
             print(f"  {entry['profession']} ({level_range}) [Tier {tier}]")
     else:
         print_info("No profession history available.")
     
     # Display race history
-    if character.data_manager.race_history:
+    if dm.race_history:
         print_subheader("Race History")
-        for entry in character.data_manager.race_history:
+        for entry in dm.race_history:
             level_range = f"Race Level {entry['from_race_level']}"
             if entry['to_race_level'] is not None:
                 level_range += f"-{entry['to_race_level']}"
@@ -1530,28 +1691,29 @@ def view_character_history(character: Character):
             print(f"  {entry['race']} ({level_range})")
     else:
         print_info("No race history available.")
-    
-    pause_screen()
 
 def manage_race_history(character: Character):
     """Manage character's race history."""
+    dm = character.data_manager
+    ctype = dm.get_meta("Character Type", "character").capitalize()
     while True:
+        # Re-read each pass: a race change updates these
+        race_history = dm.race_history
+        current_race = dm.get_meta("Race", "")
+        current_race_level = dm.get_meta_int("Race level")
+        
         clear_screen()
-        character_type = character.data_manager.get_meta("Character Type", "character")
-        print_header(f"Race History Management: {character.name} ({character_type.capitalize()})")
+        print_header(f"Race History Management: {character.name} ({ctype})")
         
         # Display current race and level
-        current_race = character.data_manager.get_meta("Race", "")
-        current_race_level = int(character.data_manager.get_meta("Race level", "0"))
-        
         print_subheader("Current Race Status")
         print(f"Current Race: {current_race}")
         print(f"Current Race Level: {current_race_level}")
         
         # Display race history
-        if character.data_manager.race_history:
+        if race_history:
             print_subheader("Race History")
-            for i, entry in enumerate(character.data_manager.race_history, 1):
+            for i, entry in enumerate(race_history, 1):
                 level_range = f"Race Level {entry['from_race_level']}"
                 if entry['to_race_level'] is not None:
                     level_range += f"-{entry['to_race_level']}"
@@ -1581,42 +1743,24 @@ def manage_race_history(character: Character):
 def add_race_change(character: Character):
     """Add a race change to the character's history."""
     clear_screen()
-    print_header("Add Race Change")
-    
     current_race = character.data_manager.get_meta("Race", "")
-    current_race_level = int(character.data_manager.get_meta("Race level", "0"))
+    current_race_level = character.data_manager.get_meta_int("Race level")
     
-    print_subheader("Current Status")
-    print(f"Current Race: {current_race}")
-    print(f"Current Race Level: {current_race_level}")
-    
-    # Display available races
-    print_subheader("Available Races")
-    available_races = list(races.keys())
-    for i, race in enumerate(available_races, 1):
-        print(f"{i}. {race}")
+    with buffered_output():
+        print_header("Add Race Change")
+        
+        print_subheader("Current Status")
+        print(f"Current Race: {current_race}")
+        print(f"Current Race Level: {current_race_level}")
+        
+        # Display available races
+        print_subheader("Available Races")
+        print(format_race_menu())
     
     # Get new race
-    while True:
-        choice = input("\nEnter new race (number or name): ").strip()
-        
-        # Try to parse as number first
-        try:
-            race_num = int(choice)
-            if 1 <= race_num <= len(available_races):
-                new_race = available_races[race_num - 1]
-                break
-            else:
-                print_error(f"Please enter a number between 1 and {len(available_races)}")
-                continue
-        except ValueError:
-            # Try to match by name
-            new_race = choice.lower()
-            if new_race in available_races:
-                break
-            else:
-                print_error(f"Invalid race: {choice}")
-                continue
+    new_race = None
+    while new_race is None:
+        new_race = match_race(input("\nEnter new race (number or name): "))
     
     if new_race == current_race.lower():
         print_error("Character is already that race.")
@@ -1662,12 +1806,28 @@ def add_race_change(character: Character):
     
     pause_screen()
 
+@lru_cache(maxsize=64)
+def _sorted_rank_ranges(race_name: str) -> Tuple[Tuple[int, ...], Tuple[Dict[str, Any], ...]]:
+    """A race's rank ranges sorted by min_level, with the min_levels alongside for bisecting."""
+    rank_ranges = races.get(race_name.lower(), {}).get("rank_ranges", [])
+    ordered = tuple(sorted(rank_ranges, key=lambda x: x["min_level"]))
+    return tuple(r["min_level"] for r in ordered), ordered
+
+@lru_cache(maxsize=None)
+def rank_range_for_level(race_name: str, level: int) -> Optional[Dict[str, Any]]:
+    """Return the rank range of race_name that covers level, or None."""
+    min_levels, ordered = _sorted_rank_ranges(race_name)
+    i = bisect_right(min_levels, level) - 1
+    if i >= 0 and level <= ordered[i]["max_level"]:
+        return ordered[i]
+    return None
+
 def view_race_progression(character: Character):
     """View detailed race progression breakdown."""
     clear_screen()
     print_header("Detailed Race Progression")
     
-    race_level = int(character.data_manager.get_meta("Race level", "0"))
+    race_level = character.data_manager.get_meta_int("Race level")
     
     if race_level == 0:
         print_error("Character has no race levels.")
@@ -1676,34 +1836,35 @@ def view_race_progression(character: Character):
     
     print_subheader("Race Progression Breakdown")
     
-    # Show progression for each race level
+    # Show progression for each race level; consecutive levels usually share a race and rank range,
+    # so the race per level comes from one history pass and each range's detail lines are built once
+    races_by_level = character.data_manager.get_races_by_race_level(race_level)
+    range_lines = {}
+    lines = []
+    append = lines.append
     for level in range(1, race_level + 1):
-        race_at_level = character.data_manager.get_race_at_race_level(level)
+        race_at_level = races_by_level[level]
         
         if race_at_level:
-            print(f"Race Level {level}: {race_at_level}")
+            append(f"Race Level {level}: {race_at_level}")
             
             # Show what bonuses were gained at this level
-            race_data = races.get(race_at_level.lower(), {})
-            rank_ranges = race_data.get("rank_ranges", [])
-            
-            for range_data in sorted(rank_ranges, key=lambda x: x["min_level"]):
-                if range_data["min_level"] <= level <= range_data["max_level"]:
-                    bonuses = range_data.get("stats", {})
-                    if bonuses:
-                        bonus_strs = []
-                        for stat, value in bonuses.items():
-                            if value > 0:
-                                bonus_strs.append(f"{stat}: +{value}")
-                        if bonus_strs:
-                            print(f"  Bonuses: {', '.join(bonus_strs)}")
-                    
+            range_data = rank_range_for_level(race_at_level, level)
+            if range_data is not None:
+                detail = range_lines.get(id(range_data))
+                if detail is None:
+                    detail = []
+                    bonus_strs = [f"{stat}: +{value}" for stat, value in range_data.get("stats", {}).items() if value > 0]
+                    if bonus_strs:
+                        detail.append(f"  Bonuses: {', '.join(bonus_strs)}")
                     if "rank" in range_data:
-                        print(f"  Rank: {range_data['rank']}")
-                    break
+                        detail.append(f"  Rank: {range_data['rank']}")
+                    range_lines[id(range_data)] = detail
+                lines.extend(detail)
         else:
-            print(f"Race Level {level}: No race data")
+            append(f"Race Level {level}: No race data")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     pause_screen()
 
 def validate_character_stats(character: Character):
@@ -1770,316 +1931,311 @@ def validate_character_stats(character: Character):
         export_validation_report(character, validation_result, creation_info)
     # Any other choice (including '3') returns to main menu
     
-def show_detailed_validation_results(character: Character, validation_result: Dict[str, Any], creation_info: Dict[str, Any]):
+# (allocation key, label) pairs listed in the validation stat breakdowns
+CLASS_BREAKDOWN_KEYS = (
+    ("class_bonus", "Class"), ("profession_bonus", "Profession"),
+    ("race_bonus", "Race"), ("free_points_allocated", "Free Points")
+)
+RACE_LEVELING_BREAKDOWN_KEYS = (
+    ("race_bonus", "Race"), ("item_bonus", "Items"),
+    ("blessing_bonus", "Blessing"), ("free_points_allocated", "Free Points")
+)
+
+# Keys tried in order for a stat's expected value; calculated characters also fall back to expected_base
+EXPECTED_KEYS = ("expected_from_progression", "expected_total")
+CALCULATED_EXPECTED_KEYS = EXPECTED_KEYS + ("expected_base",)
+
+def describe_discrepancy(discrepancy: Any) -> str:
     """
-    Show detailed validation results based on character type.
-    Mirrors the detailed analysis from migration script.
+    One-line description of a validator stat_discrepancies entry. Entries are plain messages or dicts
+    whose keys depend on the validation type: a status (with difference), a difference, or an impossible allocation.
     """
-    validation_type = validation_result.get('validation_type', 'unknown')
-    character_type = character.data_manager.get_meta("Character Type", "character")
+    if not isinstance(discrepancy, dict):
+        return str(discrepancy)
+    if "status" in discrepancy:
+        return f"{discrepancy['status']} by {abs(discrepancy.get('difference', 0))} points"
+    if "difference" in discrepancy:
+        # Only nonzero differences are recorded, so the explicit sign matches the old "+n"/"-n" output
+        return f"{discrepancy['difference']:+d} points from expected"
+    if "impossible_allocation" in discrepancy:
+        return f"impossible allocation of {abs(discrepancy['impossible_allocation'])} points"
+    return str(discrepancy)
+
+def _stat_breakdown_fields(stat_analysis: Dict[str, Any],
+                           bonus_keys: Sequence[Tuple[str, str]]) -> Tuple[str, int, int]:
+    """Unpack a validation stat_allocations entry into (breakdown, current, discrepancy)."""
+    get = stat_analysis.get
+    breakdown = format_stat_breakdown(get("base", 0), [(label, get(key, 0)) for key, label in bonus_keys])
+    return breakdown, get("current", 0), get("discrepancy", 0)
+
+def _expected_value(stat_analysis: Dict[str, Any], expected_keys: Sequence[str]) -> Any:
+    """First truthy expected value, falling back to the last one (same as chaining `or`)."""
+    for key in expected_keys:
+        expected = stat_analysis.get(key)
+        if expected:
+            break
+    return expected
+
+def _print_stat_breakdown(stat: str, stat_name: str, stat_analysis: Dict[str, Any],
+                          bonus_keys: Sequence[Tuple[str, str]],
+                          excess_label: str = "UNUSED", excess_word: str = "excess",
+                          expected_keys: Sequence[str] = EXPECTED_KEYS):
+    """Print one stat's allocation breakdown from validation details, plus any discrepancy."""
+    breakdown, current, discrepancy = _stat_breakdown_fields(stat_analysis, bonus_keys)
+    print(f"{stat_name}: {breakdown} = {current}")
+    
+    # Show issues using the validation system's expected values
+    if discrepancy == 0:
+        return
+    if discrepancy < 0:
+        print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
+    else:
+        print_warning(f"  ⚠ {excess_label}: {stat} has {discrepancy} {excess_word} points")
+    expected = _expected_value(stat_analysis, expected_keys)
+    if expected is not None:
+        print_info(f"    Current: {current}, Expected: {expected}")
+
+def _write_stat_breakdown(write, stat: str, stat_name: str, stat_analysis: Dict[str, Any],
+                          bonus_keys: Sequence[Tuple[str, str]],
+                          excess_word: str = "excess",
+                          expected_keys: Sequence[str] = EXPECTED_KEYS):
+    """Plain-text report version of _print_stat_breakdown; write receives each line."""
+    breakdown, current, discrepancy = _stat_breakdown_fields(stat_analysis, bonus_keys)
+    write(f"{stat_name}: {breakdown} = {current}\n")
+    
+    if discrepancy == 0:
+        return
+    if discrepancy < 0:
+        write(f"  WARNING: {stat} needs {abs(discrepancy)} more points than available!\n")
+    else:
+        write(f"  WARNING: {stat} has {discrepancy} {excess_word} points\n")
+    expected = _expected_value(stat_analysis, expected_keys)
+    if expected is not None:
+        write(f"    Current: {current}, Expected: {expected}\n")
+
+# Stat breakdown style per validation type:
+# (bonus keys, screen label for excess points, word describing them, expected-value keys)
+_ALLOCATION_BREAKDOWN_STYLES = {
+    "race_leveling": (RACE_LEVELING_BREAKDOWN_KEYS, "EXTRA", "unexplained", EXPECTED_KEYS),
+    "reverse_engineered_manual": (CLASS_BREAKDOWN_KEYS, "UNUSED", "excess", EXPECTED_KEYS),
+    "calculated": (CLASS_BREAKDOWN_KEYS, "UNUSED", "excess", CALCULATED_EXPECTED_KEYS),
+}
+
+def _print_allocations(validation_type: str, allocations: Dict[str, Dict[str, Any]]):
+    """Print the breakdown of every allocated stat in the style of the given validation type."""
+    bonus_keys, excess_label, excess_word, expected_keys = _ALLOCATION_BREAKDOWN_STYLES[validation_type]
+    for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+        if stat in allocations:
+            _print_stat_breakdown(stat, stat_name, allocations[stat], bonus_keys,
+                                  excess_label, excess_word, expected_keys)
+
+def _print_allocation_summary(allocations: Dict[str, Dict[str, Any]]):
+    """Count the stats the allocation analysis flags; the per-stat lines are in show_detailed_stat_breakdown."""
+    impossible = sum(1 for stat_analysis in allocations.values() if stat_analysis.get("discrepancy", 0) < 0)
+    excess = sum(1 for stat_analysis in allocations.values() if stat_analysis.get("discrepancy", 0) > 0)
+    print(f"{len(allocations)} stats checked: {impossible} impossible, {excess} with unexplained points")
+    print_info("Choose 'View detailed stat source breakdown' for the per-stat allocation")
+
+def _stat_allocations_for(validation_result: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """The validator's per-stat allocation analysis, if the validation type has a breakdown style."""
+    if validation_result.get("validation_type") not in _ALLOCATION_BREAKDOWN_STYLES:
+        return None
+    return (validation_result.get("details") or {}).get("stat_allocations")
+
+def _write_allocations(write, validation_type: str, allocations: Dict[str, Dict[str, Any]]):
+    """Plain-text report version of _print_allocations."""
+    bonus_keys, _, excess_word, expected_keys = _ALLOCATION_BREAKDOWN_STYLES[validation_type]
+    for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+        if stat in allocations:
+            _write_stat_breakdown(write, stat, stat_name, allocations[stat], bonus_keys, excess_word, expected_keys)
+
+def _show_race_leveling_details(validation_type: str, validation_result: Dict[str, Any], meta: Dict[str, Any]):
+    """Validation details for race-leveling characters (familiars/monsters)."""
+    character_type = meta.get("Character Type", "character")
+    print_subheader(f"{character_type.capitalize()} Validation Details")
+    
+    # Show basic character info
+    race_level = meta.get("Race level", "0")
+    race = meta.get("Race", "")
+    print(f"Race: {race}")
+    print(f"Race Level: {race_level}")
+    print()
     
-    # Handle race-leveling characters (familiars/monsters) - ENHANCED DETAIL
-    if validation_type == "race_leveling":
-        print_subheader(f"{character_type.capitalize()} Validation Details")
-        
-        # Show basic character info
-        race_level = character.data_manager.get_meta("Race level", "0")
-        race = character.data_manager.get_meta("Race", "")
-        print(f"Race: {race}")
-        print(f"Race Level: {race_level}")
+    # Show any class/profession level issues
+    for key, level in validation_result.get("invalid_levels", {}).items():
+        print_error(f"⚠ INVALID: {character_type.capitalize()}s should not have {key.lower()}s (found: {level})")
+    
+    # Show detailed stat validation for race-leveling characters
+    if validation_result.get("stat_discrepancies"):
+        print_colored("Stat Issues:", 'red', True)
+        for stat, issue in validation_result["stat_discrepancies"].items():
+            print_error(f"  • {stat}: {describe_discrepancy(issue)}")
+    
+    # Summarize the stat allocation analysis for race-leveling characters
+    if validation_result.get("details") and "stat_allocations" in validation_result["details"]:
+        print_colored("Stat Allocation Summary:", 'cyan', True)
+        _print_allocation_summary(validation_result["details"]["stat_allocations"])
+    
+    # Show free points info for race-leveling characters
+    fp_info = validation_result.get("free_points", {})
+    if fp_info:
         print()
-        
-        # Show any class/profession level issues
-        class_level = int(character.data_manager.get_meta("Class level", "0"))
-        profession_level = int(character.data_manager.get_meta("Profession level", "0"))
-        
-        if class_level > 0:
-            print_error(f"⚠ INVALID: {character_type.capitalize()}s should not have class levels (found: {class_level})")
-        if profession_level > 0:
-            print_error(f"⚠ INVALID: {character_type.capitalize()}s should not have profession levels (found: {profession_level})")
-        
-        # Show detailed stat validation for race-leveling characters
-        if validation_result.get("stat_discrepancies"):
-            print_colored("Stat Issues:", 'red', True)
-            for stat, issue in validation_result["stat_discrepancies"].items():
-                if isinstance(issue, dict):
-                    if "status" in issue:
-                        status = issue["status"]
-                        diff = issue.get("difference", 0)
-                        print_error(f"  • {stat}: {status} by {abs(diff)} points")
-                    else:
-                        print_error(f"  • {stat}: {issue}")
-                else:
-                    print_error(f"  • {stat}: {issue}")
-        
-        # Show detailed stat allocation analysis for race-leveling characters
-        if validation_result.get("details") and "stat_allocations" in validation_result["details"]:
-            print_colored("Detailed Stat Allocation Analysis:", 'cyan', True)
-            analysis = validation_result["details"]
+        print_colored("Free Points Analysis:", 'yellow', True)
+        expected = fp_info.get('expected_total', 0)
+        spent = fp_info.get('spent', 0)
+        current = fp_info.get('current', 0)
+        difference = fp_info.get('difference', 0)
+        
+        print(f"Expected from race levels: {expected}")
+        print(f"Used in stat allocation: {spent}")
+        print(f"Remaining: {current}")
+        print(f"Balance: {expected} - {spent} - {current} = {difference}")
+        
+        if difference > 0:
+            print_error(f"⚠ MISSING: {character_type.capitalize()} is missing {difference} free points")
+        elif difference < 0:
+            print_error(f"⚠ EXCESS: {character_type.capitalize()} has {abs(difference)} excess free points")
+
+def _show_manual_details(validation_type: str, validation_result: Dict[str, Any], meta: Dict[str, Any]):
+    """Validation details for reverse-engineered and custom manual characters."""
+    print_subheader("Manual Character Validation Details")
+    
+    if validation_type == "reverse_engineered_manual":
+        # Show reverse engineering details
+        if validation_result.get("details"):
+            details = validation_result["details"]
+            print_colored("Free Points Analysis:", 'cyan', True)
+            print(f"Expected free points from progression: {details.get('total_expected_free_points', 0)}")
+            print(f"Used in stat allocation: {details.get('total_free_points_used', 0)}")
+            print(f"Calculated remaining: {details.get('remaining_free_points', 0)}")
             
-            for stat in STATS:
-                if stat in analysis["stat_allocations"]:
-                    stat_analysis = analysis["stat_allocations"][stat]
-                    base = stat_analysis.get("base", 0)
-                    race_bonus = stat_analysis.get("race_bonus", 0)
-                    item_bonus = stat_analysis.get("item_bonus", 0)
-                    blessing_bonus = stat_analysis.get("blessing_bonus", 0)
-                    free_points_used = stat_analysis.get("free_points_allocated", 0)
-                    current = stat_analysis.get("current", 0)
-                    expected_from_progression = stat_analysis.get("expected_from_progression", None)
-                    expected_total = stat_analysis.get("expected_total", None)
-                    discrepancy = stat_analysis.get("discrepancy", 0)
-                    
-                    # Build breakdown string for race-leveling characters
-                    parts = [f"Base: {base}"]
-                    if race_bonus > 0:
-                        parts.append(f"Race: +{race_bonus}")
-                    if item_bonus > 0:
-                        parts.append(f"Items: +{item_bonus}")
-                    if blessing_bonus > 0:
-                        parts.append(f"Blessing: +{blessing_bonus}")
-                    if free_points_used > 0:
-                        parts.append(f"Free Points: +{free_points_used}")
-                    
-                    breakdown = " + ".join(parts)
-                    print(f"{stat.capitalize()}: {breakdown} = {current}")
-                    
-                    # Show issues using the validation system's expected values
-                    if discrepancy < 0:
-                        print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
-                        expected = expected_from_progression or expected_total
-                        if expected is not None:
-                            print_info(f"    Current: {current}, Expected: {expected}")
-                    elif discrepancy > 0:
-                        print_warning(f"  ⚠ EXTRA: {stat} has {discrepancy} unexplained points")
-                        expected = expected_from_progression or expected_total
-                        if expected is not None:
-                            print_info(f"    Current: {current}, Expected: {expected}")
-        
-        # Show free points info for race-leveling characters
-        fp_info = validation_result.get("free_points", {})
-        if fp_info:
-            print()
-            print_colored("Free Points Analysis:", 'yellow', True)
-            expected = fp_info.get('expected_total', 0)
-            spent = fp_info.get('spent', 0)
-            current = fp_info.get('current', 0)
-            difference = fp_info.get('difference', 0)
+            # Summarize the stat allocation
+            if "stat_allocations" in details:
+                print()
+                print_colored("Stat Allocation Summary:", 'cyan', True)
+                _print_allocation_summary(details["stat_allocations"])
+    
+    elif validation_type == "custom_manual":
+        # Show custom validation results
+        if validation_result.get("custom_validation"):
+            custom = validation_result["custom_validation"]
+            print_colored("Custom Character Checks:", 'cyan', True)
+            print(f"Race level calculation: {'✓' if custom.get('race_level_correct') else '✗'}")
+            print(f"Stats within reasonable range: {'✓' if custom.get('stats_reasonable') else '✗'}")
+            print(f"Free points non-negative: {'✓' if custom.get('free_points_valid') else '✗'}")
             
-            print(f"Expected from race levels: {expected}")
-            print(f"Used in stat allocation: {spent}")
-            print(f"Remaining: {current}")
-            print(f"Balance: {expected} - {spent} - {current} = {difference}")
+            # Show warnings and errors
+            if custom.get("warnings"):
+                print()
+                print_colored("Warnings:", 'yellow', True)
+                for warning in custom["warnings"]:
+                    print_warning(f"  • {warning}")
             
-            if difference > 0:
-                print_error(f"⚠ MISSING: {character_type.capitalize()} is missing {difference} free points")
-            elif difference < 0:
-                print_error(f"⚠ EXCESS: {character_type.capitalize()} has {abs(difference)} excess free points")
+            if custom.get("errors"):
+                print()
+                print_colored("Errors:", 'red', True)
+                for error in custom["errors"]:
+                    print_error(f"  • {error}")
+    
+    # Show stat discrepancies for manual characters
+    if validation_result.get("stat_discrepancies"):
+        print()
+        print_colored("Stat Discrepancies:", 'red', True)
+        for stat, discrepancy in validation_result["stat_discrepancies"].items():
+            print_error(f"  • {stat}: {describe_discrepancy(discrepancy)}")
+
+def _show_calculated_details(validation_type: str, validation_result: Dict[str, Any], meta: Dict[str, Any]):
+    """Validation details for calculated characters."""
+    print_subheader("Calculated Character Validation Details")
     
-    # Handle manual characters - ENHANCED DETAIL
-    elif validation_type in ["reverse_engineered_manual", "custom_manual"]:
-        print_subheader("Manual Character Validation Details")
-        
-        if validation_type == "reverse_engineered_manual":
-            # Show reverse engineering details
-            if validation_result.get("details"):
-                details = validation_result["details"]
-                print_colored("Free Points Analysis:", 'cyan', True)
-                print(f"Expected free points from progression: {details.get('total_expected_free_points', 0)}")
-                print(f"Used in stat allocation: {details.get('total_free_points_used', 0)}")
-                print(f"Calculated remaining: {details.get('remaining_free_points', 0)}")
-                
-                # Show detailed stat allocation
-                if "stat_allocations" in details:
-                    print()
-                    print_colored("Stat Allocation Breakdown:", 'cyan', True)
-                    for stat in STATS:
-                        if stat in details["stat_allocations"]:
-                            stat_analysis = details["stat_allocations"][stat]
-                            base = stat_analysis.get("base", 0)
-                            class_bonus = stat_analysis.get("class_bonus", 0)
-                            profession_bonus = stat_analysis.get("profession_bonus", 0)
-                            race_bonus = stat_analysis.get("race_bonus", 0)
-                            free_points_used = stat_analysis.get("free_points_allocated", 0)
-                            current = stat_analysis.get("current", 0)
-                            expected_from_progression = stat_analysis.get("expected_from_progression", None)
-                            expected_total = stat_analysis.get("expected_total", None)
-                            discrepancy = stat_analysis.get("discrepancy", 0)
-                            
-                            # Build breakdown string
-                            parts = [f"Base: {base}"]
-                            if class_bonus > 0:
-                                parts.append(f"Class: +{class_bonus}")
-                            if profession_bonus > 0:
-                                parts.append(f"Profession: +{profession_bonus}")
-                            if race_bonus > 0:
-                                parts.append(f"Race: +{race_bonus}")
-                            if free_points_used > 0:
-                                parts.append(f"Free Points: +{free_points_used}")
-                            
-                            breakdown = " + ".join(parts)
-                            print(f"{stat.capitalize()}: {breakdown} = {current}")
-                            
-                            # Show issues using the validation system's expected values
-                            if discrepancy < 0:
-                                print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
-                                expected = expected_from_progression or expected_total
-                                if expected is not None:
-                                    print_info(f"    Current: {current}, Expected: {expected}")
-                            elif discrepancy > 0:
-                                print_warning(f"  ⚠ UNUSED: {stat} has {discrepancy} excess points")
-                                expected = expected_from_progression or expected_total
-                                if expected is not None:
-                                    print_info(f"    Current: {current}, Expected: {expected}")
-        
-        elif validation_type == "custom_manual":
-            # Show custom validation results
-            if validation_result.get("custom_validation"):
-                custom = validation_result["custom_validation"]
-                print_colored("Custom Character Checks:", 'cyan', True)
-                print(f"Race level calculation: {'✓' if custom.get('race_level_correct') else '✗'}")
-                print(f"Stats within reasonable range: {'✓' if custom.get('stats_reasonable') else '✗'}")
-                print(f"Free points non-negative: {'✓' if custom.get('free_points_valid') else '✗'}")
-                
-                # Show warnings and errors
-                if custom.get("warnings"):
-                    print()
-                    print_colored("Warnings:", 'yellow', True)
-                    for warning in custom["warnings"]:
-                        print_warning(f"  • {warning}")
-                
-                if custom.get("errors"):
-                    print()
-                    print_colored("Errors:", 'red', True)
-                    for error in custom["errors"]:
-                        print_error(f"  • {error}")
-        
-        # Show stat discrepancies for manual characters
-        if validation_result.get("stat_discrepancies"):
-            print()
-            print_colored("Stat Discrepancies:", 'red', True)
-            for stat, discrepancy in validation_result["stat_discrepancies"].items():
-                if isinstance(discrepancy, dict):
-                    if "difference" in discrepancy:
-                        diff = discrepancy["difference"]
-                        diff_str = f"+{diff}" if diff > 0 else str(diff)
-                        print_error(f"  • {stat}: {diff_str} points from expected")
-                    elif "impossible_allocation" in discrepancy:
-                        impossible = discrepancy["impossible_allocation"]
-                        print_error(f"  • {stat}: impossible allocation of {abs(impossible)} points")
-                    else:
-                        print_error(f"  • {stat}: {discrepancy}")
-                else:
-                    print_error(f"  • {stat}: {discrepancy}")
+    # Summarize the stat breakdown if available
+    if validation_result.get("details") and "stat_allocations" in validation_result["details"]:
+        print_colored("Stat Allocation Summary:", 'cyan', True)
+        _print_allocation_summary(validation_result["details"]["stat_allocations"])
     
-    # Handle calculated characters - ENHANCED DETAIL
-    elif validation_type == "calculated":
-        print_subheader("Calculated Character Validation Details")
-        
-        # Show detailed stat breakdown if available
-        if validation_result.get("details") and "stat_allocations" in validation_result["details"]:
-            print_colored("Detailed Stat Allocation Analysis:", 'cyan', True)
-            analysis = validation_result["details"]
-            
-            for stat in STATS:
-                if stat in analysis["stat_allocations"]:
-                    stat_analysis = analysis["stat_allocations"][stat]
-                    base = stat_analysis.get("base", 0)
-                    class_bonus = stat_analysis.get("class_bonus", 0)
-                    profession_bonus = stat_analysis.get("profession_bonus", 0)
-                    race_bonus = stat_analysis.get("race_bonus", 0)
-                    free_points_used = stat_analysis.get("free_points_allocated", 0)
-                    current = stat_analysis.get("current", 0)
-                    expected_from_progression = stat_analysis.get("expected_from_progression", None)
-                    expected_total = stat_analysis.get("expected_total", None)
-                    expected_base = stat_analysis.get("expected_base", None)
-                    discrepancy = stat_analysis.get("discrepancy", 0)
-                    
-                    # Build breakdown string
-                    parts = [f"Base: {base}"]
-                    if class_bonus > 0:
-                        parts.append(f"Class: +{class_bonus}")
-                    if profession_bonus > 0:
-                        parts.append(f"Profession: +{profession_bonus}")
-                    if race_bonus > 0:
-                        parts.append(f"Race: +{race_bonus}")
-                    if free_points_used > 0:
-                        parts.append(f"Free Points: +{free_points_used}")
-                    
-                    breakdown = " + ".join(parts)
-                    print(f"{stat.capitalize()}: {breakdown} = {current}")
-                    
-                    # Show issues using the validation system's expected values
-                    if discrepancy < 0:
-                        print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
-                        expected = expected_from_progression or expected_total or expected_base
-                        if expected is not None:
-                            print_info(f"    Current: {current}, Expected: {expected}")
-                    elif discrepancy > 0:
-                        print_warning(f"  ⚠ UNUSED: {stat} has {discrepancy} excess points")
-                        expected = expected_from_progression or expected_total or expected_base
-                        if expected is not None:
-                            print_info(f"    Current: {current}, Expected: {expected}")
-        
-        # Show free points summary for calculated characters
-        print()
-        print_colored("Free Points Summary:", 'cyan', True)
-        
-        # Use the free_points section from validation result
-        fp_info = validation_result.get("free_points", {})
-        total_expected = fp_info.get("expected_total", 0)
-        total_used = fp_info.get("spent", 0) 
-        remaining = fp_info.get("difference", 0)
-        current = fp_info.get("current", 0)
-        
-        print(f"Total Expected: {total_expected}")
-        print(f"Used in Allocation: {total_used}")
-        print(f"Current Remaining: {current}")
-        print(f"Calculated Remaining: {remaining}")
-        
-        if current != remaining:
-            diff = current - remaining
-            if diff > 0:
-                print_error(f"Character has {diff} excess free points")
-            else:
-                print_error(f"Character is missing {abs(diff)} free points")
-        
-        # Show stat discrepancies for calculated characters
-        if validation_result.get("stat_discrepancies"):
-            print()
-            print_colored("Stat Discrepancies:", 'red', True)
-            for stat, discrepancy in validation_result["stat_discrepancies"].items():
-                if isinstance(discrepancy, dict):
-                    status = discrepancy.get("status", "error")
-                    diff = discrepancy.get("difference", 0)
-                    print_error(f"  • {stat}: {status} by {abs(diff)} points")
-                else:
-                    print_error(f"  • {stat}: {discrepancy}")
+    # Show free points summary for calculated characters
+    print()
+    print_colored("Free Points Summary:", 'cyan', True)
+    
+    # Use the free_points section from validation result
+    fp_info = validation_result.get("free_points", {})
+    total_expected = fp_info.get("expected_total", 0)
+    total_used = fp_info.get("spent", 0) 
+    remaining = fp_info.get("difference", 0)
+    current = fp_info.get("current", 0)
+    
+    print(f"Total Expected: {total_expected}")
+    print(f"Used in Allocation: {total_used}")
+    print(f"Current Remaining: {current}")
+    print(f"Calculated Remaining: {remaining}")
+    
+    if current != remaining:
+        diff = current - remaining
+        if diff > 0:
+            print_error(f"Character has {diff} excess free points")
+        else:
+            print_error(f"Character is missing {abs(diff)} free points")
     
-    # Show auto-correction details if not already shown
-    if not validation_result.get("free_points_auto_corrected", False):
-        correction_message = validation_result.get("auto_correction_message", "")
-        if correction_message and "no auto-correction" not in correction_message.lower():
-            print_subheader("Auto-Correction Analysis")
-            print_info(correction_message)
-    
-    # Show character type after validation
-    updated_creation_info = character.get_creation_info()
-    if updated_creation_info != creation_info:
-        print_subheader("Character Status Updated")
-        print(f"New type: {updated_creation_info['current_type']}")
-        print(f"Validation status: {character.validation_status}")
+    # Show stat discrepancies for calculated characters
+    if validation_result.get("stat_discrepancies"):
+        print()
+        print_colored("Stat Discrepancies:", 'red', True)
+        for stat, discrepancy in validation_result["stat_discrepancies"].items():
+            print_error(f"  • {stat}: {describe_discrepancy(discrepancy)}")
+
+# Detail view for each validation type; other types only get the shared sections
+_VALIDATION_DETAIL_VIEWS = {
+    "race_leveling": _show_race_leveling_details,
+    "reverse_engineered_manual": _show_manual_details,
+    "custom_manual": _show_manual_details,
+    "calculated": _show_calculated_details,
+}
+
+def show_detailed_validation_results(character: Character, validation_result: Dict[str, Any], creation_info: Dict[str, Any]):
+    """
+    Show detailed validation results based on character type.
+    Mirrors the detailed analysis from migration script.
+    """
+    # Render the detail sections into one buffer; pause_screen stays outside so its prompt follows them
+    with buffered_output():
+        validation_type = validation_result.get('validation_type', 'unknown')
+        show_details = _VALIDATION_DETAIL_VIEWS.get(validation_type)
+        if show_details is not None:
+            show_details(validation_type, validation_result, character.data_manager.get_all_meta())
+        
+        # Show auto-correction details if not already shown
+        if not validation_result.get("free_points_auto_corrected", False):
+            correction_message = validation_result.get("auto_correction_message", "")
+            if correction_message and "no auto-correction" not in correction_message.lower():
+                print_subheader("Auto-Correction Analysis")
+                print_info(correction_message)
+        
+        # Show character type after validation; get_creation_info() hands back the same cached dict
+        # while nothing changed, so identity settles the common case without a dict compare
+        updated_creation_info = character.get_creation_info()
+        if updated_creation_info is not creation_info and updated_creation_info != creation_info:
+            print_subheader("Character Status Updated")
+            print(f"New type: {updated_creation_info['current_type']}")
+            print(f"Validation status: {character.validation_status}")
     
     pause_screen()
 
-def export_validation_report(character: Character, validation_result: Dict[str, Any], creation_info: Dict[str, Any]):
-    """Export detailed validation report to a text file."""
+# Section rules used in the plain-text validation report
+_SEP_80 = "=" * 80 + "\n"
+_SEP_40 = "-" * 40 + "\n"
+
+def export_validation_report(character: Character, validation_result: Dict[str, Any], creation_info: Dict[str, Any],
+                             verbose: bool = REPORT_VERBOSE):
+    """
+    Export detailed validation report to a text file.
+    With verbose False, a valid character's report skips the per-stat detailed validation section.
+    """
         
     clear_screen()
     print_header("Export Validation Report")
     
     # Get filename from user
-    character_name_safe = character.name.lower().replace(' ', '_').replace('/', '_').replace('\\', '_')
+    character_name_safe = character.name.lower().translate(_FNAME_TRANS)
     default_filename = f"{character_name_safe}_validation_report.txt"
     
     print_info(f"Default filename: {default_filename}")
@@ -2093,472 +2249,338 @@ def export_validation_report(character: Character, validation_result: Dict[str,
     try:
         print_loading("Generating validation report")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write("=" * 80 + "\n")
-            f.write(f"CHARACTER VALIDATION REPORT\n")
-            f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            # Write character information
-            f.write("CHARACTER INFORMATION\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Name: {character.name}\n")
-            f.write(f"Type: {creation_info['current_type']}\n")
-            if creation_info.get('original_type'):
-                f.write(f"Originally: {creation_info['original_type']}\n")
-                f.write(f"Converted: {creation_info['converted_at']}\n")
-            f.write(f"Validation status: {character.validation_status}\n\n")
-            
-            # Write validation summary
-            f.write("VALIDATION SUMMARY\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Result: {'PASSED' if validation_result['valid'] else 'FAILED'}\n")
-            f.write(f"Validation type: {validation_result.get('validation_type', 'unknown')}\n")
-            f.write(f"Overall summary: {validation_result.get('overall_summary', 'No summary available')}\n\n")
-            
-            # Write auto-correction information
-            if validation_result.get("converted_to_calculated", False):
-                f.write("AUTO-CONVERSION\n")
-                f.write("-" * 40 + "\n")
-                f.write("Manual character automatically converted to calculated character\n")
-                f.write(f"Message: {validation_result.get('conversion_message', 'Character converted successfully')}\n")
-                f.write("Original manual data archived in creation history\n\n")
-            
-            if validation_result.get("free_points_auto_corrected", False):
-                f.write("AUTO-CORRECTION\n")
-                f.write("-" * 40 + "\n")
-                correction_message = validation_result.get("auto_correction_message", "")
-                points_added = validation_result.get("free_points_added", 0)
-                f.write(f"Free points auto-corrected: {correction_message}\n")
-                if points_added > 0:
-                    f.write(f"Additional free points available: {points_added}\n")
-                f.write("\n")
-            
-            # Write detailed validation results
-            write_detailed_validation_to_file(f, character, validation_result)
-            
-            # Write current character stats
-            f.write("CURRENT CHARACTER STATS\n")
-            f.write("-" * 40 + "\n")
-            for stat in STATS:
-                sources = character.data_manager.get_stat_sources(stat)
-                current = character.data_manager.get_stat(stat)
-                modifier = character.data_manager.get_stat_modifier(stat)
-                
-                # Build breakdown string
-                source_parts = []
-                for source, value in sources.items():
-                    if value > 0:
-                        source_parts.append(f"{source}: {value}")
-                
-                if len(source_parts) > 1:
-                    source_str = " (" + " + ".join(source_parts) + ")"
-                    f.write(f"{stat.capitalize()}: {current}{source_str} (modifier: {modifier})\n")
-                else:
-                    f.write(f"{stat.capitalize()}: {current} (modifier: {modifier})\n")
+        # Build the report as a list of chunks and write it to disk in one call
+        out = []
+        write = out.append
+        
+        # Write header
+        write(_SEP_80)
+        write(f"CHARACTER VALIDATION REPORT\n")
+        write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(_SEP_80 + "\n")
+        
+        # Write character information
+        write("CHARACTER INFORMATION\n")
+        write(_SEP_40)
+        write(f"Name: {character.name}\n")
+        write(f"Type: {creation_info['current_type']}\n")
+        if creation_info.get('original_type'):
+            write(f"Originally: {creation_info['original_type']}\n")
+            write(f"Converted: {creation_info['converted_at']}\n")
+        write(f"Validation status: {character.validation_status}\n\n")
+        
+        # Write validation summary
+        write("VALIDATION SUMMARY\n")
+        write(_SEP_40)
+        write(f"Result: {'PASSED' if validation_result['valid'] else 'FAILED'}\n")
+        write(f"Validation type: {validation_result.get('validation_type', 'unknown')}\n")
+        write(f"Overall summary: {validation_result.get('overall_summary', 'No summary available')}\n\n")
+        
+        # Write auto-correction information
+        if validation_result.get("converted_to_calculated", False):
+            write("AUTO-CONVERSION\n")
+            write(_SEP_40)
+            write("Manual character automatically converted to calculated character\n")
+            write(f"Message: {validation_result.get('conversion_message', 'Character converted successfully')}\n")
+            write("Original manual data archived in creation history\n\n")
+        
+        if validation_result.get("free_points_auto_corrected", False):
+            write("AUTO-CORRECTION\n")
+            write(_SEP_40)
+            correction_message = validation_result.get("auto_correction_message", "")
+            points_added = validation_result.get("free_points_added", 0)
+            write(f"Free points auto-corrected: {correction_message}\n")
+            if points_added > 0:
+                write(f"Additional free points available: {points_added}\n")
+            write("\n")
+        
+        # Write detailed validation results
+        if verbose or not validation_result.get("valid"):
+            write_detailed_validation_to_file(out, character, validation_result)
+        
+        # Write current character stats
+        write("CURRENT CHARACTER STATS\n")
+        write(_SEP_40)
+        dm = character.data_manager
+        get_sources, get_stat, get_mod = dm.get_stat_sources, dm.get_stat, dm.get_stat_modifier
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+            sources = get_sources(stat)
+            current = get_stat(stat)
+            modifier = get_mod(stat)
             
-            # Write free points status
-            f.write(f"\nFree Points: {character.level_system.free_points}")
-            if character.level_system.free_points < 0:
-                f.write(" (overspent)")
-            elif character.level_system.free_points == 0:
-                f.write(" (none available)")
+            # Only stats with more than one contributing source get a breakdown string
+            if has_multi_source(sources):
+                source_str = " (" + " + ".join(f"{source}: {value}" for source, value in sources.items() if value > 0) + ")"
+                write(f"{stat_name}: {current}{source_str} (modifier: {modifier})\n")
             else:
-                f.write(" (available)")
-            f.write("\n\n")
-            
-            # Write character meta information
-            f.write("CHARACTER META INFORMATION\n")
-            f.write("-" * 40 + "\n")
-            for key, value in character.data_manager.get_all_meta().items():
-                f.write(f"{key}: {value}\n")
-            f.write("\n")
-            
-            # Write tier thresholds if applicable
-            if not character.is_race_leveling_type():
-                f.write("TIER CONFIGURATION\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Tier thresholds: {character.data_manager.tier_thresholds}\n\n")
-            
-            # Write footer
-            f.write("=" * 80 + "\n")
-            f.write("END OF VALIDATION REPORT\n")
-            f.write("=" * 80 + "\n")
+                write(f"{stat_name}: {current} (modifier: {modifier})\n")
+        
+        # Write free points status
+        free_points = character.level_system.free_points
+        write(f"\nFree Points: {free_points}")
+        if free_points < 0:
+            write(" (overspent)")
+        elif free_points == 0:
+            write(" (none available)")
+        else:
+            write(" (available)")
+        write("\n\n")
+        
+        # Write character meta information
+        write("CHARACTER META INFORMATION\n")
+        write(_SEP_40)
+        write(format_meta_block(dm.iter_meta()) + "\n\n")
+        
+        # Write tier thresholds if applicable
+        if not character.is_race_leveling_type():
+            write("TIER CONFIGURATION\n")
+            write(_SEP_40)
+            write(f"Tier thresholds: {dm.tier_thresholds}\n\n")
+        
+        # Write footer
+        write(_SEP_80)
+        write("END OF VALIDATION REPORT\n")
+        write(_SEP_80)
+        
+        # Encode up front (with the platform line endings text mode would emit) so the size comes from the bytes written
+        data = "".join(out).replace("\n", os.linesep).encode('utf-8')
+        with open(filename, 'wb') as out_file:
+            out_file.write(data)
         
         print_success(f"Validation report exported to: {filename}")
-        print_info(f"File size: {os.path.getsize(filename)} bytes")
+        print_info(f"File size: {len(data)} bytes")
         
     except Exception as e:
         print_error(f"Error exporting validation report: {str(e)}")
     
     pause_screen()
 
-def write_detailed_validation_to_file(f, character: Character, validation_result: Dict[str, Any]):
-    """Write detailed validation results to file (plain text, no colors)."""
+def write_detailed_validation_to_file(out: List[str], character: Character, validation_result: Dict[str, Any]):
+    """Append the detailed validation section of a report to out (plain text, no colors)."""
+    write = out.append
     validation_type = validation_result.get('validation_type', 'unknown')
-    character_type = character.data_manager.get_meta("Character Type", "character")
+    meta = character.data_manager.get_all_meta()
+    character_type = meta.get("Character Type", "character")
+    details = validation_result.get("details") or {}
+    discrepancies = validation_result.get("stat_discrepancies") or {}
     
-    f.write("DETAILED VALIDATION RESULTS\n")
-    f.write("-" * 40 + "\n")
+    write("DETAILED VALIDATION RESULTS\n")
+    write(_SEP_40)
     
     # Handle race-leveling characters (familiars/monsters)
     if validation_type == "race_leveling":
-        f.write(f"{character_type.upper()} VALIDATION DETAILS\n\n")
+        write(f"{character_type.upper()} VALIDATION DETAILS\n\n")
         
         # Show basic character info
-        race_level = character.data_manager.get_meta("Race level", "0")
-        race = character.data_manager.get_meta("Race", "")
-        f.write(f"Race: {race}\n")
-        f.write(f"Race Level: {race_level}\n\n")
+        race_level = meta.get("Race level", "0")
+        race = meta.get("Race", "")
+        write(f"Race: {race}\n")
+        write(f"Race Level: {race_level}\n\n")
         
         # Show any class/profession level issues
-        class_level = int(character.data_manager.get_meta("Class level", "0"))
-        profession_level = int(character.data_manager.get_meta("Profession level", "0"))
-        
-        if class_level > 0:
-            f.write(f"INVALID: {character_type.capitalize()}s should not have class levels (found: {class_level})\n")
-        if profession_level > 0:
-            f.write(f"INVALID: {character_type.capitalize()}s should not have profession levels (found: {profession_level})\n")
+        for key, level in validation_result.get("invalid_levels", {}).items():
+            write(f"INVALID: {character_type.capitalize()}s should not have {key.lower()}s (found: {level})\n")
         
         # Show detailed stat validation for race-leveling characters
-        if validation_result.get("stat_discrepancies"):
-            f.write("\nStat Issues:\n")
-            for stat, issue in validation_result["stat_discrepancies"].items():
-                if isinstance(issue, dict):
-                    if "status" in issue:
-                        status = issue["status"]
-                        diff = issue.get("difference", 0)
-                        f.write(f"  • {stat}: {status} by {abs(diff)} points\n")
-                    else:
-                        f.write(f"  • {stat}: {issue}\n")
-                else:
-                    f.write(f"  • {stat}: {issue}\n")
+        if discrepancies:
+            write("\nStat Issues:\n")
+            for stat, issue in discrepancies.items():
+                write(f"  • {stat}: {describe_discrepancy(issue)}\n")
         
         # Show detailed stat allocation analysis
-        if validation_result.get("details") and "stat_allocations" in validation_result["details"]:
-            f.write("\nDetailed Stat Allocation Analysis:\n")
-            analysis = validation_result["details"]
-            
-            for stat in STATS:
-                if stat in analysis["stat_allocations"]:
-                    stat_analysis = analysis["stat_allocations"][stat]
-                    base = stat_analysis.get("base", 0)
-                    race_bonus = stat_analysis.get("race_bonus", 0)
-                    item_bonus = stat_analysis.get("item_bonus", 0)
-                    blessing_bonus = stat_analysis.get("blessing_bonus", 0)
-                    free_points_used = stat_analysis.get("free_points_allocated", 0)
-                    current = stat_analysis.get("current", 0)
-                    expected_from_progression = stat_analysis.get("expected_from_progression", None)
-                    expected_total = stat_analysis.get("expected_total", None)
-                    discrepancy = stat_analysis.get("discrepancy", 0)
-                    
-                    # Build breakdown string
-                    parts = [f"Base: {base}"]
-                    if race_bonus > 0:
-                        parts.append(f"Race: +{race_bonus}")
-                    if item_bonus > 0:
-                        parts.append(f"Items: +{item_bonus}")
-                    if blessing_bonus > 0:
-                        parts.append(f"Blessing: +{blessing_bonus}")
-                    if free_points_used > 0:
-                        parts.append(f"Free Points: +{free_points_used}")
-                    
-                    breakdown = " + ".join(parts)
-                    f.write(f"{stat.capitalize()}: {breakdown} = {current}\n")
-                    
-                    # Show issues using the validation system's expected values
-                    if discrepancy < 0:
-                        f.write(f"  WARNING: {stat} needs {abs(discrepancy)} more points than available!\n")
-                        expected = expected_from_progression or expected_total
-                        if expected is not None:
-                            f.write(f"    Current: {current}, Expected: {expected}\n")
-                    elif discrepancy > 0:
-                        f.write(f"  WARNING: {stat} has {discrepancy} unexplained points\n")
-                        expected = expected_from_progression or expected_total
-                        if expected is not None:
-                            f.write(f"    Current: {current}, Expected: {expected}\n")
+        if "stat_allocations" in details:
+            write("\nDetailed Stat Allocation Analysis:\n")
+            _write_allocations(write, "race_leveling", details["stat_allocations"])
         
         # Show free points info
         fp_info = validation_result.get("free_points", {})
         if fp_info:
-            f.write("\nFree Points Analysis:\n")
+            write("\nFree Points Analysis:\n")
             expected = fp_info.get('expected_total', 0)
             spent = fp_info.get('spent', 0)
             current = fp_info.get('current', 0)
             difference = fp_info.get('difference', 0)
             
-            f.write(f"Expected from race levels: {expected}\n")
-            f.write(f"Used in stat allocation: {spent}\n")
-            f.write(f"Remaining: {current}\n")
-            f.write(f"Balance: {expected} - {spent} - {current} = {difference}\n")
+            write(f"Expected from race levels: {expected}\n")
+            write(f"Used in stat allocation: {spent}\n")
+            write(f"Remaining: {current}\n")
+            write(f"Balance: {expected} - {spent} - {current} = {difference}\n")
             
             if difference > 0:
-                f.write(f"MISSING: {character_type.capitalize()} is missing {difference} free points\n")
+                write(f"MISSING: {character_type.capitalize()} is missing {difference} free points\n")
             elif difference < 0:
-                f.write(f"EXCESS: {character_type.capitalize()} has {abs(difference)} excess free points\n")
+                write(f"EXCESS: {character_type.capitalize()} has {abs(difference)} excess free points\n")
     
     # Handle manual characters
     elif validation_type in ["reverse_engineered_manual", "custom_manual"]:
-        f.write("MANUAL CHARACTER VALIDATION DETAILS\n\n")
+        write("MANUAL CHARACTER VALIDATION DETAILS\n\n")
         
         if validation_type == "reverse_engineered_manual":
             # Show reverse engineering details
-            if validation_result.get("details"):
-                details = validation_result["details"]
-                f.write("Reverse Engineering Analysis:\n")
-                f.write(f"Expected free points from progression: {details.get('total_expected_free_points', 0)}\n")
-                f.write(f"Used in stat allocation: {details.get('total_free_points_used', 0)}\n")
-                f.write(f"Calculated remaining: {details.get('remaining_free_points', 0)}\n\n")
+            if details:
+                write("Reverse Engineering Analysis:\n")
+                write(f"Expected free points from progression: {details.get('total_expected_free_points', 0)}\n")
+                write(f"Used in stat allocation: {details.get('total_free_points_used', 0)}\n")
+                write(f"Calculated remaining: {details.get('remaining_free_points', 0)}\n\n")
                 
                 # Show detailed stat allocation
                 if "stat_allocations" in details:
-                    f.write("Stat Allocation Breakdown:\n")
-                    for stat in STATS:
-                        if stat in details["stat_allocations"]:
-                            stat_analysis = details["stat_allocations"][stat]
-                            base = stat_analysis.get("base", 0)
-                            class_bonus = stat_analysis.get("class_bonus", 0)
-                            profession_bonus = stat_analysis.get("profession_bonus", 0)
-                            race_bonus = stat_analysis.get("race_bonus", 0)
-                            free_points_used = stat_analysis.get("free_points_allocated", 0)
-                            current = stat_analysis.get("current", 0)
-                            expected_from_progression = stat_analysis.get("expected_from_progression", None)
-                            expected_total = stat_analysis.get("expected_total", None)
-                            discrepancy = stat_analysis.get("discrepancy", 0)
-                            
-                            # Build breakdown string
-                            parts = [f"Base: {base}"]
-                            if class_bonus > 0:
-                                parts.append(f"Class: +{class_bonus}")
-                            if profession_bonus > 0:
-                                parts.append(f"Profession: +{profession_bonus}")
-                            if race_bonus > 0:
-                                parts.append(f"Race: +{race_bonus}")
-                            if free_points_used > 0:
-                                parts.append(f"Free Points: +{free_points_used}")
-                            
-                            breakdown = " + ".join(parts)
-                            f.write(f"{stat.capitalize()}: {breakdown} = {current}\n")
-                            
-                            # Show issues using the validation system's expected values
-                            if discrepancy < 0:
-                                f.write(f"  WARNING: {stat} needs {abs(discrepancy)} more points than available!\n")
-                                expected = expected_from_progression or expected_total
-                                if expected is not None:
-                                    f.write(f"    Current: {current}, Expected: {expected}\n")
-                            elif discrepancy > 0:
-                                f.write(f"  WARNING: {stat} has {discrepancy} excess points\n")
-                                expected = expected_from_progression or expected_total
-                                if expected is not None:
-                                    f.write(f"    Current: {current}, Expected: {expected}\n")
+                    write("Stat Allocation Breakdown:\n")
+                    _write_allocations(write, validation_type, details["stat_allocations"])
         
         elif validation_type == "custom_manual":
             # Show custom validation results
             if validation_result.get("custom_validation"):
                 custom = validation_result["custom_validation"]
-                f.write("Custom Character Checks:\n")
-                f.write(f"Race level calculation: {'PASS' if custom.get('race_level_correct') else 'FAIL'}\n")
-                f.write(f"Stats within reasonable range: {'PASS' if custom.get('stats_reasonable') else 'FAIL'}\n")
-                f.write(f"Free points non-negative: {'PASS' if custom.get('free_points_valid') else 'FAIL'}\n\n")
+                write("Custom Character Checks:\n")
+                write(f"Race level calculation: {'PASS' if custom.get('race_level_correct') else 'FAIL'}\n")
+                write(f"Stats within reasonable range: {'PASS' if custom.get('stats_reasonable') else 'FAIL'}\n")
+                write(f"Free points non-negative: {'PASS' if custom.get('free_points_valid') else 'FAIL'}\n\n")
                 
                 # Show warnings and errors
                 if custom.get("warnings"):
-                    f.write("Warnings:\n")
+                    write("Warnings:\n")
                     for warning in custom["warnings"]:
-                        f.write(f"  • {warning}\n")
-                    f.write("\n")
+                        write(f"  • {warning}\n")
+                    write("\n")
                 
                 if custom.get("errors"):
-                    f.write("Errors:\n")
+                    write("Errors:\n")
                     for error in custom["errors"]:
-                        f.write(f"  • {error}\n")
-                    f.write("\n")
+                        write(f"  • {error}\n")
+                    write("\n")
         
         # Show stat discrepancies for manual characters
-        if validation_result.get("stat_discrepancies"):
-            f.write("Stat Discrepancies:\n")
-            for stat, discrepancy in validation_result["stat_discrepancies"].items():
-                if isinstance(discrepancy, dict):
-                    if "difference" in discrepancy:
-                        diff = discrepancy["difference"]
-                        diff_str = f"+{diff}" if diff > 0 else str(diff)
-                        f.write(f"  • {stat}: {diff_str} points from expected\n")
-                    elif "impossible_allocation" in discrepancy:
-                        impossible = discrepancy["impossible_allocation"]
-                        f.write(f"  • {stat}: impossible allocation of {abs(impossible)} points\n")
-                    else:
-                        f.write(f"  • {stat}: {discrepancy}\n")
-                else:
-                    f.write(f"  • {stat}: {discrepancy}\n")
+        if discrepancies:
+            write("Stat Discrepancies:\n")
+            for stat, discrepancy in discrepancies.items():
+                write(f"  • {stat}: {describe_discrepancy(discrepancy)}\n")
     
     # Handle calculated characters
     elif validation_type == "calculated":
-        f.write("CALCULATED CHARACTER VALIDATION DETAILS\n\n")
+        write("CALCULATED CHARACTER VALIDATION DETAILS\n\n")
         
         # Show detailed stat breakdown if available
-        if validation_result.get("details") and "stat_allocations" in validation_result["details"]:
-            f.write("Detailed Stat Allocation Analysis:\n")
-            analysis = validation_result["details"]
-            
-            for stat in STATS:
-                if stat in analysis["stat_allocations"]:
-                    stat_analysis = analysis["stat_allocations"][stat]
-                    base = stat_analysis.get("base", 0)
-                    class_bonus = stat_analysis.get("class_bonus", 0)
-                    profession_bonus = stat_analysis.get("profession_bonus", 0)
-                    race_bonus = stat_analysis.get("race_bonus", 0)
-                    free_points_used = stat_analysis.get("free_points_allocated", 0)
-                    current = stat_analysis.get("current", 0)
-                    expected_from_progression = stat_analysis.get("expected_from_progression", None)
-                    expected_total = stat_analysis.get("expected_total", None)
-                    expected_base = stat_analysis.get("expected_base", None)
-                    discrepancy = stat_analysis.get("discrepancy", 0)
-                    
-                    # Build breakdown string
-                    parts = [f"Base: {base}"]
-                    if class_bonus > 0:
-                        parts.append(f"Class: +{class_bonus}")
-                    if profession_bonus > 0:
-                        parts.append(f"Profession: +{profession_bonus}")
-                    if race_bonus > 0:
-                        parts.append(f"Race: +{race_bonus}")
-                    if free_points_used > 0:
-                        parts.append(f"Free Points: +{free_points_used}")
-                    
-                    breakdown = " + ".join(parts)
-                    f.write(f"{stat.capitalize()}: {breakdown} = {current}\n")
-                    
-                    # Show issues using the validation system's expected values
-                    if discrepancy < 0:
-                        f.write(f"  WARNING: {stat} needs {abs(discrepancy)} more points than available!\n")
-                        expected = expected_from_progression or expected_total or expected_base
-                        if expected is not None:
-                            f.write(f"    Current: {current}, Expected: {expected}\n")
-                    elif discrepancy > 0:
-                        f.write(f"  WARNING: {stat} has {discrepancy} excess points\n")
-                        expected = expected_from_progression or expected_total or expected_base
-                        if expected is not None:
-                            f.write(f"    Current: {current}, Expected: {expected}\n")
+        if "stat_allocations" in details:
+            write("Detailed Stat Allocation Analysis:\n")
+            _write_allocations(write, "calculated", details["stat_allocations"])
         
         # Show free points summary
-        f.write("\nFree Points Summary:\n")
-        if validation_result.get("details"):
-            analysis = validation_result["details"]
-            total_expected = analysis.get("total_expected_free_points", 0)
-            total_used = analysis.get("total_free_points_used", 0)
-            remaining = analysis.get("remaining_free_points", 0)
-            f.write(f"Total Expected: {total_expected}\n")
-            f.write(f"Used in Allocation: {total_used}\n")
-            f.write(f"Calculated Remaining: {remaining}\n")
+        write("\nFree Points Summary:\n")
+        if details:
+            total_expected = details.get("total_expected_free_points", 0)
+            total_used = details.get("total_free_points_used", 0)
+            remaining = details.get("remaining_free_points", 0)
+            write(f"Total Expected: {total_expected}\n")
+            write(f"Used in Allocation: {total_used}\n")
+            write(f"Calculated Remaining: {remaining}\n")
             
             if remaining < 0:
-                f.write(f"Character has {abs(remaining)} excess free points\n")
+                write(f"Character has {abs(remaining)} excess free points\n")
             elif remaining > 0:
-                f.write(f"Character is missing {remaining} free points\n")
+                write(f"Character is missing {remaining} free points\n")
         else:
             # Fallback if no detailed analysis available
             fp_info = validation_result.get("free_points", {})
             for key, value in fp_info.items():
-                f.write(f"{key.replace('_', ' ').title()}: {value}\n")
+                write(f"{key_label(key)}: {value}\n")
         
         # Show stat discrepancies
-        if validation_result.get("stat_discrepancies"):
-            f.write("\nStat Discrepancies:\n")
-            for stat, discrepancy in validation_result["stat_discrepancies"].items():
-                if isinstance(discrepancy, dict):
-                    status = discrepancy.get("status", "error")
-                    diff = discrepancy.get("difference", 0)
-                    f.write(f"  • {stat}: {status} by {abs(diff)} points\n")
-                else:
-                    f.write(f"  • {stat}: {discrepancy}\n")
+        if discrepancies:
+            write("\nStat Discrepancies:\n")
+            for stat, discrepancy in discrepancies.items():
+                write(f"  • {stat}: {describe_discrepancy(discrepancy)}\n")
     
-    f.write("\n")
+    write("\n")
 
 def show_detailed_stat_breakdown(character: Character, validation_result: Dict[str, Any]):
     """Show detailed breakdown of stat sources - same for all character types."""
     clear_screen()
-    print_header("Detailed Stat Source Breakdown")
-    
-    # Show creation info
-    creation_info = character.get_creation_info()
-    print_subheader("Character Information")
-    print(f"Type: {creation_info['current_type']}")
-    if creation_info.get('original_type'):
-        print(f"Originally: {creation_info['original_type']}")
-    print(f"Validation status: {character.validation_status}")
-    
-    # Show stat sources - same for ALL character types
-    print_subheader("Current Stat Sources")
-    for stat in STATS:
-        sources = character.data_manager.get_stat_sources(stat)
-        current = character.data_manager.get_stat(stat)
-        modifier = character.data_manager.get_stat_modifier(stat)
-        
-        # Build breakdown string
-        source_parts = []
-        for source, value in sources.items():
-            if value > 0:
-                source_parts.append(f"{source}: {value}")
+    with buffered_output():
+        print_header("Detailed Stat Source Breakdown")
+        
+        # Show creation info
+        creation_info = character.get_creation_info()
+        print_subheader("Character Information")
+        print(f"Type: {creation_info['current_type']}")
+        if creation_info.get('original_type'):
+            print(f"Originally: {creation_info['original_type']}")
+        print(f"Validation status: {character.validation_status}")
         
-        if len(source_parts) > 1:
-            source_str = " (" + " + ".join(source_parts) + ")"
-            print(f"{stat.capitalize()}: {current}{source_str} (modifier: {modifier})")
-        else:
-            print(f"{stat.capitalize()}: {current} (modifier: {modifier})")
-    
-    # Show free points if any
-    if character.level_system.free_points > 0:
-        print_subheader("Unallocated Points")
-        print(f"Free points remaining: {character.level_system.free_points}")
-    
-    # Show validation-specific issues only if invalid
-    if not validation_result.get("valid", True):
-        print_subheader("Validation Issues")
-        
-        # Show stat discrepancies for any character type
-        if validation_result.get("stat_discrepancies"):
-            print("Stat discrepancies found:")
-            for stat, discrepancy in validation_result["stat_discrepancies"].items():
-                if "difference" in discrepancy:
-                    diff = discrepancy["difference"]
-                    diff_str = f"+{diff}" if diff > 0 else str(diff)
-                    print_error(f"  {stat}: {diff_str} points")
-                elif "impossible_allocation" in discrepancy:
-                    print_error(f"  {stat}: impossible allocation")
-        
-        # Show free points issues
-        if validation_result.get("free_points") and isinstance(validation_result["free_points"], dict):
-            fp_info = validation_result["free_points"]
-            if fp_info.get("difference", 0) != 0:
-                diff = fp_info["difference"]
-                print_error(f"Free points discrepancy: {diff}")
+        # Show stat sources - same for ALL character types
+        print_subheader("Current Stat Sources")
+        dm = character.data_manager
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+            sources = dm.get_stat_sources(stat)
+            current = dm.get_stat(stat)
+            modifier = dm.get_stat_modifier(stat)
+            
+            # Only stats with more than one contributing source get a breakdown string
+            if has_multi_source(sources):
+                source_str = " (" + " + ".join(f"{source}: {value}" for source, value in sources.items() if value > 0) + ")"
+                print(f"{stat_name}: {current}{source_str} (modifier: {modifier})")
+            else:
+                print(f"{stat_name}: {current} (modifier: {modifier})")
+        
+        # Per-stat allocation analysis from validation (only summarized on the validation screen)
+        allocations = _stat_allocations_for(validation_result)
+        if allocations:
+            print_subheader("Stat Allocation Analysis")
+            _print_allocations(validation_result["validation_type"], allocations)
+        
+        # Show free points if any
+        free_points = character.level_system.free_points
+        if free_points > 0:
+            print_subheader("Unallocated Points")
+            print(f"Free points remaining: {free_points}")
+        
+        # Show validation-specific issues only if invalid
+        if not validation_result.get("valid", True):
+            print_subheader("Validation Issues")
+            
+            # Show stat discrepancies for any character type
+            discrepancies = validation_result.get("stat_discrepancies")
+            if discrepancies:
+                print("Stat discrepancies found:")
+                for stat, discrepancy in discrepancies.items():
+                    if "difference" in discrepancy:
+                        print_error(f"  {stat}: {discrepancy['difference']:+d} points")
+                    elif "impossible_allocation" in discrepancy:
+                        print_error(f"  {stat}: impossible allocation")
+            
+            # Show free points issues
+            if validation_result.get("free_points") and isinstance(validation_result["free_points"], dict):
+                fp_info = validation_result["free_points"]
+                if fp_info.get("difference", 0) != 0:
+                    diff = fp_info["difference"]
+                    print_error(f"Free points discrepancy: {diff}")
     
     pause_screen()
     
 def show_detailed_stat_breakdown_simple(character: Character):
     """Show detailed breakdown of where each stat point came from."""
     clear_screen()
-    print_header("Detailed Stat Source Breakdown")
-    
-    print_subheader("Free Points Usage Analysis")
-    total_free_points_used = 0
-    
-    for stat in STATS:
-        sources = character.data_manager.get_stat_sources(stat)
-        free_points_used = sources.get("free_points", 0)
+    with buffered_output():
+        print_header("Detailed Stat Source Breakdown")
         
-        if free_points_used > 0:
-            total_free_points_used += free_points_used
-            print(f"{stat.capitalize()}: {free_points_used} free points allocated")
-    
-    if total_free_points_used == 0:
-        print_info("No free points have been allocated to any stats.")
-    else:
-        print(f"\nTotal free points allocated: {total_free_points_used}")
-        print(f"Current free point balance: {character.level_system.free_points}")
-        expected_balance = total_free_points_used + character.level_system.free_points
-        print(f"Expected total from progression: {expected_balance}")
+        print_subheader("Free Points Usage Analysis")
+        total_free_points_used = 0
+        
+        get_sources = character.data_manager.get_stat_sources
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+            free_points_used = get_sources(stat).get("free_points", 0)
+            
+            if free_points_used > 0:
+                total_free_points_used += free_points_used
+                print(f"{stat_name}: {free_points_used} free points allocated")
+        
+        if total_free_points_used == 0:
+            print_info("No free points have been allocated to any stats.")
+        else:
+            free_points = character.level_system.free_points
+            print(f"\nTotal free points allocated: {total_free_points_used}")
+            print(f"Current free point balance: {free_points}")
+            print(f"Expected total from progression: {total_free_points_used + free_points}")
     
     pause_screen()
 
@@ -2570,17 +2592,15 @@ def update_stats(character: Character):
     
     # Display current stats
     print_subheader("Current Stats")
-    for stat in STATS:
-        print(f"{stat.capitalize()}: {character.data_manager.get_stat(stat)}")
+    print(format_stat_block(character.data_manager.get_all_stats()))
     
     # Get stat to update
-    print()
-    stat = input("Enter the stat to update (or 'cancel'): ").lower().strip()
+    stat = input("\nEnter the stat to update (or 'cancel'): ").lower().strip()
     
     if stat == 'cancel':
         return
     
-    if stat not in STATS:
+    if stat not in STATS_SET:
         print_error(f"Invalid stat. Available stats: {', '.join(STATS)}")
         pause_screen()
         return
@@ -2610,35 +2630,32 @@ def update_meta(character: Character):
     """Update character meta information."""
     clear_screen()
     character_type = character.data_manager.get_meta("Character Type", "character")
+    is_race_leveling = character_type in RACE_LEVELING_TYPES
     print_header(f"Update Meta Info: {character.name} ({character_type.capitalize()})")
     
     # Display current meta info
     print_subheader("Current Meta Info")
-    for meta, value in character.data_manager.get_all_meta().items():
-        print(f"{meta}: {value}")
+    print(format_meta_block(character.data_manager.iter_meta()))
     
     # Get meta info to update
-    print()
-    info = input("Enter the meta info to update (or 'cancel'): ").strip()
+    info = input("\nEnter the meta info to update (or 'cancel'): ").strip()
     
     if info.lower() == 'cancel':
         return
     
-    if info not in META_INFO:
+    if info not in META_INFO_SET:
         print_error(f"Invalid meta info. Available meta info: {', '.join(META_INFO)}")
         pause_screen()
         return
     
     # NEW: Prevent changing character type for race-leveling characters
-    if info == "Character Type":
-        current_type = character.data_manager.get_meta("Character Type", "character")
-        if current_type in RACE_LEVELING_TYPES:
-            print_error(f"Cannot change character type for {current_type}s.")
-            pause_screen()
-            return
+    if info == "Character Type" and is_race_leveling:
+        print_error(f"Cannot change character type for {character_type}s.")
+        pause_screen()
+        return
     
     # NEW: Prevent class/profession updates for familiars/monsters
-    if character.is_race_leveling_type() and ("Class" in info or "Profession" in info):
+    if is_race_leveling and ("Class" in info or "Profession" in info):
         print_error(f"{character_type.capitalize()}s cannot have {info.lower()}s.")
         pause_screen()
         return
@@ -2663,16 +2680,17 @@ def level_up_character(character: Character):
     """
     clear_screen()
     character_type = character.data_manager.get_meta("Character Type", "character")
+    is_race_leveling = character_type in RACE_LEVELING_TYPES
     print_header(f"Level Up: {character.name} ({character_type.capitalize()})")
     
     # Display current levels
     print_subheader("Current Levels")
-    for info, value in character.data_manager.get_all_meta().items():
+    for info, value in character.data_manager.iter_meta():
         if "level" in info.lower():
             print(f"{info}: {value}")
     
     # NEW: Different level type options based on character type
-    if character.is_race_leveling_type():
+    if is_race_leveling:
         print_info(f"{character_type.capitalize()}s can only level up through race levels.")
         level_type = "Race"
     else:
@@ -2680,20 +2698,19 @@ def level_up_character(character: Character):
         print_info(f"Tier thresholds: {character.data_manager.tier_thresholds}")
         
         # Get level type
-        print()
-        level_type = input("Enter level type (Class, Profession, or Race, or 'cancel'): ").strip()
+        level_type = input("\nEnter level type (Class, Profession, or Race, or 'cancel'): ").strip()
         
         if level_type.lower() == 'cancel':
             return
         
-        if level_type.lower() not in ["class", "profession", "race"]:
+        if level_type.lower() not in LEVELING_TYPES:
             print_error("Invalid level type. Must be 'Class', 'Profession', or 'Race'.")
             pause_screen()
             return
     
     # Get current level
     try:
-        current_level = int(character.data_manager.get_meta(f"{level_type} level", "0"))
+        current_level = character.data_manager.get_meta_int(f"{level_type} level")
         
         # Get target level
         target_level = int(input(f"Enter target level (current: {current_level}): "))
@@ -2714,8 +2731,7 @@ def level_up_character(character: Character):
                 
                 # Display stat gains
                 print_subheader("Updated Stats")
-                for stat in STATS:
-                    print(f"{stat.capitalize()}: {character.data_manager.get_stat(stat)}")
+                print(format_stat_block(character.data_manager.get_all_stats()))
                 
                 # Check for free points
                 if character.level_system.free_points > 0:
@@ -2734,7 +2750,8 @@ def level_up_character(character: Character):
         next_threshold = character.data_manager.get_next_tier_threshold(current_level)
         
         if next_threshold and current_level < next_threshold <= target_level:
-            current_tier = get_tier_for_level(current_level, character.data_manager.tier_thresholds)
+            thresholds = character.data_manager.tier_thresholds
+            current_tier = get_tier_for_level(current_level, thresholds)
             next_tier = current_tier + 1
             
             if level_type.lower() == "class":
@@ -2744,14 +2761,7 @@ def level_up_character(character: Character):
                 # Display current class history
                 if character.data_manager.class_history:
                     print_subheader("Class History")
-                    for entry in character.data_manager.class_history:
-                        level_range = f"Level {entry['from_level']}"
-                        if entry['to_level'] is not None:
-                            level_range += f"-{entry['to_level']}"
-                        else:
-                            level_range += "+"
-                        tier = get_tier_for_level(entry['from_level'], character.data_manager.tier_thresholds)
-                        print(f"  {entry['class']} ({level_range}) [Tier {tier}]")
+                    print(format_history_block(character.data_manager.class_history, 'class', thresholds))
                 
                 # Get available classes for the next tier
                 available_classes = get_available_classes_for_tier(next_tier)
@@ -2763,30 +2773,12 @@ def level_up_character(character: Character):
                 
                 # Display options
                 print_subheader(f"Available Tier {next_tier} Classes")
-                for i, class_name in enumerate(available_classes, 1):
-                    print(f"{i}. {class_name}")
+                print(format_tier_options("class", next_tier, indent=""))
                 
                 # Get selection
-                while True:
-                    selection = input(f"\nEnter your new tier {next_tier} class (number or name): ").strip()
-                    
-                    # Try to parse as number first
-                    try:
-                        choice_num = int(selection)
-                        if 1 <= choice_num <= len(available_classes):
-                            new_class = available_classes[choice_num - 1]
-                            break
-                        else:
-                            print_error(f"Please enter a number between 1 and {len(available_classes)}")
-                            continue
-                    except ValueError:
-                        # Try to match by name
-                        new_class = selection.lower()
-                        if validate_class_tier_combination(new_class, next_tier):
-                            break
-                        else:
-                            print_error(f"Invalid tier {next_tier} class: {selection}")
-                            continue
+                new_class = prompt_tier_selection(
+                    f"\nEnter your new tier {next_tier} class (number or name): ",
+                    available_classes, "class", next_tier)
                 
                 # Change class before leveling up
                 print_loading(f"Changing class to {new_class}")
@@ -2805,14 +2797,7 @@ def level_up_character(character: Character):
                 # Display current profession history
                 if character.data_manager.profession_history:
                     print_subheader("Profession History")
-                    for entry in character.data_manager.profession_history:
-                        level_range = f"Level {entry['from_level']}"
-                        if entry['to_level'] is not None:
-                            level_range += f"-{entry['to_level']}"
-                        else:
-                            level_range += "+"
-                        tier = get_tier_for_level(entry['from_level'], character.data_manager.tier_thresholds)
-                        print(f"  {entry['profession']} ({level_range}) [Tier {tier}]")
+                    print(format_history_block(character.data_manager.profession_history, 'profession', thresholds))
                 
                 # Get available professions for the next tier
                 available_professions = get_available_professions_for_tier(next_tier)
@@ -2824,30 +2809,12 @@ def level_up_character(character: Character):
                 
                 # Display options
                 print_subheader(f"Available Tier {next_tier} Professions")
-                for i, profession_name in enumerate(available_professions, 1):
-                    print(f"{i}. {profession_name}")
+                print(format_tier_options("profession", next_tier, indent=""))
                 
                 # Get selection
-                while True:
-                    selection = input(f"\nEnter your new tier {next_tier} profession (number or name): ").strip()
-                    
-                    # Try to parse as number first
-                    try:
-                        choice_num = int(selection)
-                        if 1 <= choice_num <= len(available_professions):
-                            new_profession = available_professions[choice_num - 1]
-                            break
-                        else:
-                            print_error(f"Please enter a number between 1 and {len(available_professions)}")
-                            continue
-                    except ValueError:
-                        # Try to match by name
-                        new_profession = selection.lower()
-                        if validate_profession_tier_combination(new_profession, next_tier):
-                            break
-                        else:
-                            print_error(f"Invalid tier {next_tier} profession: {selection}")
-                            continue
+                new_profession = prompt_tier_selection(
+                    f"\nEnter your new tier {next_tier} profession (number or name): ",
+                    available_professions, "profession", next_tier)
                 
                 # Change profession before leveling up
                 print_loading(f"Changing profession to {new_profession}")
@@ -2869,8 +2836,7 @@ def level_up_character(character: Character):
             
             # Display stat gains
             print_subheader("Updated Stats")
-            for stat in STATS:
-                print(f"{stat.capitalize()}: {character.data_manager.get_stat(stat)}")
+            print(format_stat_block(character.data_manager.get_all_stats()))
             
             # Check for free points
             if character.level_system.free_points > 0:
@@ -2887,6 +2853,113 @@ def level_up_character(character: Character):
     
     pause_screen()
 
+BULK_FREE_POINT_PLANS = frozenset(("random", "later"))
+
+def load_bulk_answers(filename: str) -> Tuple[Dict[str, Dict[int, str]], Dict[str, str]]:
+    """
+    Read a bulk leveling answers CSV with columns character_name, threshold,
+    new_class_or_profession and free_point_plan ("random" or "later"); either choice may be left blank.
+    Returns ({name: {threshold: choice}}, {name: plan}) keyed by lowercased character name.
+    """
+    answers_by_char: Dict[str, Dict[int, str]] = {}
+    plans_by_char: Dict[str, str] = {}
+    with open(filename, 'r', newline='', encoding='utf-8-sig') as file:
+        reader = csv.DictReader(file)
+        reader.fieldnames = [field.strip().lower().replace(" ", "_") for field in reader.fieldnames or []]
+        for row_num, row in enumerate(reader, start=2):
+            name = (row.get('character_name') or "").strip().lower()
+            if not name:
+                print_warning(f"Answers row {row_num}: missing character name, skipped")
+                continue
+            
+            threshold = (row.get('threshold') or "").strip()
+            choice = (row.get('new_class_or_profession') or "").strip().lower()
+            if threshold and choice:
+                if not threshold.isdecimal():
+                    print_warning(f"Answers row {row_num}: invalid threshold '{threshold}', skipped")
+                    continue
+                answers_by_char.setdefault(name, {})[int(threshold)] = choice
+            
+            plan = (row.get('free_point_plan') or "").strip().lower()
+            if plan:
+                if plan not in BULK_FREE_POINT_PLANS:
+                    print_warning(f"Answers row {row_num}: unknown free point plan '{plan}', ignored")
+                else:
+                    plans_by_char[name] = plan
+    return answers_by_char, plans_by_char
+
+def apply_bulk_tier_changes(character: Character, name: str, kind: str,
+                            current_level: int, target_level: int,
+                            answers: Optional[Dict[int, str]] = None) -> Tuple[bool, int]:
+    """
+    Prompt for and apply the new class or profession (kind) at every tier threshold a bulk level-up crosses.
+    Thresholds with a valid choice in answers ({threshold: name}) are applied without prompting.
+    Returns (whether any threshold had to be prompted for, number of errors hit).
+    """
+    # Find ALL tier thresholds that will be crossed (thresholds are kept sorted, so slice the range)
+    tier_thresholds = character.data_manager.tier_thresholds
+    thresholds_to_cross = tier_thresholds[bisect_right(tier_thresholds, current_level):
+                                          bisect_right(tier_thresholds, target_level)]
+    if not thresholds_to_cross:
+        return False, 0
+    
+    if kind == "class":
+        plural, change, validate = "classes", character.change_class, validate_class_tier_combination
+    else:
+        plural, change, validate = "professions", character.change_profession, validate_profession_tier_combination
+    errors = 0
+    prompted = False
+    
+    print_subheader(f"Multiple Tier Changes Required for {name}")
+    print_warning(f"Character will cross {len(thresholds_to_cross)} tier threshold(s): {thresholds_to_cross}")
+    
+    # Process each tier crossing
+    for threshold in thresholds_to_cross:
+        tier_at_threshold = get_tier_for_level(threshold, tier_thresholds)
+        
+        print_subheader(f"Tier Change at Level {threshold}")
+        print_info(f"Advancing to tier {tier_at_threshold}")
+        
+        # Get available options for this tier
+        if kind == "class":
+            available = get_available_classes_for_tier(tier_at_threshold)
+        else:
+            available = get_available_professions_for_tier(tier_at_threshold)
+        
+        if not available:
+            print_error(f"No tier {tier_at_threshold} {plural} available!")
+            errors += 1
+            pause_screen()
+            continue
+        
+        # Take the answers file's choice when it is valid for this tier; otherwise ask
+        new_name = answers.get(threshold) if answers else None
+        if new_name is not None and not validate(new_name, tier_at_threshold):
+            print_error(f"Answers file: {new_name} is not a tier {tier_at_threshold} {kind}.")
+            new_name = None
+        
+        if new_name is None:
+            # Display options
+            print(f"Available Tier {tier_at_threshold} {plural.capitalize()}:")
+            print(format_tier_options(kind, tier_at_threshold))
+            
+            # Get selection
+            new_name = prompt_tier_selection(
+                f"\nEnter new tier {tier_at_threshold} {kind} for {name} at level {threshold} (number or name): ",
+                available, kind, tier_at_threshold)
+            prompted = True
+        
+        # Change class/profession at this threshold
+        if not change(new_name, threshold):
+            print_error(f"Failed to change {kind} at level {threshold}.")
+            errors += 1
+            pause_screen()
+            break  # Exit the threshold loop
+        
+        print_success(f"{kind.capitalize()} will change to {new_name} at level {threshold}")
+    
+    return prompted, errors
+
 def bulk_level_characters(item_repository):
     """
     Bulk level multiple characters from a CSV file with level type and levels gained.
@@ -2929,23 +3002,39 @@ def bulk_level_characters(item_repository):
         pause_screen()
         return
     
+    # Optional answers file so tier changes and free points need no prompts.
+    # ASPECTS_BULK_ANSWERS supplies it for any run; otherwise it is only offered
+    # interactively, so piped/scripted runs keep their input lines.
+    answers_by_char: Dict[str, Dict[int, str]] = {}
+    plans_by_char: Dict[str, str] = {}
+    answers_file = BULK_ANSWERS_FILE
+    if not answers_file and INTERACTIVE and confirm_action("Do you have an answers file?"):
+        answers_file = input("Enter the answers CSV filename: ").strip()
+    if answers_file:
+        if not answers_file.endswith('.csv'):
+            answers_file += '.csv'
+        try:
+            answers_by_char, plans_by_char = load_bulk_answers(answers_file)
+        except Exception as e:
+            print_error(f"Error reading answers file: {str(e)}")
+            pause_screen()
+            return
+        print_info(f"Loaded answers for {len(answers_by_char.keys() | plans_by_char.keys())} characters")
+    
     # Read character leveling data from CSV
     leveling_data = []
     try:
         # Use utf-8-sig encoding to automatically handle UTF-8 BOM from Excel
         with open(leveling_file, 'r', newline='', encoding='utf-8-sig') as file:
-            # Try to detect if it has headers
-            sample = file.read(1024)
-            file.seek(0)
+            reader = csv.reader(file)
             
-            # Check if first line looks like headers
-            first_line = sample.split('\n')[0] if sample else ""
+            # Check if the first row looks like headers (read once; a data row is chained back in below)
+            first_row = next(reader, None)
+            first_line = ",".join(first_row) if first_row else ""
             has_header = any(keyword in first_line.lower() for keyword in ['character name', 'level type', 'levels gained', 'name', 'level', 'gain'])
             
-            reader = csv.reader(file)
-            
             if has_header:
-                headers = next(reader)  # Skip header and store for reference
+                headers = first_row  # Store header for reference
                 print_info(f"Detected headers: {', '.join(headers)}")
                 
                 # Try to map headers to expected column positions
@@ -2979,7 +3068,8 @@ def bulk_level_characters(item_repository):
                 header_map = {'name': 0, 'level_type': 1, 'levels_gained': 2}
                 print_info("No headers detected, assuming column order: Character Name, Level Type, Levels Gained")
             
-            for row_num, row in enumerate(reader, start=2 if has_header else 1):
+            rows = reader if has_header or first_row is None else chain([first_row], reader)
+            for row_num, row in enumerate(rows, start=2 if has_header else 1):
                 if len(row) < 3:
                     print_warning(f"Skipping row {row_num}: insufficient columns (need 3, got {len(row)})")
                     continue
@@ -2997,12 +3087,13 @@ def bulk_level_characters(item_repository):
                     continue
                 
                 # NEW: Validate level type and normalize case (includes Race)
-                if level_type.lower() not in ["class", "profession", "race"]:
+                level_type_lower = level_type.lower()
+                if level_type_lower not in LEVELING_TYPES:
                     print_error(f"Row {row_num}: Invalid level type '{level_type}'. Must be 'Class', 'Profession', or 'Race'.")
                     continue
                 
                 # Normalize case to match META_INFO constants
-                level_type = level_type.lower().capitalize()  # "class" -> "Class", "profession" -> "Profession", "race" -> "Race"
+                level_type = level_type_lower.capitalize()  # "class" -> "Class", "profession" -> "Profession", "race" -> "Race"
                 
                 # NEW: Validate levels gained (must be positive integer)
                 try:
@@ -3017,6 +3108,7 @@ def bulk_level_characters(item_repository):
                 leveling_data.append({
                     'name': name,
                     'level_type': level_type,
+                    'level_type_lower': level_type_lower,
                     'levels_gained': levels_gained,
                     'row_num': row_num
                 })
@@ -3031,31 +3123,69 @@ def bulk_level_characters(item_repository):
         pause_screen()
         return
     
+    # Read the character repo once; each operation builds its character from the cached row
+    try:
+        character_rows = Character.read_file_rows(character_file)
+    except Exception as e:
+        print_error(f"Error reading character file: {str(e)}")
+        pause_screen()
+        return
+    
+    # Cross-check every operation against the repo before asking to proceed
+    runnable = []
+    for data in leveling_data:
+        row = character_rows.get(data['name'].lower())
+        if row is None:
+            print_error(f"Row {data['row_num']}: Character '{data['name']}' not found in {character_file}.")
+            continue
+        character_type = row.get("Character Type") or "character"
+        if character_type in RACE_LEVELING_TYPES and data['level_type_lower'] != "race":
+            print_error(f"Row {data['row_num']}: {data['name']} is a {character_type} "
+                        f"and cannot level up in {data['level_type']}.")
+            continue
+        runnable.append(data)
+    rejected = len(leveling_data) - len(runnable)
+    leveling_data = runnable
+    
+    if not leveling_data:
+        print_error("None of the leveling operations match a character that can take them.")
+        pause_screen()
+        return
+    
     print_success(f"Found {len(leveling_data)} valid leveling operations:")
     for data in leveling_data:
         print(f"  - {data['name']}: {data['level_type']} +{data['levels_gained']} levels")
+    if rejected:
+        print_warning(f"{rejected} operation(s) will be skipped (see errors above).")
     
     if not confirm_action(f"Process {len(leveling_data)} leveling operations?"):
         return
     
     # Process each character
     processed = 0
-    errors = 0
+    errors = rejected  # Operations rejected by the cross-check count as errors in the summary
     skipped = 0
     processed_characters = []  # Store successfully processed characters
     
+    # Random-for-all needs no per-character screens: log one line each and show the log at the end.
+    # Tier changes and errors still print as they happen.
+    quiet_mode = allocation_method == '2'
+    results_log = []
+    
     for i, data in enumerate(leveling_data, 1):
         name = data['name']
         level_type = data['level_type']
+        level_type_lower = data['level_type_lower']
         levels_gained = data['levels_gained']
         
-        clear_screen()
-        print_header(f"Processing {i}/{len(leveling_data)}: {name}")
-        print_info(f"Operation: {level_type} +{levels_gained} levels")
+        if not quiet_mode:
+            clear_screen()
+            print_header(f"Processing {i}/{len(leveling_data)}: {name}")
+            print_info(f"Operation: {level_type} +{levels_gained} levels")
         
         # Load the character
         try:
-            character = Character.load_from_file(character_file, name, item_repository)
+            character = Character.load_from_rows(character_rows, character_file, name, item_repository)
             
             if not character:
                 print_error(f"Character '{name}' not found in {character_file}.")
@@ -3066,14 +3196,14 @@ def bulk_level_characters(item_repository):
             # NEW: Check character type compatibility with level type
             character_type = character.data_manager.get_meta("Character Type", "character")
             
-            if character.is_race_leveling_type() and level_type.lower() in ["class", "profession"]:
+            if character.is_race_leveling_type() and level_type_lower in CLASS_OR_PROFESSION:
                 print_error(f"{name} is a {character_type} and cannot level up in {level_type}.")
                 print_info("Use race level up instead.")
                 errors += 1
                 pause_screen()
                 continue
             
-            if not character.is_race_leveling_type() and level_type.lower() == "race":
+            if not character.is_race_leveling_type() and level_type_lower == "race":
                 print_warning(f"{name} is a regular character. Race levels are calculated automatically from class/profession levels.")
                 print_info("Consider using class or profession level up instead.")
                 if not confirm_action("Continue with race level up anyway?"):
@@ -3081,135 +3211,26 @@ def bulk_level_characters(item_repository):
                     continue
             
             # Get current level and calculate target level
-            current_level = int(character.data_manager.get_meta(f"{level_type} level", "0"))
+            current_level = character.data_manager.get_meta_int(LEVEL_KEY[level_type])
             target_level = current_level + levels_gained
             
-            print_info(f"Current {level_type} level: {current_level}")
-            print_info(f"Levels to gain: +{levels_gained}")
-            print_info(f"Target {level_type} level: {target_level}")
+            if not quiet_mode:
+                print_info(f"Current {level_type} level: {current_level}")
+                print_info(f"Levels to gain: +{levels_gained}")
+                print_info(f"Target {level_type} level: {target_level}")
             
             # Check for ALL tier changes that will be crossed (only for class/profession)
             needs_pause = False  # Track if user interaction occurred
             
-            if level_type.lower() in ["class", "profession"]:
-                # Find ALL tier thresholds that will be crossed
-                thresholds_to_cross = []
-                for threshold in character.data_manager.tier_thresholds:
-                    if current_level < threshold <= target_level:
-                        thresholds_to_cross.append(threshold)
+            if level_type_lower != "race":
+                needs_pause, tier_errors = apply_bulk_tier_changes(
+                    character, name, level_type_lower, current_level, target_level,
+                    answers_by_char.get(name.lower()))
+                errors += tier_errors
                 
-                thresholds_to_cross.sort()  # Process in order
-                
-                if thresholds_to_cross:
-                    needs_pause = True  # Tier changes require user input
-                    
-                    print_subheader(f"Multiple Tier Changes Required for {name}")
-                    print_warning(f"Character will cross {len(thresholds_to_cross)} tier threshold(s): {thresholds_to_cross}")
-                    
-                    # Process each tier crossing
-                    for threshold in thresholds_to_cross:
-                        tier_at_threshold = get_tier_for_level(threshold, character.data_manager.tier_thresholds)
-                        
-                        print_subheader(f"Tier Change at Level {threshold}")
-                        print_info(f"Advancing to tier {tier_at_threshold}")
-                        
-                        if level_type.lower() == "class":
-                            # Get available classes for this tier
-                            available_classes = get_available_classes_for_tier(tier_at_threshold)
-                            
-                            if not available_classes:
-                                print_error(f"No tier {tier_at_threshold} classes available!")
-                                errors += 1
-                                pause_screen()
-                                continue
-                            
-                            # Display options
-                            print(f"Available Tier {tier_at_threshold} Classes:")
-                            for j, class_name in enumerate(available_classes, 1):
-                                print(f"  {j}. {class_name}")
-                            
-                            # Get selection
-                            while True:
-                                selection = input(f"\nEnter new tier {tier_at_threshold} class for {name} at level {threshold} (number or name): ").strip()
-                                
-                                # Try to parse as number first
-                                try:
-                                    choice_num = int(selection)
-                                    if 1 <= choice_num <= len(available_classes):
-                                        new_class = available_classes[choice_num - 1]
-                                        break
-                                    else:
-                                        print_error(f"Please enter a number between 1 and {len(available_classes)}")
-                                        continue
-                                except ValueError:
-                                    # Try to match by name
-                                    new_class = selection.lower()
-                                    if validate_class_tier_combination(new_class, tier_at_threshold):
-                                        break
-                                    else:
-                                        print_error(f"Invalid tier {tier_at_threshold} class: {selection}")
-                                        continue
-                            
-                            # Change class at this threshold
-                            success = character.change_class(new_class, threshold)
-                            if not success:
-                                print_error(f"Failed to change class at level {threshold}.")
-                                errors += 1
-                                pause_screen()
-                                break  # Exit the threshold loop
-                                
-                            print_success(f"Class will change to {new_class} at level {threshold}")
-                        
-                        elif level_type.lower() == "profession":
-                            # Get available professions for this tier
-                            available_professions = get_available_professions_for_tier(tier_at_threshold)
-                            
-                            if not available_professions:
-                                print_error(f"No tier {tier_at_threshold} professions available!")
-                                errors += 1
-                                pause_screen()
-                                continue
-                            
-                            # Display options
-                            print(f"Available Tier {tier_at_threshold} Professions:")
-                            for j, profession_name in enumerate(available_professions, 1):
-                                print(f"  {j}. {profession_name}")
-                            
-                            # Get selection
-                            while True:
-                                selection = input(f"\nEnter new tier {tier_at_threshold} profession for {name} at level {threshold} (number or name): ").strip()
-                                
-                                # Try to parse as number first
-                                try:
-                                    choice_num = int(selection)
-                                    if 1 <= choice_num <= len(available_professions):
-                                        new_profession = available_professions[choice_num - 1]
-                                        break
-                                    else:
-                                        print_error(f"Please enter a number between 1 and {len(available_professions)}")
-                                        continue
-                                except ValueError:
-                                    # Try to match by name
-                                    new_profession = selection.lower()
-                                    if validate_profession_tier_combination(new_profession, tier_at_threshold):
-                                        break
-                                    else:
-                                        print_error(f"Invalid tier {tier_at_threshold} profession: {selection}")
-                                        continue
-                            
-                            # Change profession at this threshold
-                            success = character.change_profession(new_profession, threshold)
-                            if not success:
-                                print_error(f"Failed to change profession at level {threshold}.")
-                                errors += 1
-                                pause_screen()
-                                break  # Exit the threshold loop
-                                
-                            print_success(f"Profession will change to {new_profession} at level {threshold}")
-                    
-                    # If we hit an error during tier changes, continue to next character
-                    if errors > (processed + skipped):  # Error count increased
-                        continue
+                # If we hit an error during tier changes, continue to next character
+                if tier_errors:
+                    continue
             
             # Now proceed with level up (no loading screen)
             success = character.level_up(level_type, target_level)
@@ -3220,14 +3241,28 @@ def bulk_level_characters(item_repository):
                 pause_screen()  # Pause for errors
                 continue
             
-            print_success(f"Leveled up {name} to {level_type} level {target_level} (+{levels_gained} levels)")
+            if not quiet_mode:
+                print_success(f"Leveled up {name} to {level_type} level {target_level} (+{levels_gained} levels)")
             
             # Handle free points allocation
             if character.level_system.free_points > 0:
                 needs_pause = True  # Point allocation requires user input
-                print_info(f"{name} has {character.level_system.free_points} free points to allocate.")
+                if not quiet_mode:
+                    print_info(f"{name} has {character.level_system.free_points} free points to allocate.")
+                free_point_plan = plans_by_char.get(name.lower())
+                
+                if free_point_plan == "random":
+                    character.allocate_random()
+                    if not quiet_mode:
+                        print_success("Free points allocated randomly (answers file).")
+                    needs_pause = False
+                
+                elif free_point_plan == "later":
+                    if not quiet_mode:
+                        print_info("Free points saved for later (answers file).")
+                    needs_pause = False
                 
-                if allocation_method == '1':
+                elif allocation_method == '1':
                     # Ask for each character individually using existing function
                     print_subheader(f"Allocate Free Points for {name}")
                     print("1. Use existing allocation interface")
@@ -3246,9 +3281,8 @@ def bulk_level_characters(item_repository):
                     # choice == '3' or invalid: save for later (do nothing)
                 
                 elif allocation_method == '2':
-                    # Random allocation for all - no user input needed
+                    # Random allocation for all - no user input needed (quiet mode logs it instead)
                     character.allocate_random()
-                    print_success("Free points allocated randomly.")
                     needs_pause = False  # No user interaction needed for auto-random
                 
                 # allocation_method == '3': save for later (do nothing)
@@ -3257,6 +3291,10 @@ def bulk_level_characters(item_repository):
             # Store processed character for batch saving later
             processed_characters.append(character)
             processed += 1
+            if quiet_mode:
+                unspent = character.level_system.free_points
+                results_log.append(f"{name}: +{levels_gained} {level_type} OK (level {target_level})"
+                                   + (f", {unspent} free points saved" if unspent > 0 else ""))
         
         except Exception as e:
             print_error(f"Error processing {name}: {str(e)}")
@@ -3326,19 +3364,13 @@ def bulk_level_characters(item_repository):
         saved_count = 0
         save_errors = 0
         
-        for i, character in enumerate(processed_characters):
-            try:
-                # Use 'w' mode for first character, 'a' for subsequent ones
-                mode = save_mode if i == 0 else "a"
-                success = character.save(save_file, mode=mode)
-                
-                if success:
-                    saved_count += 1
-                else:
-                    print_error(f"Failed to save {character.name}")
-                    save_errors += 1
-            except Exception as e:
-                print_error(f"Error saving {character.name}: {str(e)}")
+        # One read and one write of the file for the whole batch
+        results = Character.save_many(save_file, processed_characters, mode=save_mode)
+        for character, success in zip(processed_characters, results):
+            if success:
+                saved_count += 1
+            else:
+                print_error(f"Failed to save {character.name}")
                 save_errors += 1
         
         if saved_count == len(processed_characters):
@@ -3352,6 +3384,9 @@ def bulk_level_characters(item_repository):
     # Summary
     clear_screen()
     print_header("Bulk Leveling Complete")
+    if quiet_mode and results_log:
+        print("\n".join(results_log))
+        print()
     print_success(f"Successfully processed: {processed} operations")
     if skipped > 0:
         print_info(f"Skipped (character type mismatch): {skipped} operations")
@@ -3383,15 +3418,13 @@ def allocate_points(character: Character):
         print_info("You can view stats but cannot allocate more points until balance is positive.")
     
     print_subheader("Current Stats")
-    for stat in STATS:
-        sources = character.data_manager.get_stat_sources(stat)
-        current = character.data_manager.get_stat(stat)
-        free_points_used = sources.get("free_points", 0)
-        
-        if free_points_used > 0:
-            print(f"{stat.capitalize()}: {current} (free points used: {free_points_used})")
-        else:
-            print(f"{stat.capitalize()}: {current}")
+    current_stats = character.data_manager.get_all_stats()
+    free_points_used = character.data_manager.get_source_points(StatSource.FREE_POINTS)
+    print("\n".join(
+        f"{stat_name}: {current_stats[stat]}"
+        + (f" (free points used: {free_points_used[stat]})" if free_points_used[stat] > 0 else "")
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED)
+    ))
     
     # Show allocation options based on free point status
     if free_points <= 0:
@@ -3420,32 +3453,25 @@ def allocate_points(character: Character):
         # Random allocation
         print_loading("Allocating points randomly")
         
-        # Track stat gains for display
-        stat_gains = {stat: 0 for stat in STATS}
-        
-        # Allocate points randomly
-        for _ in range(free_points):
-            stat = random.choice(STATS)
-            character.allocate_free_points(stat, 1)
-            stat_gains[stat] += 1
+        # Allocate points randomly, keeping the per-stat gains for display
+        stat_gains = character.allocate_random()
         
         # Display results
         print_success("All free points have been randomly allocated:")
-        for stat, gain in stat_gains.items():
-            if gain > 0:
-                print(f"{stat.capitalize()}: +{gain}")
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+            if stat in stat_gains:
+                print(f"{stat_name}: +{stat_gains[stat]}")
     
     elif allocation_choice == "manual":
         # Manual allocation
         remaining_points = free_points
         
         while remaining_points > 0:
-            clear_screen()
-            print_header(f"Manual Point Allocation: {remaining_points} points left")
-            
-            print_subheader("Current Stats")
-            for stat in STATS:
-                print(f"{stat.capitalize()}: {character.data_manager.get_stat(stat)}")
+            with redraw_frame():
+                print_header(f"Manual Point Allocation: {remaining_points} points left")
+                
+                print_subheader("Current Stats")
+                print(format_stat_block(character.data_manager.get_all_stats()))
             
             print()
             stat = input("Enter the stat to increase (or 'done'): ").lower().strip()
@@ -3454,7 +3480,7 @@ def allocate_points(character: Character):
                 print_info(f"{remaining_points} points saved for later.")
                 break
             
-            if stat not in STATS:
+            if stat not in STATS_SET:
                 print_error(f"Invalid stat. Available stats: {', '.join(STATS)}")
                 pause_screen()
                 continue
@@ -3514,57 +3540,59 @@ def deallocate_free_points(character: Character):
         return
     
     # Deallocation loop - similar to manual allocation loop
-    while character.level_system.free_points < 0:
-        clear_screen()
-        overspent_amount = abs(character.level_system.free_points)
-        print_header(f"Free Point Deallocation: {overspent_amount} points overspent")
-        
-        # Show current status
-        print_subheader("Current Status")
-        print_colored(f"Free point balance: {character.level_system.free_points} (overspent by {overspent_amount})", 'red')
-        print_colored(f"Remaining to deallocate: {overspent_amount} points", 'yellow')
-        
-        # Show current free point allocations
-        print_subheader("Current Free Point Allocations")
-        allocations = {}
-        total_allocated = 0
-        
-        for stat in STATS:
-            sources = character.data_manager.get_stat_sources(stat)
-            free_points_used = sources.get("free_points", 0)
-            if free_points_used > 0:
-                allocations[stat] = free_points_used
-                total_allocated += free_points_used
-                # Show how much can be deallocated from this stat
-                max_from_stat = min(free_points_used, overspent_amount)
-                print(f"{stat.capitalize()}: {free_points_used} points allocated (can remove up to {max_from_stat})")
-        
-        if not allocations:
-            print_error("No free points are allocated to stats, but balance is negative.")
-            print_error("This indicates a data inconsistency that cannot be fixed with deallocation.")
-            break
-        
-        print(f"\nTotal currently allocated: {total_allocated}")
+    level_system = character.level_system
+    while level_system.free_points < 0:
+        balance = level_system.free_points  # Read once per frame; re-read after a removal
+        overspent_amount = -balance
+        with redraw_frame():
+            print_header(f"Free Point Deallocation: {overspent_amount} points overspent")
+            
+            # Show current status
+            print_subheader("Current Status")
+            print_colored(f"Free point balance: {balance} (overspent by {overspent_amount})", 'red')
+            print_colored(f"Remaining to deallocate: {overspent_amount} points", 'yellow')
+            
+            # Show current free point allocations
+            print_subheader("Current Free Point Allocations")
+            allocations = {}
+            total_allocated = 0
+            free_points_by_stat = character.data_manager.get_source_points(StatSource.FREE_POINTS)
+            
+            for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+                free_points_used = free_points_by_stat[stat]
+                if free_points_used > 0:
+                    allocations[stat] = free_points_used
+                    total_allocated += free_points_used
+                    # Show how much can be deallocated from this stat
+                    max_from_stat = min(free_points_used, overspent_amount)
+                    print(f"{stat_name}: {free_points_used} points allocated (can remove up to {max_from_stat})")
+            
+            if not allocations:
+                print_error("No free points are allocated to stats, but balance is negative.")
+                print_error("This indicates a data inconsistency that cannot be fixed with deallocation.")
+                break
+            
+            print(f"\nTotal currently allocated: {total_allocated}")
         
         # Get user choice
         print()
         stat = input("Enter stat to remove points from (or 'done' to finish): ").lower().strip()
         
         if stat == "done":
-            remaining_overspent = abs(character.level_system.free_points)
-            if remaining_overspent > 0:
-                print_info(f"Deallocation stopped. {remaining_overspent} points still overspent.")
+            # Nothing was removed since the frame was drawn, so the balance is still current
+            if overspent_amount > 0:
+                print_info(f"Deallocation stopped. {overspent_amount} points still overspent.")
             else:
                 print_success("All overspent points have been deallocated!")
             break
         
-        if stat not in STATS:
+        if stat not in STATS_SET:
             print_error(f"Invalid stat. Available stats: {', '.join(STATS)}")
             pause_screen()
             continue
         
         if stat not in allocations:
-            print_error(f"{stat.capitalize()} has no allocated free points to remove.")
+            print_error(f"{STAT_LABELS[stat]} has no allocated free points to remove.")
             pause_screen()
             continue
         
@@ -3579,15 +3607,15 @@ def deallocate_free_points(character: Character):
                 print_error("Please enter a positive number.")
             elif amount > max_removable:
                 print_error(f"You can only remove up to {max_removable} points from {stat}.")
-                print_info(f"  - {stat.capitalize()} has {current_allocation} points allocated")
+                print_info(f"  - {STAT_LABELS[stat]} has {current_allocation} points allocated")
                 print_info(f"  - Only {overspent_amount} points are overspent")
             else:
                 # Remove the points by subtracting from the stat and adding back to free points
                 character.data_manager.add_stat(stat, -amount, "free_points")
-                character.level_system.free_points += amount
+                level_system.free_points += amount
                 
                 print_success(f"Removed {amount} free points from {stat}")
-                new_balance = character.level_system.free_points
+                new_balance = level_system.free_points
                 
                 if new_balance >= 0:
                     print_success(f"Free point balance is now: {new_balance} (no longer overspent!)")
@@ -3599,7 +3627,7 @@ def deallocate_free_points(character: Character):
             print_error("Please enter a valid number.")
         
         # Pause before next iteration (unless we've reached 0 or positive)
-        if character.level_system.free_points < 0:
+        if level_system.free_points < 0:
             pause_screen()
     
     # Final status
@@ -3627,12 +3655,13 @@ def add_blessing(character: Character):
     """Add a blessing with stat bonuses."""
     clear_screen()
     character_type = character.data_manager.get_meta("Character Type", "character")
-    print_header(f"Add Blessing: {character.name} ({character_type.capitalize()})")
+    title = f"Add Blessing: {character.name} ({character_type.capitalize()})"
+    print_header(title)
     
     if hasattr(character, 'blessing') and character.blessing:
         print_warning("Character already has a blessing:")
         for stat, value in character.blessing.items():
-            print(f"{stat.capitalize()}: +{value}")
+            print(f"{STAT_LABELS[stat]}: +{value}")
         
         if not confirm_action("Do you want to replace the existing blessing?"):
             return
@@ -3641,13 +3670,17 @@ def add_blessing(character: Character):
     print_subheader("Add Blessing Stats")
     
     blessing_stats = {}
+    repaint = False  # The intro stays up for the first entry; later entries repaint in place
     
     while True:
         # Display current blessing stats
-        if blessing_stats:
-            print_subheader("Current Blessing")
-            for stat, value in blessing_stats.items():
-                print(f"{stat.capitalize()}: +{value}")
+        if repaint:
+            with redraw_frame():
+                print_header(title)
+                if blessing_stats:
+                    print_subheader("Current Blessing")
+                    print("\n".join(f"{STAT_LABELS[stat]}: +{value}" for stat, value in blessing_stats.items()))
+        repaint = True
         
         # Get stat to bless
         print()
@@ -3664,14 +3697,12 @@ def add_blessing(character: Character):
                 continue
             break
         
-        if stat not in STATS:
+        if stat not in STATS_SET:
             print_error(f"Invalid stat. Available stats: {', '.join(STATS)}")
             pause_screen()
-            clear_screen()
-            print_header(f"Add Blessing: {character.name} ({character_type.capitalize()})")
             continue
         
-        # Get blessing value
+        # Get blessing value (a success shows up in the repainted list, so only errors pause)
         try:
             value = int(input(f"Enter blessing value for {stat}: "))
             if value <= 0:
@@ -3684,10 +3715,7 @@ def add_blessing(character: Character):
         
         except ValueError:
             print_error("Please enter a valid integer.")
-        
-        pause_screen()
-        clear_screen()
-        print_header(f"Add Blessing: {character.name} ({character_type.capitalize()})")
+            pause_screen()
     
     # Apply the blessing
     if blessing_stats:
@@ -3738,21 +3766,24 @@ def create_character_sheet(character: Character):
         print_loading("Creating character sheet")
         
         import csv
+        # Build the sheet in memory so the file gets a single write call
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        # Write header
+        writer.writerow(["Attribute", "Base Value", "Current Value", "Modifier"])
+        
+        # Write stats from one snapshot of each view
+        base_stats = character.data_manager.get_source_points(StatSource.BASE)
+        current_stats = character.data_manager.get_all_stats()
+        modifiers = character.data_manager.get_all_modifiers()
+        writer.writerows(
+            [stat_name, base_stats[stat], current_stats[stat], modifiers[stat]]
+            for stat, stat_name in zip(STATS, STATS_CAPITALIZED)
+        )
+        
         with open(filename, "w", newline="") as file:
-            writer = csv.writer(file)
-            
-            # Write header
-            writer.writerow(["Attribute", "Base Value", "Current Value", "Modifier"])
-            
-            # Write stats
-            for stat in STATS:
-                sources = character.data_manager.get_stat_sources(stat)
-                writer.writerow([
-                    stat.capitalize(),
-                    sources.get("base", 0),
-                    character.data_manager.get_stat(stat),
-                    character.data_manager.get_stat_modifier(stat)
-                ])
+            file.write(buffer.getvalue())
         
         print_success(f"Character sheet created: {filename}")
     
@@ -3774,6 +3805,7 @@ def simulate_combat(character: Character, item_repository):
     print("1. Fight against a clone of your character")
     print("2. Fight against a standard enemy (all stats 50)")
     print("3. Fight against a custom enemy")
+    print("4. Auto-simulate N rounds (choose the opponent next)")
     print("0. Cancel")
     
     choice = input("\nEnter your choice: ").strip()
@@ -3781,6 +3813,16 @@ def simulate_combat(character: Character, item_repository):
     if choice == '0':
         return
     
+    # Auto mode runs every round at once and shows one log; only this option asks for more input
+    auto = choice == '4'
+    if auto:
+        try:
+            rounds = parse_small_int(input("Maximum rounds (default: 5): "), 5)
+        except ValueError:
+            print_warning("Invalid number, using 5 rounds.")
+            rounds = 5
+        choice = input("Choose the opponent (1-3): ").strip()
+    
     # Create the enemy
     if choice == '1':
         # Clone the player's character
@@ -3814,13 +3856,10 @@ def simulate_combat(character: Character, item_repository):
         print_subheader("Enter Enemy Stats")
         print_info("Default value is 50 if left empty.")
         
-        for stat in STATS:
+        for stat, prompt in zip(STATS, _STAT_PROMPTS):
             while True:
                 try:
-                    value = input(f"{stat.capitalize()}: ").strip()
-                    if not value:
-                        value = "50"  # Default value
-                    enemy_stats[stat] = int(value)
+                    enemy_stats[stat] = parse_small_int(input(prompt), 50)
                     break
                 except ValueError:
                     print_error("Please enter a valid integer.")
@@ -3837,79 +3876,127 @@ def simulate_combat(character: Character, item_repository):
         pause_screen()
         return
     
-    # Run the combat simulation
-    run_combat_simulation(character, enemy)
+    if auto:
+        run_combat_simulation(character, enemy, auto=True, rounds=max(rounds, 1))
+    else:
+        # Run the combat simulation
+        run_combat_simulation(character, enemy)
 
-def run_combat_simulation(character: Character, enemy: Character):
-    """Run a combat simulation between two characters."""
+def run_combat_simulation(character: Character, enemy: Character, auto: bool = False, rounds: int = 5):
+    """
+    Run a combat simulation between two characters for up to rounds rounds.
+    With auto, every round runs without pausing and the fight is shown as one log at the end.
+    """
     clear_screen()
-    print_header("Combat Simulation")
-    
-    print_subheader(f"{character.name} vs {enemy.name}")
-    
-    # Display character stats
-    print(f"{character.name}'s Stats:")
-    for stat in ["strength", "dexterity", "toughness", "vitality"]:
-        print(f"  {stat.capitalize()}: {character.data_manager.get_stat(stat)}")
-    
-    print(f"\n{enemy.name}'s Stats:")
-    for stat in ["strength", "dexterity", "toughness", "vitality"]:
-        print(f"  {stat.capitalize()}: {enemy.data_manager.get_stat(stat)}")
+    with buffered_output():
+        print_header("Combat Simulation")
+        
+        print_subheader(f"{character.name} vs {enemy.name}")
+        
+        # Display character stats
+        print(f"{character.name}'s Stats:")
+        stats = character.data_manager.get_all_stats()
+        for stat in COMBAT_STATS:
+            print(f"  {STAT_LABELS[stat]}: {stats[stat]}")
+        
+        print(f"\n{enemy.name}'s Stats:")
+        stats = enemy.data_manager.get_all_stats()
+        for stat in COMBAT_STATS:
+            print(f"  {STAT_LABELS[stat]}: {stats[stat]}")
     
     # Initialize combat
     character.health_manager.reset_health()
     enemy.health_manager.reset_health()
     
-    print("\nPress Enter to start combat...")
-    input()
-    
-    # Run the simulation for 5 rounds or until one character is defeated
-    for round_num in range(1, 6):
-        clear_screen()
-        print_header(f"Combat Round {round_num}")
-        
-        # Display health
-        print(f"{character.name}'s Health: {character.health_manager.current_health}/{character.health_manager.max_health}")
-        print(f"{enemy.name}'s Health: {enemy.health_manager.current_health}/{enemy.health_manager.max_health}")
-        print()
-        
-        # Character attacks enemy
-        hit, damage, net_damage = character.combat_system.attack(enemy)
-        
-        if hit:
-            print_success(f"{character.name} hit for {net_damage} damage!")
-        else:
-            print_error(f"{character.name} missed!")
-        
-        if not enemy.health_manager.is_alive():
-            print_success(f"\n{enemy.name} was defeated in round {round_num}!")
-            break
-        
-        # Enemy attacks character
-        hit, damage, net_damage = enemy.combat_system.attack(character)
-        
-        if hit:
-            print_error(f"{enemy.name} hit for {net_damage} damage!")
-        else:
-            print_success(f"{enemy.name} missed!")
-        
-        if not character.health_manager.is_alive():
-            print_error(f"\n{character.name} was defeated in round {round_num}!")
-            break
-        
-        # Pause between rounds
-        if round_num < 5 and character.health_manager.is_alive() and enemy.health_manager.is_alive():
-            input("\nPress Enter for next round...")
+    if auto:
+        report_auto_combat(character, enemy, rounds)
+    else:
+        print("\nPress Enter to start combat...")
+        input()
+        play_combat_rounds(character, enemy, rounds)
     
-    # Check if both are still alive after 5 rounds
+    # Check if both are still alive after the last round
     if character.health_manager.is_alive() and enemy.health_manager.is_alive():
-        print_info("\nBoth combatants are still standing after 5 rounds!")
+        print_info(f"\nBoth combatants are still standing after {rounds} rounds!")
     
     # Reset character's health after combat
     character.health_manager.reset_health()
     
     pause_screen()
 
+def play_combat_rounds(character: Character, enemy: Character, rounds: int):
+    """Fight round by round, redrawing each round and waiting for Enter in between."""
+    # Run the simulation for the given rounds or until one character is defeated
+    for round_num in range(1, rounds + 1):
+        with redraw_frame():
+            print_header(f"Combat Round {round_num}")
+            
+            # Display health
+            print(f"{character.name}'s Health: {character.health_manager.current_health}/{character.health_manager.max_health}")
+            print(f"{enemy.name}'s Health: {enemy.health_manager.current_health}/{enemy.health_manager.max_health}")
+            print()
+            
+            # Character attacks enemy
+            hit, damage, net_damage = character.combat_system.attack(enemy)
+            
+            if hit:
+                print_success(f"{character.name} hit for {net_damage} damage!")
+            else:
+                print_error(f"{character.name} missed!")
+            
+            if not enemy.health_manager.is_alive():
+                print_success(f"\n{enemy.name} was defeated in round {round_num}!")
+                break
+            
+            # Enemy attacks character
+            hit, damage, net_damage = enemy.combat_system.attack(character)
+            
+            if hit:
+                print_error(f"{enemy.name} hit for {net_damage} damage!")
+            else:
+                print_success(f"{enemy.name} missed!")
+            
+            if not character.health_manager.is_alive():
+                print_error(f"\n{character.name} was defeated in round {round_num}!")
+                break
+        
+        # Pause between rounds
+        if round_num < rounds and character.health_manager.is_alive() and enemy.health_manager.is_alive():
+            input("\nPress Enter for next round...")
+
+def auto_combat_rounds(character: Character, enemy: Character, rounds: int) -> List[Tuple[int, str, bool, int]]:
+    """
+    Fight up to rounds rounds without any output, each combatant attacking once per round.
+    Returns (round, attacker name, hit, net damage) per attack, stopping as soon as one side falls.
+    """
+    log = []
+    for round_num in range(1, rounds + 1):
+        for attacker, defender in ((character, enemy), (enemy, character)):
+            hit, _, net_damage = attacker.combat_system.attack(defender)
+            log.append((round_num, attacker.name, hit, net_damage))
+            if not defender.health_manager.is_alive():
+                return log
+    return log
+
+def report_auto_combat(character: Character, enemy: Character, rounds: int):
+    """Run auto_combat_rounds and print the whole fight as one table plus the outcome."""
+    log = auto_combat_rounds(character, enemy, rounds)
+    width = max(len(character.name), len(enemy.name))
+    with buffered_output():
+        print_subheader(f"Auto-Simulated Combat (up to {rounds} rounds)")
+        print("\n".join(
+            f"Round {round_num:>3}  {name:<{width}}  " + (f"hit for {net_damage} damage" if hit else "missed")
+            for round_num, name, hit, net_damage in log
+        ))
+        print()
+        for combatant in (character, enemy):
+            print(f"{combatant.name}'s Health: {combatant.health_manager.current_health}/{combatant.health_manager.max_health}")
+        
+        if not enemy.health_manager.is_alive():
+            print_success(f"\n{enemy.name} was defeated in round {log[-1][0]}!")
+        elif not character.health_manager.is_alive():
+            print_error(f"\n{character.name} was defeated in round {log[-1][0]}!")
+
 # ============================================================================
 # Inventory Management
 # ============================================================================
@@ -3951,17 +4038,18 @@ def view_available_items(item_repository):
     # Get items sorted by name
     item_names = sorted(item_repository.items.keys())
     
-    for name in item_names:
-        item_data = item_repository.items[name]
-        print_subheader(name.title())
-        print(f"Description: {item_data['description']}")
-        
-        if item_data["stats"]:
-            print("Stats:")
-            for stat, value in item_data["stats"].items():
-                print(f"  {stat.capitalize()}: +{value}")
-        else:
-            print("Stats: None")
+    with buffered_output():
+        for name in item_names:
+            item_data = item_repository.items[name]
+            print_subheader(name.title())
+            print(f"Description: {item_data['description']}")
+            
+            if item_data["stats"]:
+                print("Stats:")
+                for stat, value in item_data["stats"].items():
+                    print(f"  {STAT_LABELS.get(stat) or stat.capitalize()}: +{value}")
+            else:
+                print("Stats: None")
     
     pause_screen()
 
@@ -3992,8 +4080,8 @@ def add_item_to_inventory(character: Character, item_repository):
         if choice == '0':
             return
         
-        # Check if choice is a number
-        try:
+        # Digits pick by number; anything else is matched by name (no ValueError round trip)
+        if choice.isdecimal():
             index = int(choice) - 1
             if 0 <= index < len(item_names):
                 item_name = item_names[index]
@@ -4001,7 +4089,7 @@ def add_item_to_inventory(character: Character, item_repository):
                 print_error("Invalid item number.")
                 pause_screen()
                 return
-        except ValueError:
+        else:
             # Assume choice is an item name
             item_name = choice.lower()
             if item_name not in item_repository.items:
@@ -4036,12 +4124,13 @@ def remove_item_from_inventory(character: Character):
         return
     
     # Display inventory items
-    print_subheader("Inventory Items")
-    for i, item in enumerate(inventory_items, 1):
-        equipped_str = " [Equipped]" if item.equipped else ""
-        print(f"{i}. {item.name.title()}{equipped_str}")
-    
-    print("\n0. Cancel")
+    with buffered_output():
+        print_subheader("Inventory Items")
+        for i, item in enumerate(inventory_items, 1):
+            equipped_str = " [Equipped]" if item.equipped else ""
+            print(f"{i}. {item.display_name}{equipped_str}")
+        
+        print("\n0. Cancel")
     
     # Get user choice
     try:
@@ -4053,8 +4142,8 @@ def remove_item_from_inventory(character: Character):
         # Get the item
         item_to_remove = None
         
-        # Check if choice is a number
-        try:
+        # Digits pick by number; anything else is matched by name (no ValueError round trip)
+        if choice.isdecimal():
             index = int(choice) - 1
             if 0 <= index < len(inventory_items):
                 item_to_remove = inventory_items[index]
@@ -4062,7 +4151,7 @@ def remove_item_from_inventory(character: Character):
                 print_error("Invalid item number.")
                 pause_screen()
                 return
-        except ValueError:
+        else:
             # Assume choice is an item name
             item_name = choice.lower()
             item_to_remove = character.inventory.get_item(item_name)
@@ -4074,7 +4163,7 @@ def remove_item_from_inventory(character: Character):
         
         # Check if item is equipped
         if item_to_remove.equipped:
-            print_warning(f"{item_to_remove.name.title()} is currently equipped.")
+            print_warning(f"{item_to_remove.display_name} is currently equipped.")
             if not confirm_action("Do you want to unequip and remove it?"):
                 return
             
@@ -4085,9 +4174,9 @@ def remove_item_from_inventory(character: Character):
         success = character.inventory.remove_item(item_to_remove.name)
         
         if success:
-            print_success(f"Removed {item_to_remove.name.title()} from inventory.")
+            print_success(f"Removed {item_to_remove.display_name} from inventory.")
         else:
-            print_error(f"Failed to remove {item_to_remove.name.title()} from inventory.")
+            print_error(f"Failed to remove {item_to_remove.display_name} from inventory.")
     
     except Exception as e:
         print_error(f"Error removing item: {str(e)}")
@@ -4100,7 +4189,7 @@ def equip_item(character: Character):
     print_header("Equip Item")
     
     # Get character's unequipped inventory items
-    unequipped_items = [item for item in character.inventory.items if not item.equipped]
+    unequipped_items = character.inventory.get_unequipped_items()
     
     if not unequipped_items:
         print_error("No unequipped items in inventory.")
@@ -4108,13 +4197,14 @@ def equip_item(character: Character):
         return
     
     # Display unequipped items
-    print_subheader("Unequipped Items")
-    for i, item in enumerate(unequipped_items, 1):
-        print(f"{i}. {item.name.title()}")
-        if item.stats:
-            print("   Stats: " + ", ".join(f"{s}: +{v}" for s, v in item.stats.items()))
-    
-    print("\n0. Cancel")
+    with buffered_output():
+        print_subheader("Unequipped Items")
+        for i, item in enumerate(unequipped_items, 1):
+            print(f"{i}. {item.display_name}")
+            if item.stats:
+                print("   Stats: " + ", ".join(f"{s}: +{v}" for s, v in item.stats.items()))
+        
+        print("\n0. Cancel")
     
     # Get user choice
     try:
@@ -4126,8 +4216,8 @@ def equip_item(character: Character):
         # Get the item
         item_to_equip = None
         
-        # Check if choice is a number
-        try:
+        # Digits pick by number; anything else is matched by name (no ValueError round trip)
+        if choice.isdecimal():
             index = int(choice) - 1
             if 0 <= index < len(unequipped_items):
                 item_to_equip = unequipped_items[index]
@@ -4135,7 +4225,7 @@ def equip_item(character: Character):
                 print_error("Invalid item number.")
                 pause_screen()
                 return
-        except ValueError:
+        else:
             # Assume choice is an item name
             item_name = choice.lower()
             item_to_equip = character.inventory.get_item(item_name)
@@ -4146,7 +4236,7 @@ def equip_item(character: Character):
                 return
             
             if item_to_equip.equipped:
-                print_error(f"{item_to_equip.name.title()} is already equipped.")
+                print_error(f"{item_to_equip.display_name} is already equipped.")
                 pause_screen()
                 return
         
@@ -4154,9 +4244,9 @@ def equip_item(character: Character):
         success = character.equip_item(item_to_equip.name)
         
         if success:
-            print_success(f"Equipped {item_to_equip.name.title()}.")
+            print_success(f"Equipped {item_to_equip.display_name}.")
         else:
-            print_error(f"Failed to equip {item_to_equip.name.title()}.")
+            print_error(f"Failed to equip {item_to_equip.display_name}.")
     
     except Exception as e:
         print_error(f"Error equipping item: {str(e)}")
@@ -4177,13 +4267,14 @@ def unequip_item(character: Character):
         return
     
     # Display equipped items
-    print_subheader("Equipped Items")
-    for i, item in enumerate(equipped_items, 1):
-        print(f"{i}. {item.name.title()}")
-        if item.stats:
-            print("   Stats: " + ", ".join(f"{s}: +{v}" for s, v in item.stats.items()))
-    
-    print("\n0. Cancel")
+    with buffered_output():
+        print_subheader("Equipped Items")
+        for i, item in enumerate(equipped_items, 1):
+            print(f"{i}. {item.display_name}")
+            if item.stats:
+                print("   Stats: " + ", ".join(f"{s}: +{v}" for s, v in item.stats.items()))
+        
+        print("\n0. Cancel")
     
     # Get user choice
     try:
@@ -4195,8 +4286,8 @@ def unequip_item(character: Character):
         # Get the item
         item_to_unequip = None
         
-        # Check if choice is a number
-        try:
+        # Digits pick by number; anything else is matched by name (no ValueError round trip)
+        if choice.isdecimal():
             index = int(choice) - 1
             if 0 <= index < len(equipped_items):
                 item_to_unequip = equipped_items[index]
@@ -4204,7 +4295,7 @@ def unequip_item(character: Character):
                 print_error("Invalid item number.")
                 pause_screen()
                 return
-        except ValueError:
+        else:
             # Assume choice is an item name
             item_name = choice.lower()
             item_to_unequip = character.inventory.get_item(item_name)
@@ -4215,7 +4306,7 @@ def unequip_item(character: Character):
                 return
             
             if not item_to_unequip.equipped:
-                print_error(f"{item_to_unequip.name.title()} is not equipped.")
+                print_error(f"{item_to_unequip.display_name} is not equipped.")
                 pause_screen()
                 return
         
@@ -4223,9 +4314,9 @@ def unequip_item(character: Character):
         success = character.unequip_item(item_to_unequip.name)
         
         if success:
-            print_success(f"Unequipped {item_to_unequip.name.title()}.")
+            print_success(f"Unequipped {item_to_unequip.display_name}.")
         else:
-            print_error(f"Failed to unequip {item_to_unequip.name.title()}.")
+            print_error(f"Failed to unequip {item_to_unequip.display_name}.")
     
     except Exception as e:
         print_error(f"Error unequipping item: {str(e)}")
@@ -4250,7 +4341,7 @@ def reset_equipment(character: Character):
         print_loading("Resetting equipment effects")
         
         # Store current stats before reset
-        old_stats = {stat: character.data_manager.get_stat(stat) for stat in STATS}
+        old_stats = character.data_manager.get_all_stats()
         
         # Reset equipment effects
         # First unequip all items
@@ -4266,14 +4357,11 @@ def reset_equipment(character: Character):
         print_success("Equipment effects reset and reapplied.")
         
         print_subheader("Stat Changes")
-        for stat in STATS:
-            old = old_stats[stat]
-            new = character.data_manager.get_stat(stat)
-            
-            if old != new:
-                diff = new - old
-                diff_str = f"+{diff}" if diff > 0 else str(diff)
-                print(f"{stat.capitalize()}: {old} → {new} ({diff_str})")
+        new_stats = character.data_manager.get_all_stats()
+        changes = [f"{stat_name}: {old_stats[stat]} → {new_stats[stat]} ({new_stats[stat] - old_stats[stat]:+d})"
+                   for stat, stat_name in zip(STATS, STATS_CAPITALIZED) if old_stats[stat] != new_stats[stat]]
+        if changes:
+            print("\n".join(changes))
     
     except Exception as e:
         print_error(f"Error resetting equipment effects: {str(e)}")
@@ -4296,62 +4384,54 @@ def manage_tier_thresholds(character: Character):
         return
     
     while True:
-        clear_screen()
-        print_header(f"Tier Threshold Management: {character.name}")
-        
-        # Display current thresholds and tier info
-        print_subheader("Current Tier Configuration")
-        print(f"Tier thresholds: {character.data_manager.tier_thresholds}")
-        
-        # Show tier summary
-        tier_summary = get_tier_summary(character.data_manager.tier_thresholds)
-        print("\nTier Breakdown:")
-        for tier, info in tier_summary.items():
-            level_range = info["level_range"]
-            if level_range[1] == 999:
-                range_str = f"{level_range[0]}+"
-            else:
-                range_str = f"{level_range[0]}-{level_range[1]}"
-            print(f"  Tier {tier}: Level {range_str} ({info['level_span']} levels)")
-        
-        # Show character's current position
-        class_level = int(character.data_manager.get_meta("Class level", "0"))
-        profession_level = int(character.data_manager.get_meta("Profession level", "0"))
-        
-        if class_level > 0 or profession_level > 0:
-            print_subheader("Character's Current Position")
-            if class_level > 0:
-                class_tier = character.data_manager.get_tier_for_level(class_level)
-                print(f"Class Level {class_level} → Tier {class_tier}")
-            if profession_level > 0:
-                prof_tier = character.data_manager.get_tier_for_level(profession_level)
-                print(f"Profession Level {profession_level} → Tier {prof_tier}")
-        
-        print_subheader("Threshold Management")
-        print("1. Add new tier threshold")
-        print("2. Remove tier threshold")
-        print("3. Set custom threshold list")
-        print("4. Reset to default thresholds")
-        print("5. Validate thresholds with character")
-        print("6. Preview threshold changes")
-        print("0. Back to main menu")
+        with redraw_frame():
+            print_header(f"Tier Threshold Management: {character.name}")
+            
+            # Display current thresholds and tier info
+            print_subheader("Current Tier Configuration")
+            print(f"Tier thresholds: {character.data_manager.tier_thresholds}")
+            
+            # Show tier summary
+            tier_summary = get_tier_summary(character.data_manager.tier_thresholds)
+            print("\nTier Breakdown:")
+            for tier, info in tier_summary.items():
+                level_range = info["level_range"]
+                if level_range[1] == 999:
+                    range_str = f"{level_range[0]}+"
+                else:
+                    range_str = f"{level_range[0]}-{level_range[1]}"
+                print(f"  Tier {tier}: Level {range_str} ({info['level_span']} levels)")
+            
+            # Show character's current position
+            class_level = character.data_manager.get_meta_int("Class level")
+            profession_level = character.data_manager.get_meta_int("Profession level")
+            
+            if class_level > 0 or profession_level > 0:
+                print_subheader("Character's Current Position")
+                if class_level > 0:
+                    class_tier = character.data_manager.get_tier_for_level(class_level)
+                    print(f"Class Level {class_level} → Tier {class_tier}")
+                if profession_level > 0:
+                    prof_tier = character.data_manager.get_tier_for_level(profession_level)
+                    print(f"Profession Level {profession_level} → Tier {prof_tier}")
+            
+            print_subheader("Threshold Management")
+            print("1. Add new tier threshold")
+            print("2. Remove tier threshold")
+            print("3. Set custom threshold list")
+            print("4. Reset to default thresholds")
+            print("5. Validate thresholds with character")
+            print("6. Preview threshold changes")
+            print("0. Back to main menu")
         
         choice = input("\nEnter your choice: ").strip()
         
         if choice == '0':
             return
-        elif choice == '1':
-            add_tier_threshold(character)
-        elif choice == '2':
-            remove_tier_threshold(character)
-        elif choice == '3':
-            set_custom_thresholds(character)
-        elif choice == '4':
-            reset_default_thresholds(character)
-        elif choice == '5':
-            validate_thresholds(character)
-        elif choice == '6':
-            preview_threshold_changes(character)
+        
+        action = _TIER_MENU_ACTIONS.get(choice)
+        if action:
+            action(character)
         else:
             print_error("Invalid choice.")
             pause_screen()
@@ -4445,7 +4525,7 @@ def set_custom_thresholds(character: Character):
             return
         
         # Parse comma-separated values
-        new_thresholds = [int(x.strip()) for x in threshold_input.split(',')]
+        new_thresholds = parse_int_list(threshold_input)
         
         # Show preview
         print_subheader("Preview")
@@ -4489,13 +4569,13 @@ def reset_default_thresholds(character: Character):
     print(f"Current: {character.data_manager.tier_thresholds}")
     print(f"Default: {DEFAULT_TIER_THRESHOLDS}")
     
-    if character.data_manager.tier_thresholds == DEFAULT_TIER_THRESHOLDS:
+    if tuple(character.data_manager.tier_thresholds) == DEFAULT_TIER_THRESHOLDS:
         print_info("Character is already using default thresholds.")
         pause_screen()
         return
     
     if confirm_action("Reset to default tier thresholds?"):
-        success, message = character.data_manager.set_tier_thresholds(DEFAULT_TIER_THRESHOLDS.copy())
+        success, message = character.data_manager.set_tier_thresholds(list(DEFAULT_TIER_THRESHOLDS))
         
         if success:
             print_success("Reset to default tier thresholds.")
@@ -4554,7 +4634,7 @@ def preview_threshold_changes(character: Character):
     print_header("Preview Tier Threshold Changes")
     
     print_info("Enter potential tier thresholds to see their impact")
-    print_info("Current thresholds: " + str(character.data_manager.tier_thresholds))
+    print_info(f"Current thresholds: {character.data_manager.tier_thresholds}")
     
     try:
         threshold_input = input("Enter thresholds to preview (comma-separated): ").strip()
@@ -4562,94 +4642,140 @@ def preview_threshold_changes(character: Character):
         if not threshold_input:
             return
         
-        preview_thresholds = [int(x.strip()) for x in threshold_input.split(',')]
-        preview_thresholds = sorted(list(set(preview_thresholds)))  # Remove duplicates and sort
-        
-        print_subheader("Threshold Comparison")
-        print(f"Current: {character.data_manager.tier_thresholds}")
-        print(f"Preview: {preview_thresholds}")
-        
-        # Show tier breakdown for both
-        print_subheader("Current Tier Structure")
-        current_summary = get_tier_summary(character.data_manager.tier_thresholds)
-        for tier, info in current_summary.items():
-            level_range = info["level_range"]
-            range_str = f"{level_range[0]}-{level_range[1]}" if level_range[1] != 999 else f"{level_range[0]}+"
-            print(f"  Tier {tier}: Level {range_str}")
-        
-        print_subheader("Preview Tier Structure")
-        preview_summary = get_tier_summary(preview_thresholds)
-        for tier, info in preview_summary.items():
-            level_range = info["level_range"]
-            range_str = f"{level_range[0]}-{level_range[1]}" if level_range[1] != 999 else f"{level_range[0]}+"
-            print(f"  Tier {tier}: Level {range_str}")
-        
-        # Show impact on character
-        class_level = int(character.data_manager.get_meta("Class level", "0"))
-        profession_level = int(character.data_manager.get_meta("Profession level", "0"))
-        
-        if class_level > 0 or profession_level > 0:
-            print_subheader("Impact on Character")
+        preview_thresholds = parse_threshold_list(threshold_input, character.data_manager.tier_thresholds)
+        # Hashable copies, so the cached tier lookups below don't convert per call
+        current_key = tuple(character.data_manager.tier_thresholds)
+        preview_key = tuple(preview_thresholds)
+        
+        current_summary = get_tier_summary(current_key)
+        preview_summary = get_tier_summary(preview_key)
+        
+        # Walk both structures in one pass, collecting each column's lines
+        current_lines = []
+        preview_lines = []
+        for current, preview in zip_longest(current_summary.items(), preview_summary.items()):
+            for entry, lines in ((current, current_lines), (preview, preview_lines)):
+                if entry is None:
+                    continue
+                tier, info = entry
+                start_level, end_level = info["level_range"]
+                range_str = f"{start_level}-{end_level}" if end_level != 999 else f"{start_level}+"
+                lines.append(f"  Tier {tier}: Level {range_str}")
+        
+        class_level = character.data_manager.get_meta_int("Class level")
+        profession_level = character.data_manager.get_meta_int("Profession level")
+        
+        with buffered_output():
+            print_subheader("Threshold Comparison")
+            print(f"Current: {character.data_manager.tier_thresholds}")
+            print(f"Preview: {preview_thresholds}")
+            
+            # Show tier breakdown for both
+            print_subheader("Current Tier Structure")
+            print("\n".join(current_lines))
             
-            if class_level > 0:
-                current_tier = get_tier_for_level(class_level, character.data_manager.tier_thresholds)
-                preview_tier = get_tier_for_level(class_level, preview_thresholds)
-                print(f"Class Level {class_level}: Tier {current_tier} → Tier {preview_tier}")
-                if current_tier != preview_tier:
-                    print_warning(f"  Class tier would change!")
+            print_subheader("Preview Tier Structure")
+            print("\n".join(preview_lines))
             
-            if profession_level > 0:
-                current_tier = get_tier_for_level(profession_level, character.data_manager.tier_thresholds)
-                preview_tier = get_tier_for_level(profession_level, preview_thresholds)
-                print(f"Profession Level {profession_level}: Tier {current_tier} → Tier {preview_tier}")
-                if current_tier != preview_tier:
-                    print_warning(f"  Profession tier would change!")
+            # Show impact on character
+            if class_level > 0 or profession_level > 0:
+                print_subheader("Impact on Character")
+                
+                for level_type, level in (("Class", class_level), ("Profession", profession_level)):
+                    if level <= 0:
+                        continue
+                    current_tier, preview_tier = get_tier_for_level(level, current_key), get_tier_for_level(level, preview_key)
+                    print(f"{level_type} Level {level}: Tier {current_tier} → Tier {preview_tier}")
+                    if current_tier != preview_tier:
+                        print_warning(f"  {level_type} tier would change!")
     
     except ValueError:
         print_error("Please enter valid integers separated by commas.")
     
     pause_screen()
 
+# Tier threshold menu choices (all take the character)
+_TIER_MENU_ACTIONS = {
+    '1': add_tier_threshold,
+    '2': remove_tier_threshold,
+    '3': set_custom_thresholds,
+    '4': reset_default_thresholds,
+    '5': validate_thresholds,
+    '6': preview_threshold_changes,
+}
+
+# Static menu bodies, joined once so each redraw prints the whole list in one call
+_MAIN_MENU_UNLOADED = "\n".join((
+    "1. Create a new character (calculated bonuses)",
+    "2. Create an advanced character (with tier history)",
+    "3. Create a custom character (manual stats, no progression)",
+    "4. Create a reverse-engineered character (base + current stats)",
+    "5. Load a character",
+    "6. Bulk level characters",
+    "0. Exit",
+))
+_MAIN_MENU_LOADED = "\n".join((
+    "1. View character details",
+    "2. View character history",
+    "3. Update character stats",
+    "4. Update character meta information",
+    "5. Level up character",
+    "6. Combat simulator",
+    "7. Inventory management",
+    "8. Save character",
+    "9. Create character sheet",
+    "10. Allocate free points",
+    "11. Add blessing",
+    "12. Validate character stats",
+    "13. Manage tier thresholds",
+    "14. Manage race history",
+    "15. Start over (unload character)",
+    "0. Exit",
+))
+
 def print_main_menu(character: Optional[Character] = None):
     """Print the main menu with familiar/monster support."""
-    clear_screen()
-    
-    if character is None:
-        print_header("Welcome to the Character Creator")
-        print("1. Create a new character (calculated bonuses)")
-        print("2. Create an advanced character (with tier history)")
-        print("3. Create a custom character (manual stats, no progression)")
-        print("4. Create a reverse-engineered character (base + current stats)")
-        print("5. Load a character")
-        print("6. Bulk level characters")
-        print("0. Exit")
-    else:
-        character_type = character.data_manager.get_meta("Character Type", "character")
-        print_header(f"{character_type.capitalize()}: {character.name}")
-        print_subheader("Character Menu")
-        print("1. View character details")
-        print("2. View character history")
-        print("3. Update character stats")
-        print("4. Update character meta information")
-        print("5. Level up character")
-        print("6. Combat simulator")
-        print("7. Inventory management")
-        print("8. Save character")
-        print("9. Create character sheet")
-        print("10. Allocate free points")
-        print("11. Add blessing")
-        print("12. Validate character stats")
-        print("13. Manage tier thresholds")
-        print("14. Manage race history")
-        print("15. Start over (unload character)")
-        print("0. Exit")
+    with redraw_frame():
+        if character is None:
+            print_header("Welcome to the Character Creator")
+            print(_MAIN_MENU_UNLOADED)
+        else:
+            character_type = character.data_manager.get_meta("Character Type", "character")
+            print_header(f"{character_type.capitalize()}: {character.name}")
+            print_subheader("Character Menu")
+            print(_MAIN_MENU_LOADED)
 
 # ============================================================================
 # Main Application
 # ============================================================================
 
+# Main menu choices that only need the item repository and return the new character
+_CREATE_ACTIONS = {
+    '1': create_character,
+    '2': create_advanced_character,
+    '3': create_manual_character,
+    '4': create_reverse_engineered_character,
+}
+
+# Loaded-character menu choices that only need the character
+_CHARACTER_ACTIONS = {
+    '1': view_character,
+    '2': view_character_history,
+    '3': update_stats,
+    '4': update_meta,
+    '5': level_up_character,
+    '9': create_character_sheet,
+    '10': allocate_points,
+    '11': add_blessing,
+    '12': validate_character_stats,
+    '13': manage_tier_thresholds,
+    '14': manage_race_history,
+}
+
 def main():
     """Main application entry point with familiar/monster support."""
+    enable_output_buffering()
+    
     # Initialize item repository
     try:
         item_repository = ItemRepository(items)
@@ -4666,15 +4792,10 @@ def main():
         choice = input("\nEnter your choice: ").strip()
         
         if character is None:
-            # Character creation menu
-            if choice == '1':
-                character = create_character(item_repository)
-            elif choice == '2':
-                character = create_advanced_character(item_repository)
-            elif choice == '3':
-                character = create_manual_character(item_repository)
-            elif choice == '4':
-                character = create_reverse_engineered_character(item_repository)
+            # Character creation menu (one dict lookup; the rest need other arguments)
+            create = _CREATE_ACTIONS.get(choice)
+            if create:
+                character = create(item_repository)
             elif choice == '5':
                 character, save_file = load_character(item_repository)
             elif choice == '6':
@@ -4686,35 +4807,16 @@ def main():
                 print_error("Invalid choice.")
                 pause_screen()
         else:
-            # Character loaded menu
-            if choice == '1':
-                view_character(character)
-            elif choice == '2':
-                view_character_history(character)
-            elif choice == '3':
-                update_stats(character)
-            elif choice == '4':
-                update_meta(character)
-            elif choice == '5':
-                level_up_character(character)
+            # Character loaded menu (one dict lookup; the rest need other arguments)
+            action = _CHARACTER_ACTIONS.get(choice)
+            if action:
+                action(character)
             elif choice == '6':
                 simulate_combat(character, item_repository)
             elif choice == '7':
                 manage_inventory(character, item_repository)
             elif choice == '8':
                 save_character(character, save_file)
-            elif choice == '9':
-                create_character_sheet(character)
-            elif choice == '10':
-                allocate_points(character)
-            elif choice == '11':
-                add_blessing(character)
-            elif choice == '12':
-                validate_character_stats(character)
-            elif choice == '13':
-                manage_tier_thresholds(character)
-            elif choice == '14':
-                manage_race_history(character)
             elif choice == '15':
                 if confirm_action("Are you sure you want to unload the current character?"):
                     character = None
@@ -3,8 +3,9 @@ Multi-tier game data structure with character-specific thresholds
 Pure data repository - no functions
 """
 
-# Default tier thresholds for new characters (can be customized per character)
-DEFAULT_TIER_THRESHOLDS = [25, 100, 200]
+# Default tier thresholds for new characters (can be customized per character).
+# Immutable so it can be shared without copying; take list(...) before mutating.
+DEFAULT_TIER_THRESHOLDS = (25, 100, 200)
 
 # Organize class gains by tier
 class_gains = {
@@ -757,4 +758,7 @@ races = {
             }
         ]
     },
-}
\ No newline at end of file
+}
+
+# Case-insensitive race name lookup: lowercased name -> key in races
+RACE_BY_LOWER = {race.lower(): race for race in races}
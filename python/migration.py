@@ -19,12 +19,12 @@ import csv
 import os
 import json
 from typing import Dict, List, Optional, Any, Tuple
-from Character_Creator import Character, ItemRepository, STATS, META_INFO, StatValidator
+from Character_Creator import Character, ItemRepository, STATS, STATS_CAPITALIZED, META_INFO, StatValidator
 from tier_utils import (
     get_tier_for_level, get_available_classes_for_tier, get_available_professions_for_tier,
     validate_class_tier_combination, validate_profession_tier_combination
 )
-from game_data import DEFAULT_TIER_THRESHOLDS, races
+from game_data import DEFAULT_TIER_THRESHOLDS, RACE_BY_LOWER, races
 from Item_Repo import items
 
 def clear_screen():
@@ -357,6 +357,7 @@ def create_detailed_race_history(current_race: str, race_level: int) -> List[Dic
     for i, race in enumerate(available_races, 1):
         print(f"  {i}. {race}")
     
+    exceeds_max_error = f"End level cannot exceed {race_level}."
     race_level_start = 1
     while race_level_start <= race_level:
         print(f"\nRace from race level {race_level_start} to level ?")
@@ -368,16 +369,17 @@ def create_detailed_race_history(current_race: str, race_level: int) -> List[Dic
             # Try to parse as number first
             try:
                 race_num = int(choice)
-                if 1 <= race_num <= len(available_races):
-                    period_race = available_races[race_num - 1]
-                    break
-                else:
-                    print_error(f"Please enter a number between 1 and {len(available_races)}")
-                    continue
+                if race_num < 1:
+                    raise IndexError  # 0 and negatives would otherwise index from the end
+                period_race = available_races[race_num - 1]
+                break
+            except IndexError:
+                print_error(f"Please enter a number between 1 and {len(available_races)}")
+                continue
             except ValueError:
                 # Try to match by name
-                period_race = choice.lower()
-                if period_race in available_races:
+                period_race = RACE_BY_LOWER.get(choice.lower())
+                if period_race is not None:
                     break
                 else:
                     print_error(f"Invalid race: {choice}")
@@ -385,16 +387,17 @@ def create_detailed_race_history(current_race: str, race_level: int) -> List[Dic
         
         # Get end level for this race (if not the last period)
         if race_level_start < race_level:
+            end_prompt = f"Race {period_race} ends at race level (max {race_level}): "
             while True:
                 try:
-                    end_input = input(f"Race {period_race} ends at race level (max {race_level}): ").strip()
+                    end_input = input(end_prompt).strip()
                     race_level_end = int(end_input)
                     
                     if race_level_end < race_level_start:
                         print_error("End level must be >= start level.")
                         continue
                     elif race_level_end > race_level:
-                        print_error(f"End level cannot exceed {race_level}.")
+                        print_error(exceeds_max_error)
                         continue
                     
                     break
@@ -541,6 +544,34 @@ def create_detailed_profession_history(current_profession: str, profession_level
     
     return profession_history
 
+def _fmt_parts(base: int, pairs: Tuple[Tuple[str, int], ...]) -> str:
+    """Format 'Base: b + Label: +n + ...' for the positive (label, value) pairs."""
+    return f"Base: {base}" + "".join(f" + {label}: +{value}" for label, value in pairs if value > 0)
+
+# (allocation key, label) pairs shown in the stat allocation breakdowns
+_RACE_LEVELING_FIELDS = (("race_bonus", "Race"), ("item_bonus", "Items"),
+                         ("blessing_bonus", "Blessing"), ("free_points_allocated", "Free Points"))
+_CLASS_FIELDS = (("class_bonus", "Class"), ("profession_bonus", "Profession"),
+                 ("race_bonus", "Race"), ("free_points_allocated", "Free Points"))
+
+def _print_stat_block(allocations: Dict[str, Dict], field_labels: Tuple[Tuple[str, str], ...],
+                      excess_label: str, excess_word: str):
+    """Print each allocated stat's breakdown over field_labels, flagging impossible or excess points."""
+    for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
+        if stat not in allocations:
+            continue
+        stat_analysis = allocations[stat]
+        get = stat_analysis.get
+        breakdown = _fmt_parts(get("base", 0), tuple((label, get(key, 0)) for key, label in field_labels))
+        print(f"{stat_name}: {breakdown} = {get('current', 0)}")
+        
+        # Show issues
+        discrepancy = get("discrepancy", 0)
+        if discrepancy < 0:
+            print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
+        elif discrepancy > 0:
+            print_warning(f"  ⚠ {excess_label}: {stat} has {discrepancy} {excess_word} points")
+
 def show_detailed_validation(character, validation_result):
     """
     Enhanced detailed validation display that handles all character types.
@@ -569,8 +600,8 @@ def show_detailed_validation(character, validation_result):
         print()
         
         # Show any class/profession level issues
-        class_level = int(character.data_manager.get_meta("Class level", "0"))
-        profession_level = int(character.data_manager.get_meta("Profession level", "0"))
+        class_level = character.data_manager.get_meta_int("Class level")
+        profession_level = character.data_manager.get_meta_int("Profession level")
         
         if class_level > 0:
             print_error(f"⚠ INVALID: {char_type.capitalize()}s should not have class levels (found: {class_level})")
@@ -596,36 +627,7 @@ def show_detailed_validation(character, validation_result):
             print_colored("Detailed Stat Allocation Analysis:", 'cyan', True)
             analysis = validation_result["details"]
             
-            for stat in STATS:
-                if stat in analysis["stat_allocations"]:
-                    stat_analysis = analysis["stat_allocations"][stat]
-                    base = stat_analysis.get("base", 0)
-                    race_bonus = stat_analysis.get("race_bonus", 0)
-                    item_bonus = stat_analysis.get("item_bonus", 0)
-                    blessing_bonus = stat_analysis.get("blessing_bonus", 0)
-                    free_points_used = stat_analysis.get("free_points_allocated", 0)
-                    current = stat_analysis.get("current", 0)
-                    discrepancy = stat_analysis.get("discrepancy", 0)
-                    
-                    # Build breakdown string for race-leveling characters
-                    parts = [f"Base: {base}"]
-                    if race_bonus > 0:
-                        parts.append(f"Race: +{race_bonus}")
-                    if item_bonus > 0:
-                        parts.append(f"Items: +{item_bonus}")
-                    if blessing_bonus > 0:
-                        parts.append(f"Blessing: +{blessing_bonus}")
-                    if free_points_used > 0:
-                        parts.append(f"Free Points: +{free_points_used}")
-                    
-                    breakdown = " + ".join(parts)
-                    print(f"{stat.capitalize()}: {breakdown} = {current}")
-                    
-                    # Show issues
-                    if discrepancy < 0:
-                        print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
-                    elif discrepancy > 0:
-                        print_warning(f"  ⚠ EXTRA: {stat} has {discrepancy} unexplained points")
+            _print_stat_block(analysis["stat_allocations"], _RACE_LEVELING_FIELDS, "EXTRA", "unexplained")
         
         # Show free points info for race-leveling characters
         fp_info = validation_result.get("free_points", {})
@@ -650,7 +652,7 @@ def show_detailed_validation(character, validation_result):
         # Show current stat sources for race-leveling characters
         print()
         print_colored("Current Stat Sources:", 'cyan', True)
-        for stat in STATS:
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
             sources = character.data_manager.get_stat_sources(stat)
             current = character.data_manager.get_stat(stat)
             
@@ -662,9 +664,9 @@ def show_detailed_validation(character, validation_result):
             
             if source_parts:
                 source_str = " (" + " + ".join(source_parts) + ")"
-                print(f"{stat.capitalize()}: {current}{source_str}")
+                print(f"{stat_name}: {current}{source_str}")
             else:
-                print(f"{stat.capitalize()}: {current}")
+                print(f"{stat_name}: {current}")
     
     # Handle regular characters (calculated, manual, reverse_engineered) - ORIGINAL DETAILED LOGIC
     else:
@@ -673,36 +675,7 @@ def show_detailed_validation(character, validation_result):
             print_colored("Detailed Stat Allocation Analysis:", 'cyan', True)
             analysis = validation_result["details"]
             
-            for stat in STATS:
-                if stat in analysis["stat_allocations"]:
-                    stat_analysis = analysis["stat_allocations"][stat]
-                    base = stat_analysis.get("base", 0)
-                    class_bonus = stat_analysis.get("class_bonus", 0)
-                    profession_bonus = stat_analysis.get("profession_bonus", 0)
-                    race_bonus = stat_analysis.get("race_bonus", 0)
-                    free_points_used = stat_analysis.get("free_points_allocated", 0)
-                    current = stat_analysis.get("current", 0)
-                    discrepancy = stat_analysis.get("discrepancy", 0)
-                    
-                    # Build breakdown string
-                    parts = [f"Base: {base}"]
-                    if class_bonus > 0:
-                        parts.append(f"Class: +{class_bonus}")
-                    if profession_bonus > 0:
-                        parts.append(f"Profession: +{profession_bonus}")
-                    if race_bonus > 0:
-                        parts.append(f"Race: +{race_bonus}")
-                    if free_points_used > 0:
-                        parts.append(f"Free Points: +{free_points_used}")
-                    
-                    breakdown = " + ".join(parts)
-                    print(f"{stat.capitalize()}: {breakdown} = {current}")
-                    
-                    # Show issues
-                    if discrepancy < 0:
-                        print_error(f"  ⚠ IMPOSSIBLE: {stat} needs {abs(discrepancy)} more points than available!")
-                    elif discrepancy > 0:
-                        print_warning(f"  ⚠ UNUSED: {stat} has {discrepancy} excess points")
+            _print_stat_block(analysis["stat_allocations"], _CLASS_FIELDS, "UNUSED", "excess")
         
         # ORIGINAL: Show free points summary
         print()
@@ -729,7 +702,7 @@ def show_detailed_validation(character, validation_result):
         # ORIGINAL: Show current stat sources
         print()
         print_colored("Current Stat Sources:", 'cyan', True)
-        for stat in STATS:
+        for stat, stat_name in zip(STATS, STATS_CAPITALIZED):
             sources = character.data_manager.get_stat_sources(stat)
             current = character.data_manager.get_stat(stat)
             
@@ -741,9 +714,9 @@ def show_detailed_validation(character, validation_result):
             
             if source_parts:
                 source_str = " (" + " + ".join(source_parts) + ")"
-                print(f"{stat.capitalize()}: {current}{source_str}")
+                print(f"{stat_name}: {current}{source_str}")
             else:
-                print(f"{stat.capitalize()}: {current}")
+                print(f"{stat_name}: {current}")
     
     print()
     input("Press Enter to continue...")
@@ -1072,7 +1045,7 @@ def migrate_characters_csv(input_file: str, output_file: str = None):
     print(f"Default tier thresholds: {DEFAULT_TIER_THRESHOLDS}")
     
     if confirm_action("Use default tier thresholds for all characters?"):
-        tier_thresholds = DEFAULT_TIER_THRESHOLDS.copy()
+        tier_thresholds = list(DEFAULT_TIER_THRESHOLDS)
     else:
         while True:
             try:
@@ -2,11 +2,20 @@
 Tier utility functions for character progression system.
 Pure utility functions that operate on game data without side effects.
 """
-from typing import List, Optional, Dict, Tuple
+from functools import lru_cache
+from typing import List, Optional, Dict, Sequence, Tuple
 from game_data import class_gains, profession_gains
 
-def get_tier_for_level(level: int, tier_thresholds: List[int]) -> int:
-    """Get the tier number for a given level using character's thresholds"""
+# class_gains / profession_gains are static configuration, so the lookups below
+# are memoized. Cached results are returned as tuples so callers can't mutate them.
+
+def get_tier_for_level(level: int, tier_thresholds: Sequence[int]) -> int:
+    """Get the tier number for a given level using character's thresholds (pass a tuple to skip the per-call copy)"""
+    return _tier_for_level(level, tuple(tier_thresholds))
+
+@lru_cache(maxsize=None)
+def _tier_for_level(level: int, tier_thresholds: Tuple[int, ...]) -> int:
+    """Cached implementation of get_tier_for_level keyed by a hashable threshold tuple"""
     if level < 1:
         return 0
     
@@ -18,13 +27,15 @@ def get_tier_for_level(level: int, tier_thresholds: List[int]) -> int:
             break
     return tier
 
-def get_available_classes_for_tier(tier: int) -> List[str]:
+@lru_cache(maxsize=None)
+def get_available_classes_for_tier(tier: int) -> Tuple[str, ...]:
     """Get all available classes for a specific tier"""
-    return list(class_gains.get(tier, {}).keys())
+    return tuple(class_gains.get(tier, {}).keys())
 
-def get_available_professions_for_tier(tier: int) -> List[str]:
+@lru_cache(maxsize=None)
+def get_available_professions_for_tier(tier: int) -> Tuple[str, ...]:
     """Get all available professions for a specific tier"""
-    return list(profession_gains.get(tier, {}).keys())
+    return tuple(profession_gains.get(tier, {}).keys())
 
 def get_class_gains(class_name: str, tier: int) -> Dict[str, int]:
     """Get stat gains for a specific class and tier"""
@@ -107,18 +118,25 @@ def suggest_tier_thresholds(max_level: int, num_tiers: int = 3) -> List[int]:
     
     return thresholds
 
-def get_tier_summary(tier_thresholds: List[int]) -> Dict[int, Dict[str, any]]:
-    """Get a summary of what each tier covers"""
+def get_tier_summary(tier_thresholds: Sequence[int]) -> Dict[int, Dict[str, any]]:
+    """Get a summary of what each tier covers (pass a tuple to skip the per-call copy)"""
     summary = {}
-    max_tier = len(tier_thresholds) + 1
-    
-    for tier in range(1, max_tier + 1):
-        level_range = get_tier_range(tier, tier_thresholds)
+    for tier, level_range, level_span in _tier_summary_rows(tuple(tier_thresholds)):
         summary[tier] = {
             "level_range": level_range,
             "available_classes": get_available_classes_for_tier(tier),
             "available_professions": get_available_professions_for_tier(tier),
-            "level_span": level_range[1] - level_range[0] + 1 if level_range[1] != 999 else "unlimited"
+            "level_span": level_span
         }
     
-    return summary
\ No newline at end of file
+    return summary
+
+@lru_cache(maxsize=64)
+def _tier_summary_rows(tier_thresholds: Tuple[int, ...]) -> Tuple[Tuple[int, Tuple[int, int], object], ...]:
+    """Cached (tier, level range, level span) rows behind get_tier_summary, keyed by the threshold tuple"""
+    rows = []
+    for tier in range(1, len(tier_thresholds) + 2):
+        level_range = get_tier_range(tier, tier_thresholds)
+        level_span = level_range[1] - level_range[0] + 1 if level_range[1] != 999 else "unlimited"
+        rows.append((tier, level_range, level_span))
+    return tuple(rows)
\ No newline at end of file